@@ -0,0 +1,75 @@
+"""Benchmark import time and memory of Supervisor modules in a fresh interpreter."""
+
+import argparse
+import resource
+import subprocess
+import sys
+
+# Third party packages not needed to import Supervisor. jinja2 and git are
+# still loaded during setup, by the DNS plugin and the store.
+COLD_PACKAGES = ("cryptography", "git", "jinja2", "securetar")
+
+
+def run_import(module: str) -> tuple[dict[str, int], set[str], int]:
+    """Import module in a new interpreter.
+
+    Return self import time in microseconds summed per top level package,
+    the loaded packages and the max RSS of the interpreter in KiB.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {module}, sys; print(*sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # Largest of all children so far, all runs import the same
+    max_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        package = name.strip().split(".")[0]
+        timings[package] = timings.get(package, 0) + int(self_time)
+
+    loaded = {name.split(".")[0] for name in result.stdout.split()}
+    return timings, loaded, max_rss
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("module", nargs="?", default="supervisor.bootstrap")
+    parser.add_argument("-n", "--number", type=int, default=5)
+    parser.add_argument("-t", "--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # Keep fastest run of each package, others are disturbed by the system
+    timings: dict[str, int] = {}
+    for _ in range(args.number):
+        run, loaded, max_rss = run_import(args.module)
+        for package, self_time in run.items():
+            timings[package] = min(timings.get(package, self_time), self_time)
+
+    total = sum(timings.values())
+    summary = f"{total / 1000:.1f}ms, max RSS {max_rss / 1024:.1f}MiB"
+    print(f"import {args.module}: {summary}")  # noqa: T201
+    for package, self_time in sorted(
+        timings.items(), key=lambda item: item[1], reverse=True
+    )[: args.top]:
+        print(f"{package:>24}: {self_time / 1000:8.1f}ms")  # noqa: T201
+
+    for package in COLD_PACKAGES:
+        state = "loaded" if package in loaded else "not loaded"
+        print(f"{package:>24}: {state}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,6 @@ from typing import Any, Final
 import aiohttp
 from awesomeversion import AwesomeVersionCompareException
 from deepmerge import Merger
-from securetar import atomic_contents_add, secure_path
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
@@ -748,6 +747,7 @@ class Addon(AddonModel):
 
         # Add to addon manager
         self.sys_addons.local[self.slug] = self
+        self.sys_addons.update_token_index()
 
         # Reload ingress tokens
         if self.with_ingress:
@@ -808,6 +808,7 @@ class Addon(AddonModel):
         # Remove from addon manager
         self.sys_addons.data.uninstall(self)
         self.sys_addons.local.pop(self.slug)
+        self.sys_addons.update_token_index()
 
     @Job(
         name="addon_update",
@@ -1005,6 +1006,7 @@ class Addon(AddonModel):
         # Access Token
         self.persist[ATTR_ACCESS_TOKEN] = secrets.token_hex(56)
         self.save_persist()
+        self.sys_addons.update_token_index()
 
         # Options
         await self.write_options()
@@ -1210,6 +1212,9 @@ class Addon(AddonModel):
             # write into tarfile
             def _write_tarfile():
                 """Write tar inside loop."""
+                # pylint: disable=import-outside-toplevel
+                from securetar import atomic_contents_add
+
                 with tar_file as backup:
                     # Backup metadata
                     backup.add(temp, arcname=".")
@@ -1262,6 +1267,9 @@ class Addon(AddonModel):
             # extract backup
             def _extract_tarfile():
                 """Extract tar backup."""
+                # pylint: disable=import-outside-toplevel
+                from securetar import secure_path
+
                 with tar_file as backup:
                     backup.extractall(
                         path=Path(temp),
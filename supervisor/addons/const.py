@@ -28,6 +28,7 @@ class MappingType(StrEnum):
 
 
 ATTR_BACKUP = "backup"
+ATTR_BOOT_AFTER = "boot_after"
 ATTR_BREAKING_VERSIONS = "breaking_versions"
 ATTR_CODENOTARY = "codenotary"
 ATTR_READ_ONLY = "read_only"
@@ -37,6 +38,12 @@ WATCHDOG_MAX_ATTEMPTS = 5
 WATCHDOG_THROTTLE_PERIOD = timedelta(minutes=30)
 WATCHDOG_THROTTLE_MAX_CALLS = 10
 
+# Add-ons of a startup stage whose containers are started at the same time
+ADDON_BOOT_CONCURRENCY = 4
+
+# Unknown tokens rebuild the token index at most this often
+TOKEN_INDEX_REBUILD_INTERVAL = timedelta(seconds=5)
+
 ADDON_UPDATE_CONDITIONS = [
     JobCondition.FREE_SPACE,
     JobCondition.HEALTHY,
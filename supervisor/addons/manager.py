@@ -3,8 +3,10 @@
 import asyncio
 from collections.abc import Awaitable
 from contextlib import suppress
+from datetime import datetime
 import logging
 import tarfile
+import time
 from typing import Union
 
 from ..const import AddonBoot, AddonStartup, AddonState
@@ -25,9 +27,14 @@ from ..jobs.decorator import Job, JobCondition
 from ..resolution.const import ContextType, IssueType, SuggestionType
 from ..store.addon import AddonStore
 from ..utils import check_exception_chain
+from ..utils.dt import utcnow
 from ..utils.sentry import capture_exception
 from .addon import Addon
-from .const import ADDON_UPDATE_CONDITIONS
+from .const import (
+    ADDON_BOOT_CONCURRENCY,
+    ADDON_UPDATE_CONDITIONS,
+    TOKEN_INDEX_REBUILD_INTERVAL,
+)
 from .data import AddonsData
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -44,6 +51,8 @@ class AddonManager(CoreSysAttributes):
         self.data: AddonsData = AddonsData(coresys)
         self.local: dict[str, Addon] = {}
         self.store: dict[str, AddonStore] = {}
+        self._tokens: dict[str, str] = {}
+        self._tokens_rebuilt: datetime | None = None
 
     @property
     def all(self) -> list[AnyAddon]:
@@ -71,11 +80,41 @@ class AddonManager(CoreSysAttributes):
 
     def from_token(self, token: str) -> Addon | None:
         """Return an add-on from Supervisor token."""
-        for addon in self.installed:
-            if token == addon.supervisor_token:
-                return addon
+        if not token:
+            return None
+
+        if addon := self._get_indexed_token(token):
+            return addon
+
+        # Index is updated on install, uninstall, restore and token rotation.
+        # Tokens written elsewhere are picked up on a miss, but unknown tokens
+        # must not cost a pass over all add-ons on every request.
+        now = utcnow()
+        if (
+            self._tokens_rebuilt
+            and now - self._tokens_rebuilt < TOKEN_INDEX_REBUILD_INTERVAL
+        ):
+            return None
+        self._tokens_rebuilt = now
+        self.update_token_index()
+        return self._get_indexed_token(token)
+
+    def _get_indexed_token(self, token: str) -> Addon | None:
+        """Return add-on for token from index if it still owns it."""
+        if (slug := self._tokens.get(token)) is None:
+            return None
+        if (addon := self.local.get(slug)) and addon.supervisor_token == token:
+            return addon
         return None
 
+    def update_token_index(self) -> None:
+        """Rebuild index of Supervisor tokens to installed add-ons."""
+        self._tokens = {
+            addon.supervisor_token: addon.slug
+            for addon in self.local.values()
+            if addon.supervisor_token
+        }
+
     async def load(self) -> None:
         """Start up add-on management."""
         # Refresh cache for all store addons
@@ -95,48 +134,155 @@ class AddonManager(CoreSysAttributes):
         _LOGGER.info("Found %d installed add-ons", len(self.data.system))
         if tasks:
             await asyncio.gather(*tasks)
+        self.update_token_index()
 
         # Sync DNS
         await self.sync_dns()
 
+    def _resolve_boot_after(self, addon: Addon) -> set[str]:
+        """Return slugs of installed add-ons listed in boot_after of add-on.
+
+        Entries are slugs of add-ons in the same repository or full slugs.
+        """
+        resolved: set[str] = set()
+        for entry in addon.boot_after:
+            if (slug := f"{addon.repository}_{entry}") in self.local:
+                resolved.add(slug)
+            elif entry in self.local:
+                resolved.add(entry)
+            else:
+                _LOGGER.warning(
+                    "Add-on %s waits on boot for unknown add-on %s",
+                    addon.slug,
+                    entry,
+                )
+        resolved.discard(addon.slug)
+        return resolved
+
+    def _boot_dependencies(self, addons: dict[str, Addon]) -> dict[str, set[str]]:
+        """Return add-ons each add-on waits for on boot.
+
+        Only add-ons booting in the same stage are waited for. Circular
+        dependencies are dropped, those add-ons start without order.
+        """
+        depends = {
+            slug: self._resolve_boot_after(addon) & addons.keys()
+            for slug, addon in addons.items()
+        }
+
+        # Remove add-ons in dependency order, left over ones are in a cycle
+        # or wait for one
+        pending = {slug: set(deps) for slug, deps in depends.items()}
+        while ready := [slug for slug, deps in pending.items() if not deps]:
+            for slug in ready:
+                del pending[slug]
+            for deps in pending.values():
+                deps.difference_update(ready)
+
+        if not pending:
+            return depends
+
+        def _reaches(start: str, target: str) -> bool:
+            seen: set[str] = set()
+            stack = [start]
+            while stack:
+                if (slug := stack.pop()) == target:
+                    return True
+                if slug not in seen:
+                    seen.add(slug)
+                    stack.extend(pending[slug])
+            return False
+
+        # Drop only edges within a cycle, add-ons waiting for one keep waiting
+        cycles = [
+            (slug, dep)
+            for slug, deps in pending.items()
+            for dep in deps
+            if _reaches(dep, slug)
+        ]
+        _LOGGER.warning(
+            "Add-ons %s have circular boot dependencies, starting them without order",
+            ", ".join(sorted({slug for slug, _ in cycles})),
+        )
+        for slug, dep in cycles:
+            depends[slug].discard(dep)
+        return depends
+
+    async def _boot_addon(self, addon: Addon) -> asyncio.Task | None:
+        """Start add-on on boot, returns task waiting for its startup."""
+        try:
+            return await addon.start()
+        except AddonsError as err:
+            # Check if there is an system/user issue
+            if check_exception_chain(
+                err, (DockerAPIError, DockerNotFound, AddonConfigurationError)
+            ):
+                addon.boot = AddonBoot.MANUAL
+                addon.save_persist()
+        except HassioError:
+            pass  # These are already handled
+
+        _LOGGER.warning("Can't start Add-on %s", addon.slug)
+        return None
+
     async def boot(self, stage: AddonStartup) -> None:
-        """Boot add-ons with mode auto."""
-        tasks: list[Addon] = []
-        for addon in self.installed:
-            if addon.boot != AddonBoot.AUTO or addon.startup != stage:
-                continue
-            tasks.append(addon)
+        """Boot add-ons with mode auto.
+
+        Add-ons start concurrently up to a limit. Add-ons listing others of
+        the same stage in boot_after are started once those have started.
+        """
+        addons: dict[str, Addon] = {
+            addon.slug: addon
+            for addon in self.installed
+            if addon.boot == AddonBoot.AUTO and addon.startup == stage
+        }
 
         # Evaluate add-ons which need to be started
-        _LOGGER.info("Phase '%s' starting %d add-ons", stage, len(tasks))
-        if not tasks:
+        _LOGGER.info("Phase '%s' starting %d add-ons", stage, len(addons))
+        if not addons:
             return
 
-        # Start Add-ons sequential
-        # avoid issue on slow IO
-        # Config.wait_boot is deprecated. Until addons update with healthchecks,
-        # add a sleep task for it to keep the same minimum amount of wait time
-        wait_boot: list[Awaitable[None]] = [asyncio.sleep(self.sys_config.wait_boot)]
-        for addon in tasks:
-            try:
-                if start_task := await addon.start():
-                    wait_boot.append(start_task)
-            except AddonsError as err:
-                # Check if there is an system/user issue
-                if check_exception_chain(
-                    err, (DockerAPIError, DockerNotFound, AddonConfigurationError)
-                ):
-                    addon.boot = AddonBoot.MANUAL
-                    addon.save_persist()
-            except HassioError:
-                pass  # These are already handled
-            else:
-                continue
+        depends = self._boot_dependencies(addons)
+        # Limit concurrent container starts, avoid issue on slow IO
+        start_limit = asyncio.Semaphore(ADDON_BOOT_CONCURRENCY)
+        boot_tasks: dict[str, asyncio.Task] = {}
+
+        async def _boot(addon: Addon) -> None:
+            if deps := depends[addon.slug]:
+                await asyncio.wait([boot_tasks[slug] for slug in deps])
+                for slug in deps:
+                    if addons[slug].state != AddonState.STARTED:
+                        _LOGGER.warning(
+                            "Add-on %s did not start, starting %s anyway",
+                            slug,
+                            addon.slug,
+                        )
+
+            begin = time.monotonic()
+            async with start_limit:
+                start_task = await self._boot_addon(addon)
+            if not start_task:
+                return
+
+            # Errors waiting for startup are handled by the add-on
+            await asyncio.wait([start_task])
+            _LOGGER.info(
+                "Add-on %s is %s after %.1f seconds",
+                addon.slug,
+                addon.state,
+                time.monotonic() - begin,
+            )
 
-            _LOGGER.warning("Can't start Add-on %s", addon.slug)
+        for addon in addons.values():
+            boot_tasks[addon.slug] = self.sys_create_task(_boot(addon))
 
-        # Ignore exceptions from waiting for addon startup, addon errors handled elsewhere
-        await asyncio.gather(*wait_boot, return_exceptions=True)
+        # Config.wait_boot is deprecated. Until addons update with healthchecks,
+        # add a sleep task for it to keep the same minimum amount of wait time
+        await asyncio.gather(
+            asyncio.sleep(self.sys_config.wait_boot),
+            *boot_tasks.values(),
+            return_exceptions=True,
+        )
 
     async def shutdown(self, stage: AddonStartup) -> None:
         """Shutdown addons."""
@@ -305,6 +451,7 @@ class AddonManager(CoreSysAttributes):
         if slug not in self.local:
             _LOGGER.info("Detect new Add-on after restore %s", slug)
             self.local[slug] = addon
+        self.update_token_index()
 
         # Update ingress
         if had_ingress != addon.ingress_panel:
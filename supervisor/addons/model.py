@@ -94,6 +94,7 @@ from ..utils import version_is_new_enough
 from .configuration import FolderMapping
 from .const import (
     ATTR_BACKUP,
+    ATTR_BOOT_AFTER,
     ATTR_BREAKING_VERSIONS,
     ATTR_CODENOTARY,
     ATTR_PATH,
@@ -639,6 +640,11 @@ class AddonModel(JobGroup, ABC):
         """Return breaking versions of addon."""
         return self.data[ATTR_BREAKING_VERSIONS]
 
+    @property
+    def boot_after(self) -> list[str]:
+        """Return slugs of add-ons which must be started before this one on boot."""
+        return self.data[ATTR_BOOT_AFTER]
+
     def refresh_path_cache(self) -> Awaitable[None]:
         """Refresh cache of existing paths."""
 
@@ -111,6 +111,7 @@ from ..validate import (
 )
 from .const import (
     ATTR_BACKUP,
+    ATTR_BOOT_AFTER,
     ATTR_BREAKING_VERSIONS,
     ATTR_CODENOTARY,
     ATTR_PATH,
@@ -409,6 +410,9 @@ _SCHEMA_ADDON_CONFIG = vol.Schema(
         ),
         vol.Optional(ATTR_JOURNALD, default=False): vol.Boolean(),
         vol.Optional(ATTR_BREAKING_VERSIONS, default=list): [version_tag],
+        vol.Optional(ATTR_BOOT_AFTER, default=list): vol.All(
+            [vol.Match(RE_SLUG_FIELD)], vol.Unique()
+        ),
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -15,9 +15,11 @@ from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import APIAddonNotInstalled, HostNotSupportedError
 from ..utils.sentry import capture_exception
 from .addons import APIAddons
+from .assets import AssetCache
 from .audio import APIAudio
 from .auth import APIAuth
 from .backups import APIBackups
+from .cache import APIResponseCache
 from .cli import APICli
 from .const import CONTENT_TYPE_TEXT
 from .discovery import APIDiscovery
@@ -57,6 +59,8 @@ class RestAPI(CoreSysAttributes):
         """Initialize Docker base wrapper."""
         self.coresys: CoreSys = coresys
         self.security: SecurityMiddleware = SecurityMiddleware(coresys)
+        self.response_cache: APIResponseCache = APIResponseCache(coresys)
+        self.asset_cache: AssetCache = AssetCache(coresys)
         self.webapp: web.Application = web.Application(
             client_max_size=MAX_CLIENT_SIZE,
             middlewares=[
@@ -64,6 +68,7 @@ class RestAPI(CoreSysAttributes):
                 self.security.system_validation,
                 self.security.token_validation,
                 self.security.core_proxy,
+                self.response_cache.invalidate_on_change,
             ],
             handler_args={
                 "max_line_size": MAX_LINE_SIZE,
@@ -83,6 +88,7 @@ class RestAPI(CoreSysAttributes):
         """Register REST API Calls."""
         self._api_host = APIHost()
         self._api_host.coresys = self.coresys
+        await self.response_cache.load()
 
         self._register_addons()
         self._register_audio()
@@ -153,12 +159,15 @@ class RestAPI(CoreSysAttributes):
         self.webapp.add_routes(
             [
                 web.get("/host/info", api_host.info),
+                web.get("/host/disk/metrics", api_host.disk_metrics),
+                web.get("/host/disk/usage", api_host.disk_usage),
                 web.get("/host/logs", api_host.advanced_logs),
                 web.get(
                     "/host/logs/follow",
                     partial(api_host.advanced_logs, follow=True),
                 ),
                 web.get("/host/logs/identifiers", api_host.list_identifiers),
+                web.get("/host/logs/aggregate", api_host.aggregate_logs),
                 web.get("/host/logs/identifiers/{identifier}", api_host.advanced_logs),
                 web.get(
                     "/host/logs/identifiers/{identifier}/follow",
@@ -590,6 +599,7 @@ class RestAPI(CoreSysAttributes):
                 web.get("/backups/info", api_backups.info),
                 web.post("/backups/options", api_backups.options),
                 web.post("/backups/reload", api_backups.reload),
+                web.post("/backups/benchmark", api_backups.benchmark),
                 web.post("/backups/freeze", api_backups.freeze),
                 web.post("/backups/thaw", api_backups.thaw),
                 web.post("/backups/new/full", api_backups.backup_full),
@@ -687,6 +697,7 @@ class RestAPI(CoreSysAttributes):
                 web.post("/mounts", api_mounts.create_mount),
                 web.put("/mounts/{mount}", api_mounts.update_mount),
                 web.delete("/mounts/{mount}", api_mounts.delete_mount),
+                web.get("/mounts/{mount}/health", api_mounts.health),
                 web.post("/mounts/{mount}/reload", api_mounts.reload_mount),
             ]
         )
@@ -700,6 +711,7 @@ class RestAPI(CoreSysAttributes):
             [
                 web.get("/store", api_store.store_info),
                 web.get("/store/addons", api_store.addons_list),
+                web.get("/store/addons/search", api_store.addons_search),
                 web.get("/store/addons/{addon}", api_store.addons_addon_info),
                 web.get("/store/addons/{addon}/icon", api_store.addons_addon_icon),
                 web.get("/store/addons/{addon}/logo", api_store.addons_addon_logo),
@@ -724,6 +736,7 @@ class RestAPI(CoreSysAttributes):
                 ),
                 # Must be below others since it has a wildcard in resource path
                 web.get("/store/addons/{addon}/{version}", api_store.addons_addon_info),
+                web.post("/store/options", api_store.options),
                 web.post("/store/reload", api_store.reload),
                 web.get("/store/repositories", api_store.repositories_list),
                 web.get(
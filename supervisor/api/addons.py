@@ -106,7 +106,8 @@ from ..exceptions import (
     PwnedSecret,
 )
 from ..validate import docker_ports
-from .const import ATTR_REMOVE_CONFIG, ATTR_SIGNED
+from .cache import api_cache
+from .const import ATTR_DISK_USAGE, ATTR_REMOVE_CONFIG, ATTR_SIGNED
 from .utils import api_process, api_validate, json_loads
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -156,6 +157,7 @@ class APIAddons(CoreSysAttributes):
 
         return addon
 
+    @api_cache()
     @api_process
     async def list(self, request: web.Request) -> dict[str, Any]:
         """Return all add-ons or repositories."""
@@ -265,6 +267,7 @@ class APIAddons(CoreSysAttributes):
             ATTR_WATCHDOG: addon.watchdog,
             ATTR_DEVICES: addon.static_devices
             + [device.path for device in addon.devices],
+            ATTR_DISK_USAGE: self.sys_host.disk_usage.get_addon_usage(addon.slug),
         }
 
         return data
@@ -0,0 +1,148 @@
+"""In-memory cache for static add-on assets served by the RESTful API."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+
+from aiohttp import hdrs, web
+
+from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import APIError
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+ASSET_CACHE_MAX_SIZE = 16 * 1024 * 1024
+ASSET_MAX_FILE_SIZE = 2 * 1024 * 1024
+ASSET_COMPRESS_MIN_SIZE = 1024
+
+# Images change only with an add-on update, texts are revalidated with ETag
+ASSET_MAX_AGE_IMAGE = timedelta(days=1)
+CACHE_CONTROL_IMAGE = f"private, max-age={int(ASSET_MAX_AGE_IMAGE.total_seconds())}"
+CACHE_CONTROL_TEXT = "private, no-cache"
+
+
+@dataclass(slots=True, frozen=True)
+class Asset:
+    """Content of an asset file with its hash and compressed variant."""
+
+    signature: tuple[int, int, int]
+    etag: str
+    body: bytes
+    body_gzip: bytes | None
+
+    @property
+    def size(self) -> int:
+        """Return memory used by asset content."""
+        return len(self.body) + len(self.body_gzip or b"")
+
+
+def _file_signature(path: Path) -> tuple[int, int, int]:
+    """Return inode, modification time and size identifying file content."""
+    stat = path.stat()
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _read_asset(path: Path, compress: bool) -> Asset:
+    """Read asset file and hash it.
+
+    Must be run in executor.
+    """
+    signature = _file_signature(path)
+    body = path.read_bytes()
+
+    body_gzip: bytes | None = None
+    if compress and len(body) >= ASSET_COMPRESS_MIN_SIZE:
+        body_gzip = gzip.compress(body, mtime=0)
+        if len(body_gzip) >= len(body):
+            body_gzip = None
+
+    return Asset(
+        signature=signature,
+        etag=hashlib.sha256(body).hexdigest(),
+        body=body,
+        body_gzip=body_gzip,
+    )
+
+
+class AssetCache(CoreSysAttributes):
+    """LRU cache of add-on icons, logos, changelogs and documentation."""
+
+    def __init__(self, coresys: CoreSys, max_size: int = ASSET_CACHE_MAX_SIZE):
+        """Initialize asset cache."""
+        self.coresys: CoreSys = coresys
+        self.max_size: int = max_size
+        self._assets: OrderedDict[Path, Asset] = OrderedDict()
+        self._size: int = 0
+
+    @property
+    def size(self) -> int:
+        """Return memory used by cached assets."""
+        return self._size
+
+    def clear(self) -> None:
+        """Drop all cached assets."""
+        self._assets.clear()
+        self._size = 0
+
+    async def get(self, path: Path, *, compress: bool = False) -> Asset:
+        """Return asset for path, reading it only if the file changed."""
+        try:
+            signature = _file_signature(path)
+        except OSError as err:
+            self._pop(path)
+            raise APIError(f"Can't read {path.name}: {err!s}", _LOGGER.error) from err
+
+        if (asset := self._assets.get(path)) and asset.signature == signature:
+            self._assets.move_to_end(path)
+            return asset
+
+        self._pop(path)
+        try:
+            asset = await self.sys_run_in_executor(_read_asset, path, compress)
+        except OSError as err:
+            raise APIError(f"Can't read {path.name}: {err!s}", _LOGGER.error) from err
+
+        if asset.size <= ASSET_MAX_FILE_SIZE:
+            self._assets[path] = asset
+            self._size += asset.size
+            while self._size > self.max_size:
+                self._pop(next(iter(self._assets)))
+
+        return asset
+
+    def _pop(self, path: Path) -> None:
+        """Remove asset from cache."""
+        if asset := self._assets.pop(path, None):
+            self._size -= asset.size
+
+
+def asset_response(
+    request: web.Request,
+    asset: Asset,
+    content_type: str,
+    cache_control: str,
+    charset: str | None = None,
+) -> web.Response:
+    """Return asset with strong ETag, answering conditional requests with 304."""
+    headers = {hdrs.CACHE_CONTROL: cache_control, hdrs.VARY: hdrs.ACCEPT_ENCODING}
+
+    body = asset.body
+    etag = asset.etag
+    if asset.body_gzip and "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, ""):
+        body = asset.body_gzip
+        etag = f"{asset.etag}-gzip"
+        headers[hdrs.CONTENT_ENCODING] = "gzip"
+
+    if any(match.value in (etag, "*") for match in request.if_none_match or ()):
+        headers.pop(hdrs.CONTENT_ENCODING, None)
+        return web.Response(status=304, headers=headers | {hdrs.ETAG: f'"{etag}"'})
+
+    response = web.Response(
+        body=body, content_type=content_type, charset=charset, headers=headers
+    )
+    response.etag = etag
+    return response
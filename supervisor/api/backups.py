@@ -13,7 +13,13 @@ from aiohttp.hdrs import CONTENT_DISPOSITION
 import voluptuous as vol
 
 from ..backups.backup import Backup
-from ..backups.validate import ALL_FOLDERS, FOLDER_HOMEASSISTANT, days_until_stale
+from ..backups.const import ATTR_BACKUP_WINDOW, ATTR_BENCHMARKS, LOCATION_AUTO
+from ..backups.validate import (
+    ALL_FOLDERS,
+    FOLDER_HOMEASSISTANT,
+    backup_window,
+    days_until_stale,
+)
 from ..const import (
     ATTR_ADDONS,
     ATTR_BACKUPS,
@@ -43,6 +49,7 @@ from ..exceptions import APIError
 from ..jobs import JobSchedulerOptions
 from ..mounts.const import MountUsage
 from ..resolution.const import UnhealthyReason
+from .cache import api_cache
 from .const import ATTR_BACKGROUND, ATTR_JOB_ID, CONTENT_TYPE_TAR
 from .utils import api_process, api_validate
 
@@ -92,6 +99,7 @@ SCHEMA_BACKUP_PARTIAL = SCHEMA_BACKUP_FULL.extend(
 SCHEMA_OPTIONS = vol.Schema(
     {
         vol.Optional(ATTR_DAYS_UNTIL_STALE): days_until_stale,
+        vol.Optional(ATTR_BACKUP_WINDOW): backup_window,
     }
 )
 
@@ -133,6 +141,7 @@ class APIBackups(CoreSysAttributes):
             for backup in self.sys_backups.list_backups
         ]
 
+    @api_cache()
     @api_process
     async def list(self, request):
         """Return backup list."""
@@ -150,6 +159,11 @@ class APIBackups(CoreSysAttributes):
         return {
             ATTR_BACKUPS: self._list_backups(),
             ATTR_DAYS_UNTIL_STALE: self.sys_backups.days_until_stale,
+            ATTR_BACKUP_WINDOW: self.sys_backups.backup_window,
+            ATTR_BENCHMARKS: [
+                benchmark.to_dict()
+                for benchmark in self.sys_backups.benchmarks.values()
+            ],
         }
 
     @api_process
@@ -159,6 +173,8 @@ class APIBackups(CoreSysAttributes):
 
         if ATTR_DAYS_UNTIL_STALE in body:
             self.sys_backups.days_until_stale = body[ATTR_DAYS_UNTIL_STALE]
+        if ATTR_BACKUP_WINDOW in body:
+            self.sys_backups.backup_window = body[ATTR_BACKUP_WINDOW]
 
         self.sys_backups.save_data()
 
@@ -168,6 +184,14 @@ class APIBackups(CoreSysAttributes):
         await asyncio.shield(self.sys_backups.reload())
         return True
 
+    @api_process
+    async def benchmark(self, _):
+        """Measure throughput of backup locations."""
+        benchmarks = await asyncio.shield(self.sys_backups.benchmark_locations())
+        return {
+            ATTR_BENCHMARKS: [benchmark.to_dict() for benchmark in benchmarks.values()]
+        }
+
     @api_process
     async def backup_info(self, request):
         """Return backup info."""
@@ -201,11 +225,23 @@ class APIBackups(CoreSysAttributes):
             ATTR_HOMEASSISTANT_EXCLUDE_DATABASE: backup.homeassistant_exclude_database,
         }
 
-    def _location_to_mount(self, body: dict[str, Any]) -> dict[str, Any]:
+    async def _location_to_mount(
+        self, body: dict[str, Any], partial: bool = False
+    ) -> dict[str, Any]:
         """Change location field to mount if necessary."""
         if not body.get(ATTR_LOCATON):
             return body
 
+        # A mount named like the keyword takes precedence
+        if body[ATTR_LOCATON] == LOCATION_AUTO and LOCATION_AUTO not in self.sys_mounts:
+            body[ATTR_LOCATON] = await self.sys_backups.select_location(
+                partial=partial,
+                addons=body.get(ATTR_ADDONS, []),
+                folders=body.get(ATTR_FOLDERS, []),
+                homeassistant=body.get(ATTR_HOMEASSISTANT, False),
+            )
+            return body
+
         body[ATTR_LOCATON] = self.sys_mounts.get(body[ATTR_LOCATON])
         if body[ATTR_LOCATON].usage != MountUsage.BACKUP:
             raise APIError(
@@ -250,7 +286,7 @@ class APIBackups(CoreSysAttributes):
         body = await api_validate(SCHEMA_BACKUP_FULL, request)
         background = body.pop(ATTR_BACKGROUND)
         backup_task, job_id = await self._background_backup_task(
-            self.sys_backups.do_backup_full, **self._location_to_mount(body)
+            self.sys_backups.do_backup_full, **(await self._location_to_mount(body))
         )
 
         if background and not backup_task.done():
@@ -270,7 +306,8 @@ class APIBackups(CoreSysAttributes):
         body = await api_validate(SCHEMA_BACKUP_PARTIAL, request)
         background = body.pop(ATTR_BACKGROUND)
         backup_task, job_id = await self._background_backup_task(
-            self.sys_backups.do_backup_partial, **self._location_to_mount(body)
+            self.sys_backups.do_backup_partial,
+            **(await self._location_to_mount(body, partial=True)),
         )
 
         if background and not backup_task.done():
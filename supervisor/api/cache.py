@@ -0,0 +1,133 @@
+"""Response cache with ETag support for read-heavy RESTful API endpoints."""
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import hashlib
+import logging
+from typing import Any
+
+from aiohttp import hdrs, web
+from aiohttp.web import Request, RequestHandler, StreamResponse, middleware
+
+from ..const import BusEvent
+from ..coresys import CoreSys, CoreSysAttributes
+from ..utils.dt import utcnow
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_TTL = timedelta(seconds=60)
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Requests which can't change state and therefore don't invalidate the cache
+SAFE_METHODS = (hdrs.METH_GET, hdrs.METH_HEAD, hdrs.METH_OPTIONS)
+
+
+@dataclass(slots=True, frozen=True)
+class CacheEntry:
+    """ETag of a response and until when it can be trusted."""
+
+    etag: str
+    expires: datetime
+
+
+class APIResponseCache(CoreSysAttributes):
+    """Remember ETags of API responses until related state changes."""
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize response cache."""
+        self.coresys: CoreSys = coresys
+        self._entries: dict[str, CacheEntry] = {}
+        self._generation: int = 0
+
+    @property
+    def generation(self) -> int:
+        """Return counter increased on every invalidation."""
+        return self._generation
+
+    async def load(self) -> None:
+        """Invalidate cache on events which change API data."""
+        for event in (
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+            BusEvent.SUPERVISOR_JOB_END,
+            BusEvent.SUPERVISOR_STATE_CHANGE,
+        ):
+            self.sys_bus.register_event(event, self._invalidate_on_event)
+
+    async def _invalidate_on_event(self, _: Any) -> None:
+        """Invalidate cache from a bus event."""
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop all cached ETags."""
+        self._generation += 1
+        self._entries.clear()
+
+    def get(self, key: str) -> str | None:
+        """Return ETag for key if it is still valid."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if entry.expires < utcnow():
+            self._entries.pop(key, None)
+            return None
+        return entry.etag
+
+    def set(
+        self, key: str, etag: str, generation: int, ttl: timedelta = RESPONSE_CACHE_TTL
+    ) -> None:
+        """Remember ETag for key if nothing changed while the response was built."""
+        if generation != self._generation:
+            return
+        if len(self._entries) >= RESPONSE_CACHE_MAX_ENTRIES:
+            self._entries.clear()
+        self._entries[key] = CacheEntry(etag=etag, expires=utcnow() + ttl)
+
+    @middleware
+    async def invalidate_on_change(
+        self, request: Request, handler: RequestHandler
+    ) -> StreamResponse:
+        """Invalidate cache after API calls which can change state."""
+        try:
+            return await handler(request)
+        finally:
+            if request.method not in SAFE_METHODS:
+                self.invalidate()
+
+
+def api_cache(ttl: timedelta = RESPONSE_CACHE_TTL):
+    """Answer conditional requests with 304 while the response is unchanged.
+
+    Wraps an already processed API handler (i.e. outside of api_process).
+    """
+
+    def wrap_method(
+        method: Callable[..., Awaitable[StreamResponse]],
+    ) -> Callable[..., Awaitable[StreamResponse]]:
+        """Wrap function with ETag handling."""
+
+        async def wrap_api(api: CoreSysAttributes, request: Request, *args, **kwargs):
+            """Return cached or fresh API response."""
+            cache: APIResponseCache = api.sys_api.response_cache
+            key = request.path_qs
+
+            if (etag := cache.get(key)) and any(
+                match.value in (etag, "*") for match in request.if_none_match or ()
+            ):
+                return web.Response(status=304, headers={hdrs.ETAG: f'"{etag}"'})
+
+            generation = cache.generation
+            response = await method(api, request, *args, **kwargs)
+            if (
+                isinstance(response, web.Response)
+                and response.status == 200
+                and isinstance(response.body, bytes)
+            ):
+                etag = hashlib.sha1(response.body, usedforsecurity=False).hexdigest()
+                response.etag = etag
+                cache.set(key, etag, generation, ttl)
+
+            return response
+
+        return wrap_api
+
+    return wrap_method
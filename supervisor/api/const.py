@@ -23,45 +23,69 @@ ATTR_BOOT_TIMESTAMP = "boot_timestamp"
 ATTR_BOOTS = "boots"
 ATTR_BROADCAST_LLMNR = "broadcast_llmnr"
 ATTR_BROADCAST_MDNS = "broadcast_mdns"
+ATTR_BUCKET_SIZE = "bucket_size"
+ATTR_BUCKETS = "buckets"
 ATTR_BY_ID = "by_id"
 ATTR_CHILDREN = "children"
+ATTR_COMPLETE = "complete"
 ATTR_CONNECTION_BUS = "connection_bus"
+ATTR_COUNT = "count"
 ATTR_DATA_DISK = "data_disk"
+ATTR_DEGRADED = "degraded"
 ATTR_DEVICE = "device"
 ATTR_DEV_PATH = "dev_path"
 ATTR_DISKS = "disks"
+ATTR_DISK_USAGE = "disk_usage"
 ATTR_DRIVES = "drives"
 ATTR_DT_SYNCHRONIZED = "dt_synchronized"
 ATTR_DT_UTC = "dt_utc"
 ATTR_EJECTABLE = "ejectable"
+ATTR_ERROR = "error"
 ATTR_FALLBACK = "fallback"
 ATTR_FILESYSTEMS = "filesystems"
 ATTR_GROUP_IDS = "group_ids"
+ATTR_HISTORY = "history"
 ATTR_IDENTIFIERS = "identifiers"
 ATTR_IS_ACTIVE = "is_active"
 ATTR_IS_OWNER = "is_owner"
 ATTR_JOB_ID = "job_id"
 ATTR_JOBS = "jobs"
+ATTR_LAST_UPDATE = "last_update"
+ATTR_LAST_UPDATE_DURATION = "last_update_duration"
+ATTR_LATENCY = "latency"
+ATTR_LIMIT = "limit"
 ATTR_LLMNR = "llmnr"
 ATTR_LLMNR_HOSTNAME = "llmnr_hostname"
 ATTR_LOCAL_ONLY = "local_only"
+ATTR_MATCHED = "matched"
 ATTR_MDNS = "mdns"
 ATTR_MODEL = "model"
 ATTR_MOUNTS = "mounts"
 ATTR_MOUNT_POINTS = "mount_points"
+ATTR_OFFSET = "offset"
 ATTR_PANEL_PATH = "panel_path"
+ATTR_PRIORITIES = "priorities"
+ATTR_QUERY = "query"
 ATTR_REMOVABLE = "removable"
 ATTR_REMOVE_CONFIG = "remove_config"
 ATTR_REVISION = "revision"
 ATTR_SAFE_MODE = "safe_mode"
+ATTR_SCANNED = "scanned"
 ATTR_SEAT = "seat"
+ATTR_SETUP_TIMES = "setup_times"
+ATTR_SHARE = "share"
 ATTR_SIGNED = "signed"
+ATTR_SINCE = "since"
+ATTR_START = "start"
 ATTR_STARTUP_TIME = "startup_time"
 ATTR_STATUS = "status"
 ATTR_SUBSYSTEM = "subsystem"
 ATTR_SYSFS = "sysfs"
 ATTR_SYSTEM_HEALTH_LED = "system_health_led"
+ATTR_THROUGHPUT = "throughput"
 ATTR_TIME_DETECTED = "time_detected"
+ATTR_TIMESTAMP = "timestamp"
+ATTR_TOTAL = "total"
 ATTR_UPDATE_TYPE = "update_type"
 ATTR_USAGE = "usage"
 ATTR_USE_NTP = "use_ntp"
@@ -1,15 +1,22 @@
 """Init file for Supervisor host RESTful API."""
 
 import asyncio
+from collections import deque
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import re
+from typing import Any
 
 from aiohttp import web
 from aiohttp.hdrs import ACCEPT, RANGE
 import voluptuous as vol
 from voluptuous.error import CoerceInvalid
+from voluptuous.humanize import humanize_error
 
 from ..const import (
+    ATTR_ADDONS,
+    ATTR_BACKUPS,
     ATTR_CHASSIS,
     ATTR_CPE,
     ATTR_DEPLOYMENT,
@@ -21,9 +28,11 @@ from ..const import (
     ATTR_FEATURES,
     ATTR_HOSTNAME,
     ATTR_KERNEL,
+    ATTR_LOCATON,
     ATTR_NAME,
     ATTR_OPERATING_SYSTEM,
     ATTR_SERVICES,
+    ATTR_SIZE,
     ATTR_STATE,
     ATTR_TIMEZONE,
 )
@@ -32,11 +41,21 @@ from ..exceptions import APIError, HostLogError
 from ..host.const import (
     PARAM_BOOT_ID,
     PARAM_FOLLOW,
+    PARAM_PRIORITY,
     PARAM_SYSLOG_IDENTIFIER,
     LogFormat,
     LogFormatter,
 )
+from ..host.info import DiskMetrics
+from ..host.log_query import (
+    LOG_QUERY_MAX_BUCKETS,
+    LOG_QUERY_MAX_ENTRIES,
+    LogAggregation,
+    compile_pattern,
+)
+from ..utils.dt import utcnow
 from ..utils.systemd_journal import journal_logs_reader
+from .cache import api_cache
 from .const import (
     ATTR_AGENT_VERSION,
     ATTR_APPARMOR_VERSION,
@@ -44,11 +63,23 @@ from .const import (
     ATTR_BOOTS,
     ATTR_BROADCAST_LLMNR,
     ATTR_BROADCAST_MDNS,
+    ATTR_BUCKET_SIZE,
+    ATTR_BUCKETS,
+    ATTR_COMPLETE,
+    ATTR_COUNT,
     ATTR_DT_SYNCHRONIZED,
     ATTR_DT_UTC,
+    ATTR_HISTORY,
     ATTR_IDENTIFIERS,
     ATTR_LLMNR_HOSTNAME,
+    ATTR_MATCHED,
+    ATTR_PRIORITIES,
+    ATTR_SCANNED,
+    ATTR_SHARE,
+    ATTR_SINCE,
+    ATTR_START,
     ATTR_STARTUP_TIME,
+    ATTR_TIMESTAMP,
     ATTR_USE_NTP,
     ATTR_VIRTUALIZATION,
     CONTENT_TYPE_TEXT,
@@ -62,15 +93,83 @@ IDENTIFIER = "identifier"
 BOOTID = "bootid"
 DEFAULT_RANGE = 100
 
+# Query parameters of advanced logs
+QUERY_SINCE = "since"
+QUERY_UNTIL = "until"
+QUERY_LINES = "lines"
+QUERY_IDENTIFIER = "identifier"
+QUERY_PRIORITY = "priority"
+QUERY_TEXT = "text"
+QUERY_BOOT = "boot"
+QUERY_REGEX = "regex"
+QUERY_PERIOD = "period"
+QUERY_BUCKET = "bucket"
+
+LOG_QUERY_DEFAULT_PERIOD = timedelta(hours=1)
+LOG_QUERY_DEFAULT_BUCKET = timedelta(minutes=5)
+LOG_QUERY_DEFAULT_ENTRIES = 10000
+LOG_QUERY_MAX_REGEX_LENGTH = 256
+
+HEADER_FIRST_CURSOR = "X-First-Cursor"
+
+# Host info includes disk usage which changes without any event
+HOST_INFO_CACHE_TTL = timedelta(seconds=10)
+
 SCHEMA_OPTIONS = vol.Schema({vol.Optional(ATTR_HOSTNAME): str})
 
+SCHEMA_LOGS_QUERY = vol.Schema(
+    {
+        vol.Exclusive(QUERY_SINCE, "cursor"): vol.All(str, vol.Length(min=1)),
+        vol.Exclusive(QUERY_UNTIL, "cursor"): vol.All(str, vol.Length(min=1)),
+        vol.Optional(QUERY_LINES, default=DEFAULT_RANGE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(QUERY_PRIORITY): vol.All(vol.Coerce(int), vol.Range(min=0, max=7)),
+        vol.Optional(QUERY_TEXT): vol.All(str, vol.Length(min=1)),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+SCHEMA_LOGS_AGGREGATE = vol.Schema(
+    {
+        vol.Optional(QUERY_BOOT): str,
+        vol.Optional(QUERY_PRIORITY): vol.All(vol.Coerce(int), vol.Range(min=0, max=7)),
+        vol.Optional(QUERY_REGEX): vol.All(
+            str, vol.Length(min=1, max=LOG_QUERY_MAX_REGEX_LENGTH)
+        ),
+        vol.Optional(
+            QUERY_PERIOD, default=int(LOG_QUERY_DEFAULT_PERIOD.total_seconds())
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(
+            QUERY_BUCKET, default=int(LOG_QUERY_DEFAULT_BUCKET.total_seconds())
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(QUERY_LINES, default=LOG_QUERY_DEFAULT_ENTRIES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=LOG_QUERY_MAX_ENTRIES)
+        ),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+def _disk_metrics_dict(metrics: DiskMetrics) -> dict[str, Any]:
+    """Return dict for a disk usage sample."""
+    return {
+        ATTR_TIMESTAMP: metrics.timestamp.isoformat(),
+        ATTR_DISK_FREE: metrics.free_space,
+        ATTR_DISK_TOTAL: metrics.total_space,
+        ATTR_DISK_USED: metrics.used_space,
+        ATTR_DISK_LIFE_TIME: metrics.disk_life_time,
+    }
+
 
 class APIHost(CoreSysAttributes):
     """Handle RESTful API for host functions."""
 
+    @api_cache(ttl=HOST_INFO_CACHE_TTL)
     @api_process
     async def info(self, request):
         """Return host information."""
+        disk = await self.sys_host.info.get_disk_metrics()
         return {
             ATTR_AGENT_VERSION: self.sys_dbus.agent.version,
             ATTR_APPARMOR_VERSION: self.sys_host.apparmor.version,
@@ -78,10 +177,10 @@ class APIHost(CoreSysAttributes):
             ATTR_VIRTUALIZATION: self.sys_host.info.virtualization,
             ATTR_CPE: self.sys_host.info.cpe,
             ATTR_DEPLOYMENT: self.sys_host.info.deployment,
-            ATTR_DISK_FREE: self.sys_host.info.free_space,
-            ATTR_DISK_TOTAL: self.sys_host.info.total_space,
-            ATTR_DISK_USED: self.sys_host.info.used_space,
-            ATTR_DISK_LIFE_TIME: self.sys_host.info.disk_life_time,
+            ATTR_DISK_FREE: disk.free_space,
+            ATTR_DISK_TOTAL: disk.total_space,
+            ATTR_DISK_USED: disk.used_space,
+            ATTR_DISK_LIFE_TIME: disk.disk_life_time,
             ATTR_FEATURES: self.sys_host.features,
             ATTR_HOSTNAME: self.sys_host.info.hostname,
             ATTR_LLMNR_HOSTNAME: self.sys_host.info.llmnr_hostname,
@@ -97,6 +196,31 @@ class APIHost(CoreSysAttributes):
             ATTR_BROADCAST_MDNS: self.sys_host.info.broadcast_mdns,
         }
 
+    @api_process
+    async def disk_metrics(self, request: web.Request) -> dict[str, Any]:
+        """Return latest disk usage sample and its recent history."""
+        disk = await self.sys_host.info.get_disk_metrics()
+        return _disk_metrics_dict(disk) | {
+            ATTR_HISTORY: [
+                _disk_metrics_dict(metrics)
+                for metrics in self.sys_host.info.disk_history
+            ]
+        }
+
+    @api_process
+    async def disk_usage(self, request: web.Request) -> dict[str, Any]:
+        """Return space used by add-on data, backup locations and share."""
+        usage = await self.sys_host.disk_usage.get_usage()
+        return {
+            ATTR_TIMESTAMP: usage.timestamp.isoformat(),
+            ATTR_ADDONS: usage.addons,
+            ATTR_BACKUPS: [
+                {ATTR_LOCATON: location, ATTR_SIZE: size}
+                for location, size in usage.backups.items()
+            ],
+            ATTR_SHARE: usage.share,
+        }
+
     @api_process
     async def options(self, request):
         """Edit host settings."""
@@ -154,6 +278,64 @@ class APIHost(CoreSysAttributes):
         """Return a list of syslog identifiers."""
         return {ATTR_IDENTIFIERS: await self.sys_host.logs.get_identifiers()}
 
+    @api_process
+    async def aggregate_logs(self, request: web.Request) -> dict[str, Any]:
+        """Count log entries by identifier, priority and time bucket."""
+        try:
+            query = SCHEMA_LOGS_AGGREGATE(dict(request.query))
+        except vol.Invalid as err:
+            raise APIError(humanize_error(dict(request.query), err)) from None
+
+        if query[QUERY_PERIOD] // query[QUERY_BUCKET] >= LOG_QUERY_MAX_BUCKETS:
+            raise APIError(
+                f"Period can be split into at most {LOG_QUERY_MAX_BUCKETS} buckets"
+            )
+
+        pattern = None
+        if QUERY_REGEX in query:
+            try:
+                pattern = compile_pattern(query[QUERY_REGEX])
+            except re.error as err:
+                raise APIError(f"Invalid regex: {err!s}") from None
+
+        params: dict[str, str | list[str]] = {}
+        if identifiers := request.query.getall(QUERY_IDENTIFIER, None):
+            params[PARAM_SYSLOG_IDENTIFIER] = identifiers
+        if QUERY_BOOT in query:
+            params[PARAM_BOOT_ID] = await self._get_boot_id(query[QUERY_BOOT])
+        if QUERY_PRIORITY in query:
+            params[PARAM_PRIORITY] = [
+                str(priority) for priority in range(query[QUERY_PRIORITY] + 1)
+            ]
+
+        bucket_size = timedelta(seconds=query[QUERY_BUCKET])
+        aggregation = await self.sys_host.logs.aggregate_logs(
+            LogAggregation(
+                since=utcnow() - timedelta(seconds=query[QUERY_PERIOD]),
+                bucket_size=bucket_size,
+                pattern=pattern,
+            ),
+            params,
+            query[QUERY_LINES],
+        )
+
+        return {
+            ATTR_SINCE: aggregation.since.isoformat(),
+            ATTR_BUCKET_SIZE: int(bucket_size.total_seconds()),
+            ATTR_SCANNED: aggregation.scanned,
+            ATTR_MATCHED: aggregation.matched,
+            ATTR_COMPLETE: aggregation.covers_period(query[QUERY_LINES]),
+            ATTR_IDENTIFIERS: dict(aggregation.identifiers.most_common()),
+            ATTR_PRIORITIES: dict(sorted(aggregation.priorities.items())),
+            ATTR_BUCKETS: [
+                {
+                    ATTR_START: (aggregation.since + bucket_size * bucket).isoformat(),
+                    ATTR_COUNT: count,
+                }
+                for bucket, count in sorted(aggregation.buckets.items())
+            ],
+        }
+
     async def _get_boot_id(self, possible_offset: str) -> str:
         """Convert offset into boot ID if required."""
         with suppress(CoerceInvalid):
@@ -168,6 +350,11 @@ class APIHost(CoreSysAttributes):
         self, request: web.Request, identifier: str | None = None, follow: bool = False
     ) -> web.StreamResponse:
         """Return systemd-journald logs."""
+        try:
+            query = SCHEMA_LOGS_QUERY(dict(request.query))
+        except vol.Invalid as err:
+            raise APIError(humanize_error(dict(request.query), err)) from None
+
         log_formatter = LogFormatter.PLAIN
         params = {}
         if identifier:
@@ -175,7 +362,10 @@ class APIHost(CoreSysAttributes):
         elif IDENTIFIER in request.match_info:
             params[PARAM_SYSLOG_IDENTIFIER] = request.match_info.get(IDENTIFIER)
         else:
-            params[PARAM_SYSLOG_IDENTIFIER] = self.sys_host.logs.default_identifiers
+            params[PARAM_SYSLOG_IDENTIFIER] = (
+                request.query.getall(QUERY_IDENTIFIER, None)
+                or self.sys_host.logs.default_identifiers
+            )
             # host logs should be always verbose, no matter what Accept header is used
             log_formatter = LogFormatter.VERBOSE
 
@@ -185,6 +375,11 @@ class APIHost(CoreSysAttributes):
             )
         if follow:
             params[PARAM_FOLLOW] = ""
+        if QUERY_PRIORITY in query:
+            # Journal matches on the same field are OR-ed
+            params[PARAM_PRIORITY] = [
+                str(priority) for priority in range(query[QUERY_PRIORITY] + 1)
+            ]
 
         if ACCEPT in request.headers and request.headers[ACCEPT] not in [
             CONTENT_TYPE_TEXT,
@@ -199,10 +394,31 @@ class APIHost(CoreSysAttributes):
         if request.headers[ACCEPT] == CONTENT_TYPE_X_LOG:
             log_formatter = LogFormatter.VERBOSE
 
-        if RANGE in request.headers:
+        lines = query[QUERY_LINES]
+        text = query[QUERY_TEXT].casefold() if QUERY_TEXT in query else None
+        # Lines counts matching entries, more entries are scanned for them. The
+        # last ones are kept unless reading forward from a cursor.
+        filtered = text is not None and not follow
+        scan = LOG_QUERY_DEFAULT_ENTRIES if filtered else lines
+        matches: deque[tuple[str | None, str]] | None = None
+        limit: int | None = None
+
+        if QUERY_SINCE in query:
+            # Skip the entry of the cursor itself
+            range_header = f"entries={query[QUERY_SINCE]}:1:{scan}"
+            if filtered:
+                limit = lines
+        elif QUERY_UNTIL in query:
+            range_header = f"entries={query[QUERY_UNTIL]}:-{scan}:{scan}"
+            if filtered:
+                matches = deque(maxlen=lines)
+        elif RANGE in request.headers:
+            # Range given by client counts entries, not matches
             range_header = request.headers.get(RANGE)
         else:
-            range_header = f"entries=:-{DEFAULT_RANGE}:"
+            range_header = f"entries=:-{scan}:"
+            if filtered:
+                matches = deque(maxlen=lines)
 
         async with self.sys_host.logs.journald_logs(
             params=params, range_header=range_header, accept=LogFormat.JOURNAL
@@ -210,9 +426,33 @@ class APIHost(CoreSysAttributes):
             try:
                 response = web.StreamResponse()
                 response.content_type = CONTENT_TYPE_TEXT
-                await response.prepare(request)
-                async for line in journal_logs_reader(resp, log_formatter):
+
+                async def write(cursor: str | None, line: str) -> None:
+                    # Hold headers back until the cursor of the first entry is
+                    # known, unless following where it may take forever
+                    if not response.prepared:
+                        if cursor:
+                            response.headers[HEADER_FIRST_CURSOR] = cursor
+                        await response.prepare(request)
                     await response.write(line.encode("utf-8") + b"\n")
+
+                if follow:
+                    await response.prepare(request)
+                written = 0
+                async for cursor, line in journal_logs_reader(resp, log_formatter):
+                    if text and text not in line.casefold():
+                        continue
+                    if matches is not None:
+                        matches.append((cursor, line))
+                        continue
+                    await write(cursor, line)
+                    written += 1
+                    if limit and written >= limit:
+                        break
+                for cursor, line in matches or ():
+                    await write(cursor, line)
+                if not response.prepared:
+                    await response.prepare(request)
             except ConnectionResetError as ex:
                 raise APIError(
                     "Connection reset when trying to fetch data from systemd-journald."
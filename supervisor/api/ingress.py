@@ -1,5 +1,6 @@
 """Supervisor Add-on ingress service."""
 import asyncio
+from datetime import datetime, timedelta
 from ipaddress import ip_address
 import logging
 from typing import Any
@@ -33,11 +34,15 @@ from ..const import (
 )
 from ..coresys import CoreSysAttributes
 from ..exceptions import HomeAssistantAPIError
+from ..utils.dt import utcnow
 from .const import COOKIE_INGRESS
 from .utils import api_process, api_validate, require_home_assistant
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+USERS_CACHE_TTL = timedelta(minutes=5)
+USERS_NEGATIVE_CACHE_TTL = timedelta(minutes=1)
+
 VALIDATE_SESSION_DATA = vol.Schema({ATTR_SESSION: str})
 
 """Expected optional payload of create session request"""
@@ -74,11 +79,15 @@ def status_code_must_be_empty_body(code: int) -> bool:
 class APIIngress(CoreSysAttributes):
     """Ingress view to handle add-on webui routing."""
 
-    _list_of_users: list[IngressSessionDataUser]
+    _users: dict[str, IngressSessionDataUser]
+    _users_updated: datetime | None
+    _unknown_users: dict[str, datetime]
 
     def __init__(self) -> None:
         """Initialize APIIngress."""
-        self._list_of_users = []
+        self._users = {}
+        self._users_updated = None
+        self._unknown_users = {}
 
     def _extract_addon(self, request: web.Request) -> Addon:
         """Return addon, throw an exception it it doesn't exist."""
@@ -289,20 +298,47 @@ class APIIngress(CoreSysAttributes):
 
             return response
 
-    async def _find_user_by_id(self, user_id: str) -> IngressSessionDataUser | None:
-        """Find user object by the user's ID."""
+    def _users_expired(self) -> bool:
+        """Return True if the cached user directory should be refreshed."""
+        return (
+            self._users_updated is None
+            or utcnow() - self._users_updated > USERS_CACHE_TTL
+        )
+
+    async def _update_users(self) -> None:
+        """Refresh the user directory from Home Assistant."""
         try:
             list_of_users = await self.sys_homeassistant.get_users()
         except (HomeAssistantAPIError, TypeError) as err:
             _LOGGER.error(
                 "%s error occurred while requesting list of users: %s", type(err), err
             )
+            return
+
+        # Throttled, keep what we have
+        if list_of_users is None:
+            return
+
+        self._users = {user.id: user for user in list_of_users}
+        self._users_updated = utcnow()
+        self._unknown_users.clear()
+
+    async def _find_user_by_id(self, user_id: str) -> IngressSessionDataUser | None:
+        """Find user object by the user's ID."""
+        if user_id in self._users and not self._users_expired():
+            return self._users[user_id]
+
+        if (missed := self._unknown_users.get(user_id)) and (
+            utcnow() - missed <= USERS_NEGATIVE_CACHE_TTL
+        ):
             return None
 
-        if list_of_users is not None:
-            self._list_of_users = list_of_users
+        await self._update_users()
+        if user := self._users.get(user_id):
+            return user
 
-        return next((user for user in self._list_of_users if user.id == user_id), None)
+        self._unknown_users[user_id] = utcnow()
+        return None
 
 
 def _init_header(
@@ -1,5 +1,7 @@
 """Handle security part of this API."""
 
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import re
 from typing import Final
@@ -156,6 +158,47 @@ FILTERS: Final = re.compile(
 
 # fmt: on
 
+# Number of distinct paths/query strings kept in the access decision caches
+ACCESS_CACHE_SIZE: Final = 2048
+
+
+@dataclass(slots=True, frozen=True)
+class PathAccess:
+    """Access rules that apply to a request path."""
+
+    blacklisted: bool
+    no_security_check: bool
+    observer: bool
+    addons_api_bypass: bool
+    roles: frozenset[str]
+
+
+@lru_cache(maxsize=ACCESS_CACHE_SIZE)
+def resolve_path_access(path: str) -> PathAccess:
+    """Resolve all access rules for a path once and remember the result."""
+    return PathAccess(
+        blacklisted=BLACKLIST.match(path) is not None,
+        no_security_check=NO_SECURITY_CHECK.match(path) is not None,
+        observer=OBSERVER_CHECK.match(path) is not None,
+        addons_api_bypass=ADDONS_API_BYPASS.match(path) is not None,
+        roles=frozenset(
+            role for role, regex in ADDONS_ROLE_ACCESS.items() if regex.match(path)
+        ),
+    )
+
+
+def recursive_unquote(value: str) -> str:
+    """Handle values that are encoded multiple times."""
+    while (unquoted := unquote(value)) != value:
+        value = unquoted
+    return value
+
+
+@lru_cache(maxsize=ACCESS_CACHE_SIZE)
+def is_filtered(value: str) -> bool:
+    """Return True if value looks like a commonly known exploit attempt."""
+    return FILTERS.search(recursive_unquote(value)) is not None
+
 
 class SecurityMiddleware(CoreSysAttributes):
     """Security middleware functions."""
@@ -164,24 +207,18 @@ class SecurityMiddleware(CoreSysAttributes):
         """Initialize security middleware."""
         self.coresys: CoreSys = coresys
 
-    def _recursive_unquote(self, value: str) -> str:
-        """Handle values that are encoded multiple times."""
-        if (unquoted := unquote(value)) != value:
-            unquoted = self._recursive_unquote(unquoted)
-        return unquoted
-
     @middleware
     async def block_bad_requests(
         self, request: Request, handler: RequestHandler
     ) -> Response:
         """Process request and tblock commonly known exploit attempts."""
-        if FILTERS.search(self._recursive_unquote(request.path)):
+        if is_filtered(request.path):
             _LOGGER.warning(
                 "Filtered a potential harmful request to: %s", request.raw_path
             )
             raise HTTPBadRequest
 
-        if FILTERS.search(self._recursive_unquote(request.query_string)):
+        if request.query_string and is_filtered(request.query_string):
             _LOGGER.warning(
                 "Filtered a request with a potential harmful query string: %s",
                 request.raw_path,
@@ -213,14 +250,15 @@ class SecurityMiddleware(CoreSysAttributes):
         """Check security access of this layer."""
         request_from = None
         supervisor_token = excract_supervisor_token(request)
+        access = resolve_path_access(request.path)
 
         # Blacklist
-        if BLACKLIST.match(request.path):
+        if access.blacklisted:
             _LOGGER.error("%s is blacklisted!", request.path)
             raise HTTPForbidden()
 
         # Ignore security check
-        if NO_SECURITY_CHECK.match(request.path):
+        if access.no_security_check:
             _LOGGER.debug("Passthrough %s", request.path)
             request[REQUEST_FROM] = None
             return await handler(request)
@@ -242,7 +280,7 @@ class SecurityMiddleware(CoreSysAttributes):
 
         # Observer
         if supervisor_token == self.sys_plugins.observer.supervisor_token:
-            if not OBSERVER_CHECK.match(request.path):
+            if not access.observer:
                 _LOGGER.warning("%s invalid Observer access", request.path)
                 raise HTTPForbidden()
             _LOGGER.debug("%s access from Observer", request.path)
@@ -254,12 +292,12 @@ class SecurityMiddleware(CoreSysAttributes):
             addon = self.sys_addons.from_token(supervisor_token)
 
         # Check Add-on API access
-        if addon and ADDONS_API_BYPASS.match(request.path):
+        if addon and access.addons_api_bypass:
             _LOGGER.debug("Passthrough %s from %s", request.path, addon.slug)
             request_from = addon
         elif addon and addon.access_hassio_api:
             # Check Role
-            if ADDONS_ROLE_ACCESS[addon.hassio_role].match(request.path):
+            if addon.hassio_role in access.roles:
                 _LOGGER.info("%s access from %s", request.path, addon.slug)
                 request_from = addon
             else:
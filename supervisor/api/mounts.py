@@ -11,7 +11,15 @@ from ..exceptions import APIError
 from ..mounts.const import ATTR_DEFAULT_BACKUP_MOUNT, MountUsage
 from ..mounts.mount import Mount
 from ..mounts.validate import SCHEMA_MOUNT_CONFIG
-from .const import ATTR_MOUNTS
+from .const import (
+    ATTR_DEGRADED,
+    ATTR_ERROR,
+    ATTR_HISTORY,
+    ATTR_LATENCY,
+    ATTR_MOUNTS,
+    ATTR_THROUGHPUT,
+    ATTR_TIMESTAMP,
+)
 from .utils import api_process, api_validate
 
 SCHEMA_OPTIONS = vol.Schema(
@@ -32,7 +40,11 @@ class APIMounts(CoreSysAttributes):
             if self.sys_mounts.default_backup_mount
             else None,
             ATTR_MOUNTS: [
-                mount.to_dict() | {ATTR_STATE: mount.state}
+                mount.to_dict()
+                | {
+                    ATTR_STATE: mount.state,
+                    ATTR_DEGRADED: self.sys_mounts.monitor.is_degraded(mount.name),
+                }
                 for mount in self.sys_mounts.mounts
             ],
         }
@@ -122,3 +134,23 @@ class APIMounts(CoreSysAttributes):
         # If it's a backup mount, reload backups
         if self.sys_mounts.get(name).usage == MountUsage.BACKUP:
             self.sys_create_task(self.sys_backups.reload())
+
+    @api_process
+    async def health(self, request: web.Request) -> dict[str, Any]:
+        """Return recent probes of a mount."""
+        name = request.match_info.get("mount")
+        if name not in self.sys_mounts:
+            raise APIError(f"No mount exists with name {name}")
+
+        return {
+            ATTR_DEGRADED: self.sys_mounts.monitor.is_degraded(name),
+            ATTR_HISTORY: [
+                {
+                    ATTR_TIMESTAMP: probe.timestamp.isoformat(),
+                    ATTR_LATENCY: probe.latency,
+                    ATTR_THROUGHPUT: probe.throughput,
+                    ATTR_ERROR: probe.error,
+                }
+                for probe in self.sys_mounts.monitor.get_history(name)
+            ],
+        }
@@ -7,7 +7,12 @@ import aiohttp
 from aiohttp import web
 from aiohttp.client_exceptions import ClientConnectorError
 from aiohttp.client_ws import ClientWebSocketResponse
-from aiohttp.hdrs import AUTHORIZATION, CONTENT_TYPE
+from aiohttp.hdrs import (
+    AUTHORIZATION,
+    CONTENT_ENCODING,
+    CONTENT_LENGTH,
+    CONTENT_TYPE,
+)
 from aiohttp.http import WSMessage
 from aiohttp.http_websocket import WSMsgType
 from aiohttp.web_exceptions import HTTPBadGateway, HTTPUnauthorized
@@ -29,6 +34,9 @@ HEADER_HA_ACCESS = "X-Ha-Access"
 # https://github.com/home-assistant/supervisor/issues/4392
 MAX_MESSAGE_SIZE_FROM_CORE = 64 * 1024 * 1024
 
+# Chunk size used when streaming proxied responses from Home Assistant
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class APIProxy(CoreSysAttributes):
     """API Proxy for Home Assistant."""
@@ -81,12 +89,14 @@ class APIProxy(CoreSysAttributes):
         except TimeoutError:
             _LOGGER.error("Client timeout error on API request %s", path)
 
+        # Core may be gone, probe it again on next request
+        self.sys_homeassistant.api.invalidate_api_state()
         raise HTTPBadGateway()
 
     async def stream(self, request: web.Request):
         """Proxy HomeAssistant EventStream Requests."""
         self._check_access(request)
-        if not await self.sys_homeassistant.api.check_api_state():
+        if not await self.sys_homeassistant.api.check_api_state_cached():
             raise HTTPBadGateway()
 
         _LOGGER.info("Home Assistant EventStream start")
@@ -107,16 +117,34 @@ class APIProxy(CoreSysAttributes):
     async def api(self, request: web.Request):
         """Proxy Home Assistant API Requests."""
         self._check_access(request)
-        if not await self.sys_homeassistant.api.check_api_state():
+        if not await self.sys_homeassistant.api.check_api_state_cached():
             raise HTTPBadGateway()
 
-        # Normal request
+        # Normal request, stream the body instead of buffering it
         path = request.match_info.get("path", "")
         async with self._api_client(request, path) as client:
-            data = await client.read()
-            return web.Response(
-                body=data, status=client.status, content_type=client.content_type
-            )
+            response = web.StreamResponse(status=client.status)
+            response.content_type = client.content_type
+            if client.charset:
+                response.charset = client.charset
+            # The client session decompresses encoded responses, so the
+            # length sent by Core only matches the body if it is unencoded
+            if (
+                CONTENT_LENGTH in client.headers
+                and CONTENT_ENCODING not in client.headers
+            ):
+                response.content_length = int(client.headers[CONTENT_LENGTH])
+
+            await response.prepare(request)
+            try:
+                async for data in client.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    await response.write(data)
+            except (aiohttp.ClientError, aiohttp.ClientPayloadError) as err:
+                _LOGGER.error("Stream error on API request %s: %s", path, err)
+                return response
+
+            await response.write_eof()
+            return response
 
     async def _websocket_client(self) -> ClientWebSocketResponse:
         """Initialize a WebSocket API connection."""
@@ -196,7 +224,7 @@ class APIProxy(CoreSysAttributes):
 
     async def websocket(self, request: web.Request):
         """Initialize a WebSocket API connection."""
-        if not await self.sys_homeassistant.api.check_api_state():
+        if not await self.sys_homeassistant.api.check_api_state_cached():
             raise HTTPBadGateway()
         _LOGGER.info("Home Assistant WebSocket API request initialize")
 
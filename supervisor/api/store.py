@@ -1,14 +1,24 @@
 """Init file for Supervisor Home Assistant RESTful API."""
 import asyncio
 from collections.abc import Awaitable
+from pathlib import Path
 from typing import Any
 
 from aiohttp import web
 import voluptuous as vol
+from voluptuous.humanize import humanize_error
 
 from ..addons.manager import AnyAddon
 from ..addons.utils import rating_security
-from ..api.const import ATTR_SIGNED
+from ..api.const import (
+    ATTR_LAST_UPDATE,
+    ATTR_LAST_UPDATE_DURATION,
+    ATTR_LIMIT,
+    ATTR_OFFSET,
+    ATTR_QUERY,
+    ATTR_SIGNED,
+    ATTR_TOTAL,
+)
 from ..api.utils import api_process, api_process_raw, api_validate
 from ..const import (
     ATTR_ADDONS,
@@ -38,6 +48,7 @@ from ..const import (
     ATTR_MAINTAINER,
     ATTR_NAME,
     ATTR_RATING,
+    ATTR_RELOAD_CONCURRENCY,
     ATTR_REPOSITORIES,
     ATTR_REPOSITORY,
     ATTR_SLUG,
@@ -48,12 +59,15 @@ from ..const import (
     ATTR_VERSION,
     ATTR_VERSION_LATEST,
     REQUEST_FROM,
+    AddonStage,
 )
 from ..coresys import CoreSysAttributes
 from ..exceptions import APIError, APIForbidden
 from ..store.addon import AddonStore
 from ..store.repository import Repository
-from ..store.validate import validate_repository
+from ..store.validate import reload_concurrency, validate_repository
+from .assets import CACHE_CONTROL_IMAGE, CACHE_CONTROL_TEXT, asset_response
+from .cache import api_cache
 from .const import CONTENT_TYPE_PNG, CONTENT_TYPE_TEXT
 
 SCHEMA_UPDATE = vol.Schema(
@@ -66,6 +80,29 @@ SCHEMA_ADD_REPOSITORY = vol.Schema(
     {vol.Required(ATTR_REPOSITORY): vol.All(str, validate_repository)}
 )
 
+SCHEMA_OPTIONS = vol.Schema(
+    {vol.Optional(ATTR_RELOAD_CONCURRENCY): reload_concurrency}
+)
+
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_MAX_LIMIT = 500
+
+SCHEMA_SEARCH = vol.Schema(
+    {
+        vol.Optional(ATTR_QUERY): str,
+        vol.Optional(ATTR_REPOSITORY): str,
+        vol.Optional(ATTR_ARCH): str,
+        vol.Optional(ATTR_STAGE): vol.Coerce(AddonStage),
+        vol.Optional(ATTR_INSTALLED): vol.Boolean(),
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_LIMIT, default=SEARCH_DEFAULT_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_LIMIT)
+        ),
+    }
+)
+
 
 class APIStore(CoreSysAttributes):
     """Handle RESTful API for store functions."""
@@ -164,6 +201,10 @@ class APIStore(CoreSysAttributes):
             ATTR_SOURCE: repository.source,
             ATTR_URL: repository.url,
             ATTR_MAINTAINER: repository.maintainer,
+            ATTR_LAST_UPDATE: repository.last_update.isoformat()
+            if repository.last_update
+            else None,
+            ATTR_LAST_UPDATE_DURATION: repository.last_update_duration,
         }
 
     @api_process
@@ -171,6 +212,7 @@ class APIStore(CoreSysAttributes):
         """Reload all add-on data from store."""
         await asyncio.shield(self.sys_store.reload())
 
+    @api_cache()
     @api_process
     async def store_info(self, request: web.Request) -> dict[str, Any]:
         """Return store information."""
@@ -183,8 +225,20 @@ class APIStore(CoreSysAttributes):
                 self._generate_repository_information(repository)
                 for repository in self.sys_store.all
             ],
+            ATTR_RELOAD_CONCURRENCY: self.sys_store.reload_concurrency,
         }
 
+    @api_process
+    async def options(self, request: web.Request) -> None:
+        """Set store options."""
+        body = await api_validate(SCHEMA_OPTIONS, request)
+
+        if ATTR_RELOAD_CONCURRENCY in body:
+            self.sys_store.reload_concurrency = body[ATTR_RELOAD_CONCURRENCY]
+
+        self.sys_store.save_data()
+
+    @api_cache()
     @api_process
     async def addons_list(self, request: web.Request) -> dict[str, Any]:
         """Return all store add-ons."""
@@ -195,6 +249,42 @@ class APIStore(CoreSysAttributes):
             ]
         }
 
+    @api_cache()
+    @api_process
+    async def addons_search(self, request: web.Request) -> dict[str, Any]:
+        """Search store add-ons by query and filters with pagination."""
+        query = dict(request.query)
+        try:
+            body = SCHEMA_SEARCH(query)
+        except vol.Invalid as ex:
+            raise APIError(humanize_error(query, ex)) from None
+
+        slugs = self.sys_store.search.search(
+            body.get(ATTR_QUERY),
+            repository=body.get(ATTR_REPOSITORY),
+            arch=body.get(ATTR_ARCH),
+            stage=body.get(ATTR_STAGE),
+        )
+        addons = [
+            addon
+            for slug in slugs
+            if (addon := self.sys_addons.store.get(slug))
+            and (
+                ATTR_INSTALLED not in body or addon.is_installed == body[ATTR_INSTALLED]
+            )
+        ]
+
+        offset = body[ATTR_OFFSET]
+        return {
+            ATTR_TOTAL: len(addons),
+            ATTR_OFFSET: offset,
+            ATTR_LIMIT: body[ATTR_LIMIT],
+            ATTR_ADDONS: [
+                self._generate_addon_information(addon)
+                for addon in addons[offset : offset + body[ATTR_LIMIT]]
+            ],
+        }
+
     @api_process
     def addons_addon_install(self, request: web.Request) -> Awaitable[None]:
         """Install add-on."""
@@ -226,28 +316,44 @@ class APIStore(CoreSysAttributes):
         addon: AddonStore = self._extract_addon(request)
         return self._generate_addon_information(addon, True)
 
+    async def _asset_response(
+        self,
+        request: web.Request,
+        path: Path,
+        content_type: str,
+        cache_control: str,
+        charset: str | None = None,
+    ) -> web.Response:
+        """Return add-on asset from cache."""
+        asset = await self.sys_api.asset_cache.get(
+            path, compress=content_type == CONTENT_TYPE_TEXT
+        )
+        return asset_response(request, asset, content_type, cache_control, charset)
+
     @api_process_raw(CONTENT_TYPE_PNG)
-    async def addons_addon_icon(self, request: web.Request) -> bytes:
+    async def addons_addon_icon(self, request: web.Request) -> web.Response:
         """Return icon from add-on."""
         addon = self._extract_addon(request)
         if not addon.with_icon:
             raise APIError(f"No icon found for add-on {addon.slug}!")
 
-        with addon.path_icon.open("rb") as png:
-            return png.read()
+        return await self._asset_response(
+            request, addon.path_icon, CONTENT_TYPE_PNG, CACHE_CONTROL_IMAGE
+        )
 
     @api_process_raw(CONTENT_TYPE_PNG)
-    async def addons_addon_logo(self, request: web.Request) -> bytes:
+    async def addons_addon_logo(self, request: web.Request) -> web.Response:
         """Return logo from add-on."""
         addon = self._extract_addon(request)
         if not addon.with_logo:
             raise APIError(f"No logo found for add-on {addon.slug}!")
 
-        with addon.path_logo.open("rb") as png:
-            return png.read()
+        return await self._asset_response(
+            request, addon.path_logo, CONTENT_TYPE_PNG, CACHE_CONTROL_IMAGE
+        )
 
     @api_process_raw(CONTENT_TYPE_TEXT)
-    async def addons_addon_changelog(self, request: web.Request) -> str:
+    async def addons_addon_changelog(self, request: web.Request) -> str | web.Response:
         """Return changelog from add-on."""
         # Frontend can't handle error response here, need to return 200 and error as text for now
         try:
@@ -258,11 +364,18 @@ class APIStore(CoreSysAttributes):
         if not addon.with_changelog:
             return f"No changelog found for add-on {addon.slug}!"
 
-        with addon.path_changelog.open("r") as changelog:
-            return changelog.read()
+        return await self._asset_response(
+            request,
+            addon.path_changelog,
+            CONTENT_TYPE_TEXT,
+            CACHE_CONTROL_TEXT,
+            "utf-8",
+        )
 
     @api_process_raw(CONTENT_TYPE_TEXT)
-    async def addons_addon_documentation(self, request: web.Request) -> str:
+    async def addons_addon_documentation(
+        self, request: web.Request
+    ) -> str | web.Response:
         """Return documentation from add-on."""
         # Frontend can't handle error response here, need to return 200 and error as text for now
         try:
@@ -273,8 +386,13 @@ class APIStore(CoreSysAttributes):
         if not addon.with_documentation:
             return f"No documentation found for add-on {addon.slug}!"
 
-        with addon.path_documentation.open("r") as documentation:
-            return documentation.read()
+        return await self._asset_response(
+            request,
+            addon.path_documentation,
+            CONTENT_TYPE_TEXT,
+            CACHE_CONTROL_TEXT,
+            "utf-8",
+        )
 
     @api_process
     async def repositories_list(self, request: web.Request) -> list[dict[str, Any]]:
@@ -49,7 +49,8 @@ from ..store.validate import repositories
 from ..utils.sentry import close_sentry, init_sentry
 from ..utils.validate import validate_timezone
 from ..validate import version_tag, wait_boot
-from .const import CONTENT_TYPE_TEXT
+from .cache import api_cache
+from .const import ATTR_SETUP_TIMES, CONTENT_TYPE_TEXT
 from .utils import api_process, api_process_raw, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -82,6 +83,7 @@ class APISupervisor(CoreSysAttributes):
         """Return ok for signal that the API is ready."""
         return True
 
+    @api_cache()
     @api_process
     async def info(self, request: web.Request) -> dict[str, Any]:
         """Return host information."""
@@ -100,6 +102,10 @@ class APISupervisor(CoreSysAttributes):
             ATTR_DEBUG_BLOCK: self.sys_config.debug_block,
             ATTR_DIAGNOSTICS: self.sys_config.diagnostics,
             ATTR_AUTO_UPDATE: self.sys_updater.auto_update,
+            ATTR_SETUP_TIMES: {
+                name: round(duration, 3)
+                for name, duration in self.sys_core.setup_times.items()
+            },
             # Depricated
             ATTR_WAIT_BOOT: self.sys_config.wait_boot,
             ATTR_ADDONS: [
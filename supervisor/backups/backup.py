@@ -13,13 +13,9 @@ from pathlib import Path
 import tarfile
 from tempfile import TemporaryDirectory
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from awesomeversion import AwesomeVersion, AwesomeVersionCompareException
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from securetar import SecureTarFile, atomic_contents_add, secure_path
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
@@ -58,6 +54,12 @@ from .const import BUF_SIZE, BackupType
 from .utils import key_to_iv, password_to_key
 from .validate import SCHEMA_BACKUP
 
+# securetar and cryptography are imported on first use, they are only needed
+# while a backup is created, restored or decrypted and not at startup
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.ciphers import Cipher
+    from securetar import SecureTarFile
+
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
@@ -251,6 +253,10 @@ class Backup(JobGroup):
 
     def _init_password(self, password: str) -> None:
         """Set password + init aes cipher."""
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
         self._key = password_to_key(password)
         self._aes = Cipher(
             algorithms.AES(self._key),
@@ -263,6 +269,9 @@ class Backup(JobGroup):
         if not self._key or data is None:
             return data
 
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives import padding
+
         encrypt = self._aes.encryptor()
         padder = padding.PKCS7(128).padder()
 
@@ -274,6 +283,9 @@ class Backup(JobGroup):
         if not self._key or data is None:
             return data
 
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives import padding
+
         decrypt = self._aes.decryptor()
         padder = padding.PKCS7(128).unpadder()
 
@@ -325,6 +337,8 @@ class Backup(JobGroup):
 
     async def __aenter__(self):
         """Async context to open a backup."""
+        # pylint: disable=import-outside-toplevel
+        from securetar import SecureTarFile, secure_path
 
         # create a backup
         if not self.tarfile.is_file():
@@ -455,6 +469,8 @@ class Backup(JobGroup):
     async def _addon_restore(self, addon_slug: str) -> asyncio.Task | None:
         """Restore an add-on from backup."""
         self.sys_jobs.current.reference = addon_slug
+        # pylint: disable=import-outside-toplevel
+        from securetar import SecureTarFile
 
         tar_name = f"{addon_slug}.tar{'.gz' if self.compressed else ''}"
         addon_file = SecureTarFile(
@@ -531,6 +547,9 @@ class Backup(JobGroup):
             return
 
         def _save() -> None:
+            # pylint: disable=import-outside-toplevel
+            from securetar import atomic_contents_add
+
             # Take backup
             _LOGGER.info("Backing up folder %s", name)
 
@@ -601,6 +620,9 @@ class Backup(JobGroup):
 
         # Perform a restore
         def _restore() -> bool:
+            # pylint: disable=import-outside-toplevel
+            from securetar import SecureTarFile
+
             try:
                 _LOGGER.info("Restore folder %s", name)
                 with SecureTarFile(
@@ -664,6 +686,9 @@ class Backup(JobGroup):
 
             # Perform a restore
             def _restore() -> bool:
+                # pylint: disable=import-outside-toplevel
+                from securetar import SecureTarFile
+
                 try:
                     _LOGGER.info("Restore folder %s", name)
                     with SecureTarFile(
@@ -723,6 +748,9 @@ class Backup(JobGroup):
     @Job(name="backup_restore_homeassistant", cleanup=False)
     async def restore_homeassistant(self) -> Awaitable[None]:
         """Restore Home Assistant Core configuration folder."""
+        # pylint: disable=import-outside-toplevel
+        from securetar import SecureTarFile
+
         await self.sys_homeassistant.core.stop()
 
         # Restore Home Assistant Core config directory
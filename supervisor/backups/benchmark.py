@@ -0,0 +1,99 @@
+"""Benchmark throughput of backup locations."""
+
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from ..const import ATTR_LOCATON
+from ..utils.dt import parse_datetime
+from .const import (
+    ATTR_FSYNC_LATENCY,
+    ATTR_READ_THROUGHPUT,
+    ATTR_TIMESTAMP,
+    ATTR_WRITE_THROUGHPUT,
+)
+
+BENCHMARK_CHUNK_SIZE = 1_048_576
+BENCHMARK_FILE = ".supervisor_benchmark"
+BENCHMARK_SIZE = 16 * BENCHMARK_CHUNK_SIZE
+BENCHMARK_SYNC_SIZE = 4096
+BENCHMARK_TIMEOUT = timedelta(minutes=2)
+
+
+@dataclass(slots=True, frozen=True)
+class LocationBenchmark:
+    """Throughput (bytes per second) and fsync latency (seconds) of a location.
+
+    Location is the name of a backup mount or none for the local backup folder.
+    """
+
+    location: str | None
+    timestamp: datetime
+    write_throughput: float
+    read_throughput: float
+    fsync_latency: float
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LocationBenchmark":
+        """Create benchmark from stored dictionary."""
+        return cls(
+            data[ATTR_LOCATON],
+            parse_datetime(data[ATTR_TIMESTAMP]),
+            data[ATTR_WRITE_THROUGHPUT],
+            data[ATTR_READ_THROUGHPUT],
+            data[ATTR_FSYNC_LATENCY],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return dictionary representation."""
+        return {
+            ATTR_LOCATON: self.location,
+            ATTR_TIMESTAMP: self.timestamp.isoformat(),
+            ATTR_WRITE_THROUGHPUT: self.write_throughput,
+            ATTR_READ_THROUGHPUT: self.read_throughput,
+            ATTR_FSYNC_LATENCY: self.fsync_latency,
+        }
+
+
+def benchmark_path(path: Path) -> tuple[float, float, float]:
+    """Return write and read throughput and fsync latency of a directory.
+
+    Must be run in executor.
+    """
+    test_file = path / BENCHMARK_FILE
+    data = os.urandom(BENCHMARK_CHUNK_SIZE)
+    try:
+        # Sequential write including flush to storage
+        start = time.monotonic()
+        with test_file.open("wb") as benchmark:
+            for _ in range(BENCHMARK_SIZE // BENCHMARK_CHUNK_SIZE):
+                benchmark.write(data)
+            benchmark.flush()
+            os.fsync(benchmark.fileno())
+        write_throughput = BENCHMARK_SIZE / (time.monotonic() - start)
+
+        # Sync of a small append, like finishing a tar member
+        with test_file.open("ab") as benchmark:
+            benchmark.write(data[:BENCHMARK_SYNC_SIZE])
+            benchmark.flush()
+            start = time.monotonic()
+            os.fsync(benchmark.fileno())
+            fsync_latency = time.monotonic() - start
+
+        # Sequential read, dropping cached pages first where supported
+        with test_file.open("rb") as benchmark:
+            with suppress(AttributeError, OSError):
+                os.posix_fadvise(benchmark.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            start = time.monotonic()
+            while benchmark.read(BENCHMARK_CHUNK_SIZE):
+                pass
+        read_throughput = BENCHMARK_SIZE / (time.monotonic() - start)
+    finally:
+        with suppress(OSError):
+            test_file.unlink()
+
+    return write_throughput, read_throughput, fsync_latency
@@ -4,6 +4,15 @@ from enum import StrEnum
 BUF_SIZE = 2**20 * 4  # 4MB
 DEFAULT_FREEZE_TIMEOUT = 600
 
+ATTR_BACKUP_WINDOW = "backup_window"
+ATTR_BENCHMARKS = "benchmarks"
+ATTR_FSYNC_LATENCY = "fsync_latency"
+ATTR_READ_THROUGHPUT = "read_throughput"
+ATTR_TIMESTAMP = "timestamp"
+ATTR_WRITE_THROUGHPUT = "write_throughput"
+
+LOCATION_AUTO = "auto"
+
 
 class BackupType(StrEnum):
     """Backup type enum."""
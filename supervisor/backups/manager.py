@@ -10,6 +10,7 @@ from pathlib import Path
 from ..addons.addon import Addon
 from ..const import (
     ATTR_DAYS_UNTIL_STALE,
+    ATTR_LOCATON,
     FILE_HASSIO_BACKUPS,
     FOLDER_HOMEASSISTANT,
     CoreState,
@@ -31,7 +32,15 @@ from ..utils.dt import utcnow
 from ..utils.sentinel import DEFAULT
 from ..utils.sentry import capture_exception
 from .backup import Backup
-from .const import DEFAULT_FREEZE_TIMEOUT, BackupJobStage, BackupType, RestoreJobStage
+from .benchmark import BENCHMARK_TIMEOUT, LocationBenchmark, benchmark_path
+from .const import (
+    ATTR_BACKUP_WINDOW,
+    ATTR_BENCHMARKS,
+    DEFAULT_FREEZE_TIMEOUT,
+    BackupJobStage,
+    BackupType,
+    RestoreJobStage,
+)
 from .utils import create_slug
 from .validate import ALL_FOLDERS, SCHEMA_BACKUPS_CONFIG
 
@@ -64,6 +73,24 @@ class BackupManager(FileConfiguration, JobGroup):
         """Set days until backup is considered stale."""
         self._data[ATTR_DAYS_UNTIL_STALE] = value
 
+    @property
+    def backup_window(self) -> int | None:
+        """Get longest time in seconds a backup may take, none if unlimited."""
+        return self._data[ATTR_BACKUP_WINDOW]
+
+    @backup_window.setter
+    def backup_window(self, value: int | None) -> None:
+        """Set longest time in seconds a backup may take."""
+        self._data[ATTR_BACKUP_WINDOW] = value
+
+    @property
+    def benchmarks(self) -> dict[str | None, LocationBenchmark]:
+        """Return last benchmark of backup locations by mount name, none for local."""
+        return {
+            benchmark[ATTR_LOCATON]: LocationBenchmark.from_dict(benchmark)
+            for benchmark in self._data[ATTR_BENCHMARKS]
+        }
+
     @property
     def backup_locations(self) -> list[Path]:
         """List of locations containing backups."""
@@ -77,6 +104,193 @@ class BackupManager(FileConfiguration, JobGroup):
         """Return backup object."""
         return self._backups.get(slug)
 
+    async def _check_location(
+        self,
+        location: Mount | type[DEFAULT] | None = DEFAULT,
+        *,
+        partial: bool = False,
+        addons: Iterable[str] = (),
+        folders: Iterable[str] = (),
+        homeassistant: bool = False,
+    ) -> None:
+        """Check location responds and takes a backup within the backup window."""
+        if location == DEFAULT:
+            location = self.sys_mounts.default_backup_mount
+
+        if (
+            location
+            and (probe := await self.sys_mounts.monitor.check(location))
+            and probe.error
+        ):
+            raise BackupMountDownError(
+                f"{location.name} is not responding, cannot back-up to it: {probe.error}",
+                _LOGGER.error,
+            )
+
+        name = location.name if location else None
+        if self._exceeds_window(
+            self.benchmarks.get(name),
+            await self._estimate_backup_size(partial, addons, folders, homeassistant),
+        ):
+            raise BackupError(
+                f"Backup to {name or 'local backup folder'} would take longer than the backup window",
+                _LOGGER.error,
+            )
+
+    async def _estimate_backup_size(
+        self,
+        partial: bool = False,
+        addons: Iterable[str] = (),
+        folders: Iterable[str] = (),
+        homeassistant: bool = False,
+    ) -> int | None:
+        """Return estimated size in bytes of a backup, none if unknown.
+
+        Full backups are estimated by the newest full backup. Partial backups
+        by the last accounted space used by their add-ons and folders, before
+        compression.
+        """
+        if partial:
+            if not (usage := self.sys_host.disk_usage.usage):
+                return None
+            folders = set(folders)
+            if homeassistant:
+                folders.add(FOLDER_HOMEASSISTANT)
+            return sum(usage.addons.get(slug, 0) for slug in addons) + sum(
+                usage.folders.get(folder, 0) for folder in folders
+            )
+
+        full_backups = [
+            backup for backup in self.list_backups if backup.sys_type == BackupType.FULL
+        ]
+        if not full_backups:
+            return None
+
+        newest = max(full_backups, key=lambda backup: backup.date)
+        try:
+            return (await self.sys_run_in_executor(newest.tarfile.stat)).st_size
+        except OSError:
+            return None
+
+    def _exceeds_window(
+        self, benchmark: LocationBenchmark | None, size: int | None
+    ) -> bool:
+        """Return true if writing size bytes takes longer than the backup window."""
+        if not self.backup_window or not benchmark or size is None:
+            return False
+        return size / benchmark.write_throughput > self.backup_window
+
+    @Job(
+        name="backup_manager_benchmark",
+        conditions=[JobCondition.RUNNING],
+        limit=JobExecutionLimit.ONCE,
+        on_condition=BackupJobError,
+    )
+    async def benchmark_locations(self) -> dict[str | None, LocationBenchmark]:
+        """Measure throughput of local backup folder and responding backup mounts.
+
+        Runs outside of the backup lock to not hold up backups, it is skipped
+        while a backup or restore runs as it would measure their load.
+        """
+        if self.active_job:
+            raise BackupJobError(
+                "Can't benchmark backup locations while a backup or restore runs",
+                _LOGGER.info,
+            )
+
+        locations: dict[str | None, Path] = {None: self.sys_config.path_backup}
+        for mount in self.sys_mounts.backup_mounts:
+            probe = await self.sys_mounts.monitor.check(mount)
+            if probe and not probe.error:
+                locations[mount.name] = mount.local_where
+
+        # One after another, locations may share a disk or network link
+        benchmarks: dict[str | None, LocationBenchmark] = {}
+        for name, path in locations.items():
+            try:
+                write, read, fsync = await self._benchmark_location(name, path)
+            except (OSError, TimeoutError) as err:
+                _LOGGER.warning(
+                    "Can't benchmark backup location %s: %s",
+                    name or "local backup folder",
+                    err,
+                )
+                continue
+
+            benchmarks[name] = LocationBenchmark(name, utcnow(), write, read, fsync)
+            _LOGGER.info(
+                "Backup location %s writes %.1f MB/s, reads %.1f MB/s, fsync takes %.1f ms",
+                name or "local backup folder",
+                write / 1_000_000,
+                read / 1_000_000,
+                fsync * 1000,
+            )
+
+        self._data[ATTR_BENCHMARKS] = [
+            benchmark.to_dict() for benchmark in benchmarks.values()
+        ]
+        self.save_data()
+        return benchmarks
+
+    async def _benchmark_location(
+        self, name: str | None, path: Path
+    ) -> tuple[float, float, float]:
+        """Benchmark a location, raising TimeoutError if it takes too long."""
+        if name is None:
+            async with asyncio.timeout(BENCHMARK_TIMEOUT.total_seconds()):
+                return await self.sys_run_in_executor(benchmark_path, path)
+
+        # Executor threads can't be abandoned on a share which hangs. The
+        # benchmark file is removed once the worker returns.
+        worker = self.sys_mounts.monitor.run_in_worker(name, benchmark_path, path)
+        await asyncio.wait({worker}, timeout=BENCHMARK_TIMEOUT.total_seconds())
+        if not worker.done():
+            raise TimeoutError(
+                f"No response within {BENCHMARK_TIMEOUT.total_seconds()} seconds"
+            )
+        return worker.result()
+
+    async def select_location(
+        self,
+        *,
+        partial: bool = False,
+        addons: Iterable[str] = (),
+        folders: Iterable[str] = (),
+        homeassistant: bool = False,
+    ) -> Mount | None:
+        """Return fastest healthy backup location fitting the backup window.
+
+        None is the local backup folder.
+        """
+        if not (benchmarks := self.benchmarks):
+            benchmarks = await self.benchmark_locations()
+        size = await self._estimate_backup_size(partial, addons, folders, homeassistant)
+
+        candidates: list[tuple[float, Mount | None]] = []
+        for location in [None, *self.sys_mounts.backup_mounts]:
+            if location and (
+                location.state != UnitActiveState.ACTIVE
+                or self.sys_mounts.monitor.is_degraded(location.name)
+            ):
+                continue
+
+            benchmark = benchmarks.get(location.name if location else None)
+            if benchmark and not self._exceeds_window(benchmark, size):
+                candidates.append((benchmark.write_throughput, location))
+
+        if not candidates:
+            raise BackupError(
+                "No healthy backup location can take a backup within the backup window",
+                _LOGGER.error,
+            )
+
+        _, location = max(candidates, key=lambda candidate: candidate[0])
+        _LOGGER.info(
+            "Selected %s as fastest backup location",
+            location.name if location else "local backup folder",
+        )
+        return location
+
     def _get_base_path(self, location: Mount | type[DEFAULT] | None = DEFAULT) -> Path:
         """Get base path for backup using location or default location."""
         if location == DEFAULT and self.sys_mounts.default_backup_mount:
@@ -318,6 +532,7 @@ class BackupManager(FileConfiguration, JobGroup):
         homeassistant_exclude_database: bool | None = None,
     ) -> Backup | None:
         """Create a full backup."""
+        await self._check_location(location)
         if self._get_base_path(location) == self.sys_config.path_backup:
             await Job.check_conditions(
                 self, {JobCondition.FREE_SPACE}, "BackupManager.do_backup_full"
@@ -358,6 +573,13 @@ class BackupManager(FileConfiguration, JobGroup):
         homeassistant_exclude_database: bool | None = None,
     ) -> Backup | None:
         """Create a partial backup."""
+        await self._check_location(
+            location,
+            partial=True,
+            addons=addons or [],
+            folders=folders or [],
+            homeassistant=homeassistant,
+        )
         if self._get_base_path(location) == self.sys_config.path_backup:
             await Job.check_conditions(
                 self, {JobCondition.FREE_SPACE}, "BackupManager.do_backup_partial"
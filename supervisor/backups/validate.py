@@ -6,7 +6,15 @@ from typing import Any
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
 
-from ..backups.const import BackupType
+from ..backups.const import (
+    ATTR_BACKUP_WINDOW,
+    ATTR_BENCHMARKS,
+    ATTR_FSYNC_LATENCY,
+    ATTR_READ_THROUGHPUT,
+    ATTR_TIMESTAMP,
+    ATTR_WRITE_THROUGHPUT,
+    BackupType,
+)
 from ..const import (
     ATTR_ADDONS,
     ATTR_COMPRESSED,
@@ -17,6 +25,7 @@ from ..const import (
     ATTR_EXCLUDE_DATABASE,
     ATTR_FOLDERS,
     ATTR_HOMEASSISTANT,
+    ATTR_LOCATON,
     ATTR_NAME,
     ATTR_PROTECTED,
     ATTR_REPOSITORIES,
@@ -81,6 +90,7 @@ def v1_protected(protected: bool | str) -> bool:
 
 # pylint: disable=no-value-for-parameter
 days_until_stale = vol.All(vol.Coerce(int), vol.Range(min=1))
+backup_window = vol.Maybe(vol.All(vol.Coerce(int), vol.Range(min=60)))
 
 SCHEMA_BACKUP = vol.Schema(
     {
@@ -135,9 +145,22 @@ SCHEMA_BACKUP = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+SCHEMA_LOCATION_BENCHMARK = vol.Schema(
+    {
+        vol.Required(ATTR_LOCATON): vol.Maybe(str),
+        vol.Required(ATTR_TIMESTAMP): str,
+        vol.Required(ATTR_WRITE_THROUGHPUT): vol.Coerce(float),
+        vol.Required(ATTR_READ_THROUGHPUT): vol.Coerce(float),
+        vol.Required(ATTR_FSYNC_LATENCY): vol.Coerce(float),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
 SCHEMA_BACKUPS_CONFIG = vol.Schema(
     {
         vol.Optional(ATTR_DAYS_UNTIL_STALE, default=30): days_until_stale,
+        vol.Optional(ATTR_BACKUP_WINDOW, default=None): backup_window,
+        vol.Optional(ATTR_BENCHMARKS, default=list): [SCHEMA_LOCATION_BENCHMARK],
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -23,11 +23,13 @@ FILE_HASSIO_AUTH = Path(SUPERVISOR_DATA, "auth.json")
 FILE_HASSIO_BACKUPS = Path(SUPERVISOR_DATA, "backups.json")
 FILE_HASSIO_BOARD = Path(SUPERVISOR_DATA, "board.json")
 FILE_HASSIO_CONFIG = Path(SUPERVISOR_DATA, "config.json")
+FILE_HASSIO_DBUS_INTROSPECTION = Path(SUPERVISOR_DATA, "dbus_introspection.json")
 FILE_HASSIO_DISCOVERY = Path(SUPERVISOR_DATA, "discovery.json")
 FILE_HASSIO_DOCKER = Path(SUPERVISOR_DATA, "docker.json")
 FILE_HASSIO_HOMEASSISTANT = Path(SUPERVISOR_DATA, "homeassistant.json")
 FILE_HASSIO_INGRESS = Path(SUPERVISOR_DATA, "ingress.json")
 FILE_HASSIO_SERVICES = Path(SUPERVISOR_DATA, "services.json")
+FILE_HASSIO_STORE_INDEX = Path(SUPERVISOR_DATA, "store_index.json")
 FILE_HASSIO_UPDATER = Path(SUPERVISOR_DATA, "updater.json")
 FILE_HASSIO_SECURITY = Path(SUPERVISOR_DATA, "security.json")
 
@@ -278,6 +280,7 @@ ATTR_RATING = "rating"
 ATTR_READY = "ready"
 ATTR_REALTIME = "realtime"
 ATTR_REFRESH_TOKEN = "refresh_token"
+ATTR_RELOAD_CONCURRENCY = "reload_concurrency"
 ATTR_REGISTRIES = "registries"
 ATTR_REGISTRY = "registry"
 ATTR_REPOSITORIES = "repositories"
@@ -464,6 +467,7 @@ class BusEvent(StrEnum):
     """Bus event type."""
 
     DOCKER_CONTAINER_STATE_CHANGE = "docker_container_state_change"
+    HARDWARE_DEVICES_CHANGED = "hardware_devices_changed"
     HARDWARE_NEW_DEVICE = "hardware_new_device"
     HARDWARE_REMOVE_DEVICE = "hardware_remove_device"
     SUPERVISOR_JOB_END = "supervisor_job_end"
@@ -1,9 +1,11 @@
 """Main file for Supervisor."""
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
+from dataclasses import dataclass
 from datetime import timedelta
 import logging
+import time
 
 from .const import (
     ATTR_STARTUP,
@@ -31,6 +33,15 @@ from .utils.whoami import WhoamiData, retrieve_whoami
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class SetupPhase:
+    """Step of setup, run once the phases named in after are done."""
+
+    name: str
+    load: Callable[[], Awaitable[None]]
+    after: tuple[str, ...] = ()
+
+
 class Core(CoreSysAttributes):
     """Main object of Supervisor."""
 
@@ -39,12 +50,18 @@ class Core(CoreSysAttributes):
         self.coresys: CoreSys = coresys
         self._state: CoreState | None = None
         self.exit_code: int = 0
+        self._setup_times: dict[str, float] = {}
 
     @property
     def state(self) -> CoreState:
         """Return state of the core."""
         return self._state
 
+    @property
+    def setup_times(self) -> dict[str, float]:
+        """Return duration in seconds of each setup phase."""
+        return self._setup_times
+
     @property
     def supported(self) -> bool:
         """Return true if the installation is supported."""
@@ -117,58 +134,66 @@ class Core(CoreSysAttributes):
         # Check internet on startup
         await self.sys_supervisor.check_connectivity()
 
-        # Order can be important!
-        setup_loads: list[Awaitable[None]] = [
+        # Phases run as soon as the phases they depend on are done
+        phases: list[SetupPhase] = [
             # rest api views
-            self.sys_api.load(),
+            SetupPhase("api", self.sys_api.load),
             # Load Host Hardware
-            self.sys_hardware.load(),
+            SetupPhase("hardware", self.sys_hardware.load),
             # Load DBus
-            self.sys_dbus.load(),
+            SetupPhase("dbus", self.sys_dbus.load),
             # Load Host
-            self.sys_host.load(),
-            # Adjust timezone / time settings
-            self._adjust_system_datetime(),
+            SetupPhase("host", self.sys_host.load, ("dbus", "hardware")),
+            # Adjust timezone / time settings, TLS needs a correct clock
+            SetupPhase("datetime", self._adjust_system_datetime, ("host",)),
             # Load mounts
-            self.sys_mounts.load(),
+            SetupPhase("mounts", self.sys_mounts.load, ("host",)),
             # Load Docker manager
-            self.sys_docker.load(),
+            SetupPhase("docker", self.sys_docker.load),
             # load last available data
-            self.sys_updater.load(),
+            SetupPhase("updater", self.sys_updater.load, ("datetime",)),
+            # Load CPU/Arch
+            SetupPhase("arch", self.sys_arch.load),
             # Load Plugins container
-            self.sys_plugins.load(),
+            SetupPhase("plugins", self.sys_plugins.load, ("docker", "updater", "arch")),
             # Load Home Assistant
-            self.sys_homeassistant.load(),
-            # Load CPU/Arch
-            self.sys_arch.load(),
+            SetupPhase("homeassistant", self.sys_homeassistant.load, ("plugins",)),
             # Load HassOS
-            self.sys_os.load(),
+            SetupPhase("os", self.sys_os.load, ("host",)),
             # Load Stores
-            self.sys_store.load(),
+            SetupPhase("store", self.sys_store.load, ("datetime", "arch")),
             # Load Add-ons
-            self.sys_addons.load(),
+            SetupPhase("addons", self.sys_addons.load, ("store", "homeassistant")),
             # load last available data
-            self.sys_backups.load(),
+            SetupPhase("backups", self.sys_backups.load, ("mounts",)),
             # load services
-            self.sys_services.load(),
+            SetupPhase("services", self.sys_services.load),
             # Load discovery
-            self.sys_discovery.load(),
+            SetupPhase("discovery", self.sys_discovery.load),
             # Load ingress
-            self.sys_ingress.load(),
-            # Load Resoulution
-            self.sys_resolution.load(),
+            SetupPhase("ingress", self.sys_ingress.load, ("addons",)),
         ]
+        # Load Resoulution, its healthcheck looks at everything else
+        phases.append(
+            SetupPhase(
+                "resolution",
+                self.sys_resolution.load,
+                tuple(phase.name for phase in phases),
+            )
+        )
 
-        # Execute each load task in secure context
-        for setup_task in setup_loads:
-            try:
-                await setup_task
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.critical(
-                    "Fatal error happening on load Task %s: %s", setup_task, err
-                )
-                self.sys_resolution.unhealthy = UnhealthyReason.SETUP
-                capture_exception(err)
+        start = time.monotonic()
+        await self._run_setup_phases(phases)
+        _LOGGER.info(
+            "Setup took %.2f seconds, slowest phases: %s",
+            time.monotonic() - start,
+            ", ".join(
+                f"{name} {duration:.2f}s"
+                for name, duration in sorted(
+                    self._setup_times.items(), key=lambda item: item[1], reverse=True
+                )[:5]
+            ),
+        )
 
         # Set OS Agent diagnostics if needed
         if (
@@ -190,6 +215,42 @@ class Core(CoreSysAttributes):
         # Evaluate the system
         await self.sys_resolution.evaluate.evaluate_system()
 
+    async def _run_setup_phase(
+        self, phase: SetupPhase, dependencies: list[asyncio.Task]
+    ) -> None:
+        """Run setup phase after its dependencies in secure context."""
+        if dependencies:
+            await asyncio.wait(dependencies)
+
+        start = time.monotonic()
+        try:
+            await phase.load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.critical(
+                "Fatal error happening on load Task %s: %s", phase.name, err
+            )
+            self.sys_resolution.unhealthy = UnhealthyReason.SETUP
+            capture_exception(err)
+        finally:
+            self._setup_times[phase.name] = time.monotonic() - start
+            _LOGGER.debug(
+                "Setup phase %s took %.2f seconds",
+                phase.name,
+                self._setup_times[phase.name],
+            )
+
+    async def _run_setup_phases(self, phases: list[SetupPhase]) -> None:
+        """Run setup phases, independent ones concurrently.
+
+        Phases must be listed after the phases they depend on.
+        """
+        tasks: dict[str, asyncio.Task] = {}
+        for phase in phases:
+            tasks[phase.name] = self.sys_create_task(
+                self._run_setup_phase(phase, [tasks[name] for name in phase.after])
+            )
+        await asyncio.wait(tasks.values())
+
     async def start(self):
         """Start Supervisor orchestration."""
         self.state = CoreState.STARTUP
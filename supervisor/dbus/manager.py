@@ -1,13 +1,15 @@
 """D-Bus interface objects."""
 import asyncio
+from contextlib import suppress
 import logging
 
 from dbus_fast import BusType
 from dbus_fast.aio.message_bus import MessageBus
 
-from ..const import SOCKET_DBUS
+from ..const import FILE_HASSIO_DBUS_INTROSPECTION, SOCKET_DBUS
 from ..coresys import CoreSys, CoreSysAttributes
-from ..exceptions import DBusFatalError
+from ..exceptions import DBusFatalError, JsonFileError
+from ..utils.dbus import INTROSPECTION_CACHE
 from .agent import OSAgent
 from .hostname import Hostname
 from .interface import DBusInterface
@@ -122,6 +124,9 @@ class DBusManager(CoreSysAttributes):
 
         _LOGGER.info("Connected to system D-Bus.")
 
+        await self.sys_run_in_executor(
+            INTROSPECTION_CACHE.load, FILE_HASSIO_DBUS_INTROSPECTION
+        )
         errors = await asyncio.gather(
             *[dbus.connect(self.bus) for dbus in self.all], return_exceptions=True
         )
@@ -135,6 +140,15 @@ class DBusManager(CoreSysAttributes):
                 )
 
         self.sys_host.supported_features.cache_clear()
+        await self.save_introspection()
+
+    async def save_introspection(self) -> None:
+        """Store introspection of connected objects for next start."""
+        # Errors are logged on write, starting without cache is fine
+        with suppress(JsonFileError):
+            await self.sys_run_in_executor(
+                INTROSPECTION_CACHE.save, FILE_HASSIO_DBUS_INTROSPECTION
+            )
 
     async def unload(self) -> None:
         """Close connection to D-Bus."""
@@ -142,6 +156,7 @@ class DBusManager(CoreSysAttributes):
             _LOGGER.warning("No D-Bus connection to close.")
             return
 
+        await self.save_introspection()
         for dbus in self.all:
             dbus.shutdown()
 
@@ -1,4 +1,5 @@
 """Network Manager implementation for DBUS."""
+import asyncio
 import logging
 from typing import Any
 
@@ -11,18 +12,23 @@ from ...exceptions import (
     DBusInterfaceError,
     DBusNoReplyError,
     DBusServiceUnkownError,
+    HassioNotSupportedError,
     HostNotSupportedError,
     NetworkInterfaceNotFound,
 )
+from ...utils.dbus import managed_objects, read_property
 from ...utils.sentry import capture_exception
 from ..const import (
     DBUS_ATTR_CONNECTION_ENABLED,
+    DBUS_ATTR_DEVICE_TYPE,
     DBUS_ATTR_DEVICES,
     DBUS_ATTR_PRIMARY_CONNECTION,
     DBUS_ATTR_VERSION,
+    DBUS_IFACE_DEVICE,
     DBUS_IFACE_NM,
     DBUS_NAME_NM,
     DBUS_OBJECT_BASE,
+    DBUS_OBJECT_FREEDESKTOP,
     DBUS_OBJECT_NM,
     ConnectivityState,
     DeviceType,
@@ -39,6 +45,10 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 MINIMAL_VERSION = AwesomeVersion("1.14.6")
 
+SUPPORTED_DEVICE_TYPES = frozenset(
+    {DeviceType.ETHERNET, DeviceType.WIRELESS, DeviceType.VLAN}
+)
+
 
 class NetworkManager(DBusInterfaceProxy):
     """Handle D-Bus interface for Network Manager.
@@ -58,6 +68,7 @@ class NetworkManager(DBusInterfaceProxy):
         self._dns: NetworkManagerDNS = NetworkManagerDNS()
         self._settings: NetworkManagerSettings = NetworkManagerSettings()
         self._interfaces: dict[str, NetworkInterface] = {}
+        self._devices: dict[str, NetworkInterface | None] = {}
 
     @property
     def dns(self) -> NetworkManagerDNS:
@@ -141,8 +152,7 @@ class NetworkManager(DBusInterfaceProxy):
         _LOGGER.info("Load dbus interface %s", self.name)
         try:
             await super().connect(bus)
-            await self.dns.connect(bus)
-            await self.settings.connect(bus)
+            await asyncio.gather(self.dns.connect(bus), self.settings.connect(bus))
         except DBusError:
             _LOGGER.warning("Can't connect to Network Manager")
         except (DBusServiceUnkownError, DBusInterfaceError):
@@ -182,85 +192,148 @@ class NetworkManager(DBusInterfaceProxy):
         if not changed and self.dns.is_connected:
             await self.dns.update()
 
-        if changed and (
-            DBUS_ATTR_DEVICES not in changed
-            or {intr.object_path for intr in self.interfaces if intr.managed}.issubset(
-                set(changed[DBUS_ATTR_DEVICES])
-            )
+        if not changed:
+            await self._reconcile_devices(update=True)
+        elif DBUS_ATTR_DEVICES in changed:
+            # Docker adds and removes veths with every container, only connect
+            # added devices. Connected devices receive changes through signals.
+            await self._reconcile_devices(update=False)
+        elif DBUS_ATTR_PRIMARY_CONNECTION in changed:
+            self._update_interfaces()
+
+    async def _reconcile_devices(self, *, update: bool) -> None:
+        """Connect added devices and disconnect removed ones.
+
+        With update, devices connected already are updated as well.
+        """
+        devices: list[str] = self.properties[DBUS_ATTR_DEVICES]
+
+        # Disconnect removed devices
+        for device in self._devices.keys() - set(devices):
+            if interface := self._devices.pop(device):
+                interface.shutdown()
+
+        load = [
+            device
+            for device in devices
+            if device not in self._devices
+            or (update and self._devices[device] is not None)
+        ]
+        synced = {device for device in load if self._is_synced(device)}
+
+        # Bring up all devices at once, sharing one GetManagedObjects call
+        async with managed_objects(
+            self.dbus.bus,
+            DBUS_NAME_NM,
+            DBUS_OBJECT_FREEDESKTOP,
+            self.properties.get(DBUS_ATTR_VERSION),
         ):
-            # If none of our managed devices were removed then most likely this is just veths changing.
-            # We don't care about veths and reprocessing all their changes can swamp a system when
-            # docker is having issues. This does mean we may miss activation of a new managed device
-            # in rare occaisions but we'll catch it on the next host update scheduled task.
-            return
+            results = await asyncio.gather(
+                *[self._load_interface(device) for device in load],
+                return_exceptions=True,
+            )
 
-        interfaces: dict[str, NetworkInterface] = {}
-        curr_devices = {intr.object_path: intr for intr in self.interfaces}
-        for device in self.properties[DBUS_ATTR_DEVICES]:
-            if device in curr_devices and curr_devices[device].is_connected:
-                interface = curr_devices[device]
-                await interface.update()
+        # Store connected devices first, so none is lost when giving up below
+        failed: list[tuple[str, Exception]] = []
+        for device, interface in zip(load, results):
+            if isinstance(interface, Exception):
+                failed.append((device, interface))
             else:
-                interface = NetworkInterface(device)
-
-                # Connect to interface
-                try:
-                    await interface.connect(self.dbus.bus)
-                except (DBusFatalError, DBusInterfaceError) as err:
-                    # Docker creates and deletes interfaces quite often, sometimes
-                    # this causes a race condition: A device disappears while we
-                    # try to query it. Ignore those cases.
-                    _LOGGER.debug("Can't process %s: %s", device, err)
-                    continue
-                except (
-                    DBusNoReplyError,
-                    DBusServiceUnkownError,
-                ) as err:
-                    # This typically means that NetworkManager disappeared. Give up immeaditly.
-                    _LOGGER.error(
-                        "NetworkManager not responding while processing %s: %s. Giving up.",
-                        device,
-                        err,
-                    )
-                    capture_exception(err)
-                    return
-                except Exception as err:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Unkown error while processing %s: %s", device, err
-                    )
-                    capture_exception(err)
-                    continue
-
-            # Skeep interface
+                self._devices[device] = interface
+
+        for device, interface in failed:
+            if device in synced:
+                raise interface
+            self._devices.pop(device, None)
+
+            if isinstance(interface, (DBusFatalError, DBusInterfaceError)):
+                # Docker creates and deletes interfaces quite often, sometimes
+                # this causes a race condition: A device disappears while we
+                # try to query it. Ignore those cases.
+                _LOGGER.debug("Can't process %s: %s", device, interface)
+                continue
+            if isinstance(interface, (DBusNoReplyError, DBusServiceUnkownError)):
+                # This typically means that NetworkManager disappeared. Give up immeaditly.
+                _LOGGER.error(
+                    "NetworkManager not responding while processing %s: %s. Giving up.",
+                    device,
+                    interface,
+                )
+                capture_exception(interface)
+                break
+
+            _LOGGER.error(
+                "Unkown error while processing %s: %s",
+                device,
+                interface,
+                exc_info=interface,
+            )
+            capture_exception(interface)
+
+        self._update_interfaces()
+
+    def _is_synced(self, device: str) -> bool:
+        """Return true if device is connected and kept up to date by signals."""
+        interface = self._devices.get(device)
+        return bool(interface and interface.is_connected and interface.sync_properties)
+
+    async def _load_interface(self, device: str) -> NetworkInterface | None:
+        """Update connected interface of device or connect to it.
+
+        Returns none for devices of types not handled, like veths.
+        """
+        if self._is_synced(device):
+            interface = self._devices[device]
+            await interface.update()
+            return interface
+
+        # Unmanaged devices don't sync, connect again to pick up changes
+        if interface := self._devices.get(device):
+            interface.shutdown()
+
+        if not await self._is_supported_device(device):
+            return None
+
+        interface = NetworkInterface(device)
+        await interface.connect(self.dbus.bus)
+        return interface
+
+    async def _is_supported_device(self, device: str) -> bool:
+        """Return true if device has a type handled by Supervisor."""
+        try:
+            device_type = await read_property(
+                self.dbus.bus,
+                DBUS_NAME_NM,
+                device,
+                DBUS_IFACE_DEVICE,
+                DBUS_ATTR_DEVICE_TYPE,
+            )
+        except (DBusError, HassioNotSupportedError) as err:
+            # Connecting reports the problem if there is one
+            _LOGGER.debug("Can't read type of %s: %s", device, err)
+            return True
+        return device_type in SUPPORTED_DEVICE_TYPES
+
+    def _update_interfaces(self) -> None:
+        """Rebuild lookup of managed interfaces and mark the primary one."""
+        interfaces: dict[str, NetworkInterface] = {}
+        for interface in self._devices.values():
             if (
-                interface.type
-                not in [
-                    DeviceType.ETHERNET,
-                    DeviceType.WIRELESS,
-                    DeviceType.VLAN,
-                ]
+                not interface
+                or not interface.is_connected
+                or interface.type not in SUPPORTED_DEVICE_TYPES
                 or not interface.managed
             ):
                 continue
 
-            if (
+            interface.primary = bool(
                 interface.connection
                 and interface.connection.object_path
                 == self.properties[DBUS_ATTR_PRIMARY_CONNECTION]
-            ):
-                interface.primary = True
-            else:
-                interface.primary = False
-
+            )
             interfaces[interface.name] = interface
             interfaces[interface.hw_address] = interface
 
-        # Disconnect removed devices
-        for device in set(curr_devices.keys()) - set(
-            self.properties[DBUS_ATTR_DEVICES]
-        ):
-            curr_devices[device].shutdown()
-
         self._interfaces = interfaces
 
     def shutdown(self) -> None:
@@ -274,7 +347,9 @@ class NetworkManager(DBusInterfaceProxy):
 
     def disconnect(self) -> None:
         """Disconnect from D-Bus."""
-        for intr in self.interfaces:
-            intr.shutdown()
+        for intr in self._devices.values():
+            if intr:
+                intr.shutdown()
+        self._devices.clear()
 
         super().disconnect()
@@ -12,6 +12,7 @@ from ...exceptions import (
     DBusObjectError,
     DBusServiceUnkownError,
 )
+from ...utils.dbus import managed_objects
 from ..const import (
     DBUS_ATTR_SUPPORTED_FILESYSTEMS,
     DBUS_ATTR_VERSION,
@@ -89,52 +90,83 @@ class UDisks2Manager(DBusInterfaceProxy):
         await super().update(changed)
 
         if not changed:
-            # Cache block devices
-            block_devices = await self.dbus.Manager.call_get_block_devices(
-                UDISKS2_DEFAULT_OPTIONS
-            )
-
-            unchanged_blocks = self._block_devices.keys() & set(block_devices)
-            for removed in self._block_devices.keys() - set(block_devices):
-                self._block_devices[removed].shutdown()
-
-            self._block_devices = {
-                device: self._block_devices[device]
-                if device in unchanged_blocks
-                else await UDisks2Block.new(device, self.dbus.bus)
-                for device in block_devices
-            }
+            # Bring up all devices at once, sharing one GetManagedObjects call
+            async with managed_objects(
+                self.dbus.bus,
+                DBUS_NAME_UDISKS2,
+                DBUS_OBJECT_UDISKS2,
+                self.properties.get(DBUS_ATTR_VERSION),
+            ):
+                await self._update_devices()
+
+    async def _update_devices(self) -> None:
+        """Rebuild cache of available block devices and drives."""
+        # Cache block devices
+        block_devices = await self.dbus.Manager.call_get_block_devices(
+            UDISKS2_DEFAULT_OPTIONS
+        )
 
-            # For existing block devices, need to check their type and call update
-            await asyncio.gather(
-                *[self._block_devices[path].check_type() for path in unchanged_blocks]
-            )
-            await asyncio.gather(
-                *[self._block_devices[path].update() for path in unchanged_blocks]
+        unchanged_blocks = self._block_devices.keys() & set(block_devices)
+        for removed in self._block_devices.keys() - set(block_devices):
+            self._block_devices[removed].shutdown()
+
+        new_blocks = [
+            device for device in block_devices if device not in unchanged_blocks
+        ]
+        connected_blocks = dict(
+            zip(
+                new_blocks,
+                await asyncio.gather(
+                    *[UDisks2Block.new(device, self.dbus.bus) for device in new_blocks]
+                ),
             )
+        )
+        self._block_devices = {
+            device: self._block_devices[device]
+            if device in unchanged_blocks
+            else connected_blocks[device]
+            for device in block_devices
+        }
+
+        # For existing block devices, need to check their type and call update
+        await asyncio.gather(
+            *[self._block_devices[path].check_type() for path in unchanged_blocks]
+        )
+        await asyncio.gather(
+            *[self._block_devices[path].update() for path in unchanged_blocks]
+        )
 
-            # Cache drives
-            drives = {
-                device.drive
-                for device in self.block_devices
-                if device.drive != DBUS_OBJECT_BASE
-            }
-
-            unchanged_drives = self._drives.keys() & set(drives)
-            for removed in self._drives.keys() - drives:
-                self._drives[removed].shutdown()
-
-            self._drives = {
-                drive: self._drives[drive]
-                if drive in self._drives
-                else await UDisks2Drive.new(drive, self.dbus.bus)
-                for drive in drives
-            }
-
-            # Update existing drives
-            await asyncio.gather(
-                *[self._drives[path].update() for path in unchanged_drives]
+        # Cache drives
+        drives = {
+            device.drive
+            for device in self.block_devices
+            if device.drive != DBUS_OBJECT_BASE
+        }
+
+        unchanged_drives = self._drives.keys() & set(drives)
+        for removed in self._drives.keys() - drives:
+            self._drives[removed].shutdown()
+
+        new_drives = list(drives - unchanged_drives)
+        connected_drives = dict(
+            zip(
+                new_drives,
+                await asyncio.gather(
+                    *[UDisks2Drive.new(drive, self.dbus.bus) for drive in new_drives]
+                ),
             )
+        )
+        self._drives = {
+            drive: self._drives[drive]
+            if drive in unchanged_drives
+            else connected_drives[drive]
+            for drive in drives
+        }
+
+        # Update existing drives
+        await asyncio.gather(
+            *[self._drives[path].update() for path in unchanged_drives]
+        )
 
     @property
     @dbus_property
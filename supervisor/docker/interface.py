@@ -94,6 +94,7 @@ class DockerInterface(JobGroup):
         self.coresys: CoreSys = coresys
         self.docker = dockerAPI or self.sys_docker
         self._meta: dict[str, Any] | None = None
+        self._pulled: dict[str, str] = {}
 
     @property
     def timeout(self) -> int:
@@ -230,33 +231,61 @@ class DockerInterface(JobGroup):
         arch: CpuArch | None = None,
     ) -> None:
         """Pull docker image."""
+        docker_image = await self._pull_image(version, image, latest, arch)
+        self._meta = docker_image.attrs
+
+    @Job(
+        name="docker_interface_pull",
+        limit=JobExecutionLimit.GROUP_ONCE,
+        on_condition=DockerJobError,
+    )
+    async def pull(
+        self,
+        version: AwesomeVersion,
+        image: str | None = None,
+        arch: CpuArch | None = None,
+    ) -> None:
+        """Pull and validate docker image without using it yet.
+
+        A following install or update of this image uses it as is.
+        """
         image = image or self.image
-        arch = arch or self.sys_arch.supervisor
+        docker_image = await self._pull_image(version, image, arch=arch)
+        self._pulled[f"{image}:{version!s}"] = docker_image.id
+
+    async def _get_pulled_image(
+        self, image: str, version: AwesomeVersion
+    ) -> Image | None:
+        """Return image validated by a previous pull if it is unchanged."""
+        if not (image_id := self._pulled.pop(f"{image}:{version!s}", None)):
+            return None
 
-        _LOGGER.info("Downloading docker image %s with tag %s.", image, version)
         try:
-            if self.docker.config.registries:
-                # Try login if we have defined credentials
-                await self._docker_login(image)
-
-            # Pull new image
             docker_image = await self.sys_run_in_executor(
-                self.docker.images.pull,
-                f"{image}:{version!s}",
-                platform=MAP_ARCH[arch],
+                self.docker.images.get, f"{image}:{version!s}"
             )
+        except (docker.errors.DockerException, requests.RequestException):
+            return None
+        return docker_image if docker_image.id == image_id else None
 
-            # Validate content
-            try:
-                await self._validate_trust(docker_image.id, image, version)
-            except CodeNotaryError:
-                with suppress(docker.errors.DockerException):
-                    await self.sys_run_in_executor(
-                        self.docker.images.remove,
-                        image=f"{image}:{version!s}",
-                        force=True,
-                    )
-                raise
+    async def _pull_image(
+        self,
+        version: AwesomeVersion,
+        image: str | None = None,
+        latest: bool = False,
+        arch: CpuArch | None = None,
+    ) -> Image:
+        """Pull and validate docker image unless a previous pull did."""
+        image = image or self.image
+        arch = arch or self.sys_arch.supervisor
+
+        try:
+            if docker_image := await self._get_pulled_image(image, version):
+                _LOGGER.info(
+                    "Using pulled docker image %s with tag %s.", image, version
+                )
+            else:
+                docker_image = await self._download_image(version, image, arch)
 
             # Tag latest
             if latest:
@@ -294,7 +323,36 @@ class DockerInterface(JobGroup):
                 _LOGGER.error,
             ) from err
 
-        self._meta = docker_image.attrs
+        return docker_image
+
+    async def _download_image(
+        self, version: AwesomeVersion, image: str, arch: CpuArch
+    ) -> Image:
+        """Pull docker image from registry and validate its content."""
+        _LOGGER.info("Downloading docker image %s with tag %s.", image, version)
+        if self.docker.config.registries:
+            # Try login if we have defined credentials
+            await self._docker_login(image)
+
+        # Pull new image
+        docker_image = await self.sys_run_in_executor(
+            self.docker.images.pull,
+            f"{image}:{version!s}",
+            platform=MAP_ARCH[arch],
+        )
+
+        # Validate content
+        try:
+            await self._validate_trust(docker_image.id, image, version)
+        except CodeNotaryError:
+            with suppress(docker.errors.DockerException):
+                await self.sys_run_in_executor(
+                    self.docker.images.remove,
+                    image=f"{image}:{version!s}",
+                    force=True,
+                )
+            raise
+        return docker_image
 
     async def exists(self) -> bool:
         """Return True if Docker image exists in local repository."""
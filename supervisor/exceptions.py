@@ -607,6 +607,10 @@ class StoreGitCloneError(StoreGitError):
     """Raise if error occurred while cloning repository."""
 
 
+class StoreGitTimeoutError(StoreGitError):
+    """Raise if a git command was killed for running past its deadline."""
+
+
 class StoreNotFound(StoreError):
     """Raise if slug is not known."""
 
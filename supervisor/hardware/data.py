@@ -52,3 +52,16 @@ class Device:
             {attr: udevice.properties[attr] for attr in udevice.properties},
             [Path(node.sys_path) for node in udevice.children],
         )
+
+
+@attr.s(slots=True, frozen=True)
+class DeviceChanges:
+    """Devices added and removed within one batch of udev events."""
+
+    added: list[Device] = attr.ib(factory=list)
+    removed: list[Device] = attr.ib(factory=list)
+
+    @property
+    def devices(self) -> list[Device]:
+        """Return all changed devices."""
+        return self.added + self.removed
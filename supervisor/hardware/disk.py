@@ -111,10 +111,10 @@ class HwDisk(CoreSysAttributes):
         # Return the pessimistic estimate (0x02 -> 10%-20%, return 20%)
         return life_time_value * 10.0
 
-    def get_disk_life_time(self, path: str | Path) -> float:
+    def get_disk_life_time(self, path: str | Path) -> float | None:
         """Return life time estimate of the underlying SSD drive."""
         mount_source = self._get_mount_source(str(path))
-        if mount_source == "overlay":
+        if mount_source is None or mount_source == "overlay":
             return None
 
         mount_source_path = Path(mount_source)
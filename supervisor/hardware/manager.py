@@ -25,6 +25,13 @@ class HardwareManager(CoreSysAttributes):
         self._devices: dict[str, Device] = {}
         self._udev = pyudev.Context()
 
+        # Secondary indexes, maintained by update_device/delete_device
+        self._by_node: dict[Path, Device] = {}
+        self._by_sysfs: dict[Path, Device] = {}
+        self._by_link: dict[Path, Device] = {}
+        self._by_subsystem: dict[str, dict[str, Device]] = {}
+        self._parent_subsystems: dict[Path, frozenset[str]] = {}
+
         self._montior: HwMonitor = HwMonitor(coresys)
         self._helper: HwHelper = HwHelper(coresys)
         self._policy: HwPolicy = HwPolicy(coresys)
@@ -57,29 +64,31 @@ class HardwareManager(CoreSysAttributes):
 
     def get_by_path(self, device_node: Path) -> Device:
         """Get Device by path."""
-        for device in self.devices:
-            if device_node in (device.path, device.sysfs):
-                return device
-            if device_node in device.links:
-                return device
+        if device := (
+            self._by_node.get(device_node)
+            or self._by_sysfs.get(device_node)
+            or self._by_link.get(device_node)
+        ):
+            return device
         raise HardwareNotFound()
 
     def filter_devices(self, subsystem: UdevSubsystem | None = None) -> list[Device]:
         """Return a filtered list."""
-        devices = set()
-        for device in self.devices:
-            if subsystem and device.subsystem != subsystem:
-                continue
-            devices.add(device)
-        return list(devices)
+        if not subsystem:
+            return self.devices
+        return list(self._by_subsystem.get(subsystem, {}).values())
 
     def update_device(self, device: Device) -> None:
         """Update or add a (new) Device."""
+        if old_device := self._devices.get(device.name):
+            self._unindex_device(old_device)
         self._devices[device.name] = device
+        self._index_device(device)
 
     def delete_device(self, device: Device) -> None:
         """Remove a device from the list."""
-        self._devices.pop(device.name, None)
+        if old_device := self._devices.pop(device.name, None):
+            self._unindex_device(old_device)
 
     def exists_device_node(self, device_node: Path) -> bool:
         """Check if device exists on Host."""
@@ -91,21 +100,59 @@ class HardwareManager(CoreSysAttributes):
 
     def check_subsystem_parents(self, device: Device, subsystem: UdevSubsystem) -> bool:
         """Return True if the device is part of the given subsystem parent."""
-        udev_device: pyudev.Device = pyudev.Devices.from_sys_path(
-            self._udev, str(device.sysfs)
-        )
-        return udev_device.find_parent(subsystem) is not None
+        if (parent_subsystems := self._parent_subsystems.get(device.sysfs)) is None:
+            udev_device: pyudev.Device = pyudev.Devices.from_sys_path(
+                self._udev, str(device.sysfs)
+            )
+            parent_subsystems = frozenset(
+                parent.subsystem for parent in udev_device.ancestors
+            )
+            self._parent_subsystems[device.sysfs] = parent_subsystems
+
+        return subsystem in parent_subsystems
+
+    def _index_device(self, device: Device) -> None:
+        """Add device to secondary indexes."""
+        self._by_node[device.path] = device
+        self._by_sysfs[device.sysfs] = device
+        for link in device.links:
+            self._by_link[link] = device
+        self._by_subsystem.setdefault(device.subsystem, {})[device.name] = device
+
+    def _unindex_device(self, device: Device) -> None:
+        """Remove device from secondary indexes."""
+        for index, keys in (
+            (self._by_node, [device.path]),
+            (self._by_sysfs, [device.sysfs]),
+            (self._by_link, device.links),
+        ):
+            for key in keys:
+                if index.get(key) is device:
+                    del index[key]
+
+        if (subsystem := self._by_subsystem.get(device.subsystem)) is not None:
+            subsystem.pop(device.name, None)
+            if not subsystem:
+                del self._by_subsystem[device.subsystem]
+
+        # Parents can change with a replug, ask udev again next time
+        self._parent_subsystems.pop(device.sysfs, None)
 
     def _import_devices(self) -> None:
         """Import fresh from udev database."""
         self._devices.clear()
+        self._by_node.clear()
+        self._by_sysfs.clear()
+        self._by_link.clear()
+        self._by_subsystem.clear()
+        self._parent_subsystems.clear()
 
         # Exctract all devices
         for device in self._udev.list_devices():
             # Skip devices without mapping
             if not device.device_node or self.helper.hide_virtual_device(device):
                 continue
-            self._devices[device.sys_name] = Device.import_udev(device)
+            self.update_device(Device.import_udev(device))
 
     async def load(self) -> None:
         """Load hardware backend."""
@@ -1,5 +1,8 @@
 """Supervisor Hardware monitor based on udev."""
 import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import timedelta
 import logging
 from pathlib import Path
 from pprint import pformat
@@ -11,10 +14,23 @@ from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import HardwareNotFound
 from ..resolution.const import UnhealthyReason
 from .const import HardwareAction, UdevKernelAction
-from .data import Device
+from .data import Device, DeviceChanges
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Events of a device within this window are processed together
+UDEV_EVENT_WINDOW = timedelta(seconds=1)
+UDEV_INIT_TIMEOUT = timedelta(seconds=6)
+UDEV_POLL_INTERVAL = timedelta(milliseconds=500)
+
+
+@dataclass(slots=True)
+class PendingEvent:
+    """Latest kernel event of a sysfs path within the coalescing window."""
+
+    kernel: pyudev.Device
+    added: bool
+
 
 class HwMonitor(CoreSysAttributes):
     """Hardware monitor for supervisor."""
@@ -25,6 +41,11 @@ class HwMonitor(CoreSysAttributes):
         self.context = pyudev.Context()
         self.monitor: pyudev.Monitor | None = None
         self.observer: pyudev.MonitorObserver | None = None
+        self.udev_observer: pyudev.MonitorObserver | None = None
+        self._pending: dict[str, PendingEvent] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._process_lock: asyncio.Lock = asyncio.Lock()
+        self._udev_ready: dict[str, asyncio.Event] = {}
 
     async def load(self) -> None:
         """Start hardware monitor."""
@@ -45,8 +66,31 @@ class HwMonitor(CoreSysAttributes):
             self.observer.start()
             _LOGGER.info("Started Supervisor hardware monitor")
 
+        # Events from udev itself tell when it is done with a device
+        try:
+            udev_monitor = pyudev.Monitor.from_netlink(self.context, "udev")
+            self.udev_observer = pyudev.MonitorObserver(
+                udev_monitor,
+                callback=lambda x: self.sys_loop.call_soon_threadsafe(
+                    self._udev_ready_events, x
+                ),
+            )
+        except OSError as err:
+            _LOGGER.warning(
+                "Can't monitor udev, polling for device initialization: %s", err
+            )
+        else:
+            self.udev_observer.start()
+
     async def unload(self) -> None:
         """Shutdown sessions."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self.udev_observer is not None:
+            self.udev_observer.stop()
+
         if self.observer is None:
             return
 
@@ -59,69 +103,146 @@ class HwMonitor(CoreSysAttributes):
 
         if kernel.action in (UdevKernelAction.UNBIND, UdevKernelAction.BIND):
             return
-        self.sys_create_task(self._async_udev_events(kernel))
 
-    async def _async_udev_events(self, kernel: pyudev.Device):
-        """Incomming events from udev into loop."""
-        # Update device List
-        if not kernel.device_node or self.sys_hardware.helper.hide_virtual_device(
-            kernel
-        ):
-            return
+        # udev has to process this event again before device can be used
+        self._udev_ready.setdefault(kernel.sys_path, asyncio.Event()).clear()
 
-        hw_action: HardwareAction | None = None
-        device: Device | None = None
+        # Coalesce events per device, latest state wins but an add is kept
+        added = kernel.action == UdevKernelAction.ADD
+        if pending := self._pending.get(kernel.sys_path):
+            pending.kernel = kernel
+            pending.added |= added
+        else:
+            self._pending[kernel.sys_path] = PendingEvent(kernel, added)
 
-        ##
-        # Remove
-        if kernel.action == UdevKernelAction.REMOVE:
-            try:
-                device = self.sys_hardware.get_by_path(Path(kernel.sys_path))
-            except HardwareNotFound:
-                return
-            else:
-                self.sys_hardware.delete_device(device)
-                hw_action = HardwareAction.REMOVE
+        if self._flush_handle is None:
+            self._flush_handle = self.sys_loop.call_later(
+                UDEV_EVENT_WINDOW.total_seconds(), self._flush_events
+            )
+
+    def _udev_ready_events(self, udev: pyudev.Device):
+        """Incomming events from udev once it processed a device."""
+        if ready := self._udev_ready.get(udev.sys_path):
+            ready.set()
+
+    def _flush_events(self) -> None:
+        """Process events collected in the coalescing window as one batch."""
+        self._flush_handle = None
+        events = list(self._pending.values())
+        self._pending.clear()
+        self.sys_create_task(self._async_udev_events(events))
+
+    async def _async_udev_events(self, events: list[PendingEvent]):
+        """Incomming events from udev into loop."""
+        async with self._process_lock:
+            changes = DeviceChanges()
+            waiting: list[PendingEvent] = []
+
+            for event in events:
+                kernel = event.kernel
+                # Update device List
+                if (
+                    not kernel.device_node
+                    or self.sys_hardware.helper.hide_virtual_device(kernel)
+                ):
+                    continue
+
+                ##
+                # Remove
+                if kernel.action == UdevKernelAction.REMOVE:
+                    try:
+                        device = self.sys_hardware.get_by_path(Path(kernel.sys_path))
+                    except HardwareNotFound:
+                        continue
+                    self.sys_hardware.delete_device(device)
+                    changes.removed.append(device)
+
+                ##
+                # Add
+                elif kernel.action in (UdevKernelAction.ADD, UdevKernelAction.CHANGE):
+                    waiting.append(event)
 
-        ##
-        # Add
-        if kernel.action in (UdevKernelAction.ADD, UdevKernelAction.CHANGE):
             # We get pure Kernel events only inside container.
             # But udev itself need also time to initialize the device
             # before we can use it correctly
-            udev = None
-            for _ in range(3):
-                await asyncio.sleep(2)
-                try:
-                    udev = pyudev.Devices.from_sys_path(self.context, kernel.sys_path)
-                except pyudev.DeviceNotFoundAtPathError:
+            udevs = await asyncio.gather(
+                *[
+                    self._wait_udev_device(event.kernel.sys_path, event.added)
+                    for event in waiting
+                ]
+            )
+            for event, udev in zip(waiting, udevs):
+                # Is not ready
+                if not udev:
+                    _LOGGER.warning(
+                        "Ignore device %s / failes to initialize by udev",
+                        event.kernel.sys_path,
+                    )
                     continue
-                if udev.is_initialized:
-                    break
 
-            # Is not ready
-            if not udev:
-                _LOGGER.warning(
-                    "Ignore device %s / failes to initialize by udev", kernel.sys_path
-                )
-                return
+                device = Device.import_udev(udev)
+                self.sys_hardware.update_device(device)
 
-            device = Device.import_udev(udev)
-            self.sys_hardware.update_device(device)
+                # If it's a new device - process actions
+                if event.added:
+                    changes.added.append(device)
 
-            # If it's a new device - process actions
-            if kernel.action == UdevKernelAction.ADD:
-                hw_action = HardwareAction.ADD
+            for event in events:
+                if event.kernel.sys_path not in self._pending:
+                    self._udev_ready.pop(event.kernel.sys_path, None)
 
-        # Ignore event for future processing
-        if device is None or hw_action is None:
+        if not changes.devices:
             return
-        _LOGGER.info(
-            "Detecting %s hardware %s - %s", hw_action, device.path, device.by_id
-        )
 
-        # Fire Hardware event to bus
-        if hw_action == HardwareAction.ADD:
+        # Fire Hardware events to bus
+        for device in changes.added:
+            _LOGGER.info(
+                "Detecting %s hardware %s - %s",
+                HardwareAction.ADD,
+                device.path,
+                device.by_id,
+            )
             self.sys_bus.fire_event(BusEvent.HARDWARE_NEW_DEVICE, device)
-        elif hw_action == HardwareAction.REMOVE:
+        for device in changes.removed:
+            _LOGGER.info(
+                "Detecting %s hardware %s - %s",
+                HardwareAction.REMOVE,
+                device.path,
+                device.by_id,
+            )
             self.sys_bus.fire_event(BusEvent.HARDWARE_REMOVE_DEVICE, device)
+
+        self.sys_bus.fire_event(BusEvent.HARDWARE_DEVICES_CHANGED, changes)
+
+    async def _wait_udev_device(
+        self, sys_path: str, new_device: bool
+    ) -> pyudev.Device | None:
+        """Return udev device once udev processed it or timeout passed.
+
+        Only a new device is known to be done once udev marks it initialized. A
+        changed device already is, for it only the event of udev tells that its
+        rules ran again.
+        """
+        ready = self._udev_ready.setdefault(sys_path, asyncio.Event())
+        deadline = self.sys_loop.time() + UDEV_INIT_TIMEOUT.total_seconds()
+        udev: pyudev.Device | None = None
+
+        while True:
+            try:
+                udev = pyudev.Devices.from_sys_path(self.context, sys_path)
+            except pyudev.DeviceNotFoundAtPathError:
+                pass
+            else:
+                if ready.is_set() or (new_device and udev.is_initialized):
+                    return udev
+
+            if (remaining := deadline - self.sys_loop.time()) <= 0:
+                return udev
+            timeout = min(remaining, UDEV_POLL_INTERVAL.total_seconds())
+
+            if self.udev_observer:
+                # udev reports when it is done, wake up early for that
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(ready.wait(), timeout)
+            else:
+                await asyncio.sleep(timeout)
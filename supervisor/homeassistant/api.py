@@ -14,7 +14,8 @@ from ..exceptions import HomeAssistantAPIError, HomeAssistantAuthError
 from ..jobs.const import JobExecutionLimit
 from ..jobs.decorator import Job
 from ..utils import check_port, version_is_new_enough
-from .const import LANDINGPAGE
+from ..utils.dt import utcnow
+from .const import API_STATE_CACHE_TTL, LANDINGPAGE
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -32,6 +33,10 @@ class HomeAssistantAPI(CoreSysAttributes):
         self.access_token: str | None = None
         self._access_token_expires: datetime | None = None
 
+        # Last known API state, refreshed by the watchdog
+        self._api_running: bool = False
+        self._api_state_updated: datetime | None = None
+
     @Job(
         name="home_assistant_api_ensure_access_token",
         limit=JobExecutionLimit.SINGLE_WAIT,
@@ -167,6 +172,25 @@ class HomeAssistantAPI(CoreSysAttributes):
 
     async def check_api_state(self) -> bool:
         """Return Home Assistant Core state if up."""
+        running = False
         if state := await self.get_api_state():
-            return state == "RUNNING"
-        return False
+            running = state == "RUNNING"
+
+        self._api_running = running
+        self._api_state_updated = utcnow()
+        return running
+
+    async def check_api_state_cached(self) -> bool:
+        """Return last known Home Assistant Core state if recent, else check it."""
+        if (
+            self._api_running
+            and self._api_state_updated
+            and utcnow() - self._api_state_updated <= API_STATE_CACHE_TTL
+        ):
+            return True
+        return await self.check_api_state()
+
+    def invalidate_api_state(self) -> None:
+        """Forget the last known API state so the next check probes Core."""
+        self._api_running = False
+        self._api_state_updated = None
@@ -14,6 +14,7 @@ WATCHDOG_MAX_ATTEMPTS = 5
 WATCHDOG_THROTTLE_PERIOD = timedelta(minutes=30)
 WATCHDOG_THROTTLE_MAX_CALLS = 10
 SAFE_MODE_FILENAME = PurePath("safe-mode")
+API_STATE_CACHE_TTL = timedelta(seconds=150)
 
 CLOSING_STATES = [
     CoreState.SHUTDOWN,
@@ -11,7 +11,6 @@ from tempfile import TemporaryDirectory
 from uuid import UUID
 
 from awesomeversion import AwesomeVersion, AwesomeVersionException
-from securetar import atomic_contents_add, secure_path
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
@@ -384,6 +383,9 @@ class HomeAssistant(FileConfiguration, CoreSysAttributes):
 
                 # Backup data config folder
                 def _write_tarfile():
+                    # pylint: disable=import-outside-toplevel
+                    from securetar import atomic_contents_add
+
                     with tar_file as backup:
                         # Backup metadata
                         backup.add(temp, arcname=".")
@@ -426,6 +428,9 @@ class HomeAssistant(FileConfiguration, CoreSysAttributes):
             # extract backup
             def _extract_tarfile():
                 """Extract tar backup."""
+                # pylint: disable=import-outside-toplevel
+                from securetar import secure_path
+
                 with tar_file as backup:
                     backup.extractall(
                         path=temp_path,
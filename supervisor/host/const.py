@@ -3,6 +3,7 @@ from enum import StrEnum
 
 PARAM_BOOT_ID = "_BOOT_ID"
 PARAM_FOLLOW = "follow"
+PARAM_PRIORITY = "PRIORITY"
 PARAM_SYSLOG_IDENTIFIER = "SYSLOG_IDENTIFIER"
 
 
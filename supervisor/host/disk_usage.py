@@ -0,0 +1,224 @@
+"""Account disk space used by Supervisor data directories."""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import stat
+
+from ..const import (
+    FOLDER_ADDONS,
+    FOLDER_HOMEASSISTANT,
+    FOLDER_MEDIA,
+    FOLDER_SHARE,
+    FOLDER_SSL,
+)
+from ..coresys import CoreSys, CoreSysAttributes
+from ..dbus.const import UnitActiveState
+from ..utils.dt import utcnow
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Files changing size in place don't touch the mtime of their directory.
+# Files at least this large, like databases and logs, are checked on every scan.
+DISK_USAGE_TRACKED_FILE_SIZE = 1024 * 1024
+
+# Folders backups can include, relative to the Supervisor data directory
+DISK_USAGE_FOLDERS = [
+    FOLDER_HOMEASSISTANT,
+    FOLDER_SHARE,
+    FOLDER_ADDONS,
+    FOLDER_SSL,
+    FOLDER_MEDIA,
+]
+
+
+@dataclass(slots=True)
+class _Directory:
+    """Cached scan result of a single directory.
+
+    Size covers the directory itself and its small files, large files are
+    tracked by name.
+    """
+
+    mtime_ns: int
+    size: int
+    subdirs: list[str]
+    large_files: dict[str, int]
+
+
+@dataclass(slots=True, frozen=True)
+class DiskUsage:
+    """Space used (bytes) by add-on data, backup locations and backup folders."""
+
+    timestamp: datetime
+    addons: dict[str, int] = field(default_factory=dict)
+    backups: dict[str | None, int] = field(default_factory=dict)
+    folders: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def share(self) -> int:
+        """Return space used by share folder."""
+        return self.folders.get(FOLDER_SHARE, 0)
+
+
+class DirectoryScanner:
+    """Sum up space used by directory trees, caching totals per directory.
+
+    The listing and file sizes of a directory are only read again if its
+    modification time changed, only its large files are checked otherwise.
+    Small files growing in place are picked up once their directory changes.
+    Not thread-safe, only one scan may run at a time.
+    """
+
+    def __init__(self):
+        """Initialize directory scanner."""
+        self._cache: dict[str, _Directory] = {}
+
+    def scan(self, roots: list[Path]) -> dict[Path, int]:
+        """Return space used by each root directory.
+
+        Must be run in executor.
+        """
+        visited: set[str] = set()
+        sizes = {root: self._scan_tree(str(root), visited) for root in roots}
+
+        for path in self._cache.keys() - visited:
+            del self._cache[path]
+        return sizes
+
+    def _scan_tree(self, root: str, visited: set[str]) -> int:
+        """Return space used by a directory tree without crossing mount points."""
+        try:
+            device = os.lstat(root).st_dev
+        except OSError as err:
+            _LOGGER.debug("Can't read %s: %s", root, err)
+            return 0
+
+        total = 0
+        pending = [root]
+        while pending:
+            path = pending.pop()
+            if (directory := self._scan_directory(path, device)) is None:
+                continue
+
+            visited.add(path)
+            total += directory.size + sum(directory.large_files.values())
+            pending.extend(os.path.join(path, name) for name in directory.subdirs)
+        return total
+
+    def _scan_directory(self, path: str, device: int) -> _Directory | None:
+        """Return size of files directly in directory and its subdirectories."""
+        try:
+            dir_stat = os.lstat(path)
+        except OSError:
+            return None
+        if dir_stat.st_dev != device:
+            return None
+
+        cached = self._cache.get(path)
+        if cached and cached.mtime_ns == dir_stat.st_mtime_ns:
+            for name in cached.large_files:
+                try:
+                    file_stat = os.lstat(os.path.join(path, name))
+                except OSError:
+                    continue
+                cached.large_files[name] = file_stat.st_blocks * 512
+            return cached
+
+        size = dir_stat.st_blocks * 512
+        subdirs: list[str] = []
+        large_files: dict[str, int] = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if stat.S_ISDIR(entry_stat.st_mode):
+                        subdirs.append(entry.name)
+                    elif entry_stat.st_size >= DISK_USAGE_TRACKED_FILE_SIZE:
+                        large_files[entry.name] = entry_stat.st_blocks * 512
+                    else:
+                        size += entry_stat.st_blocks * 512
+        except OSError as err:
+            _LOGGER.debug("Can't list %s: %s", path, err)
+            return None
+
+        directory = _Directory(dir_stat.st_mtime_ns, size, subdirs, large_files)
+        self._cache[path] = directory
+        return directory
+
+
+class DiskUsageControl(CoreSysAttributes):
+    """Track space used by add-on data, backups and backup folders."""
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize disk usage control."""
+        self.coresys: CoreSys = coresys
+        self._scanner: DirectoryScanner = DirectoryScanner()
+        self._usage: DiskUsage | None = None
+        self._update: asyncio.Task | None = None
+
+    @property
+    def usage(self) -> DiskUsage | None:
+        """Return result of last scan, none if there was no scan yet."""
+        return self._usage
+
+    def get_addon_usage(self, slug: str) -> int | None:
+        """Return space used by data of an add-on from last scan."""
+        if not self._usage:
+            return None
+        return self._usage.addons.get(slug)
+
+    async def _scan(self) -> DiskUsage:
+        """Scan directories in executor and store result."""
+        addons = {addon.slug: addon.path_data for addon in self.sys_addons.installed}
+        backups = {None: self.sys_config.path_backup}
+        skipped: dict[str | None, int] = {}
+        for mount in self.sys_mounts.backup_mounts:
+            if mount.state != UnitActiveState.ACTIVE:
+                continue
+
+            # Walking a hung share would block the executor thread for good
+            if self.sys_mounts.monitor.is_degraded(mount.name):
+                _LOGGER.debug("Skip disk usage scan of degraded mount %s", mount.name)
+                if self._usage and mount.name in self._usage.backups:
+                    skipped[mount.name] = self._usage.backups[mount.name]
+                continue
+            backups[mount.name] = mount.local_where
+        folders = {
+            folder: self.sys_config.path_supervisor / folder
+            for folder in DISK_USAGE_FOLDERS
+        }
+
+        sizes = await self.sys_run_in_executor(
+            self._scanner.scan,
+            [*addons.values(), *backups.values(), *folders.values()],
+        )
+        self._usage = DiskUsage(
+            timestamp=utcnow(),
+            addons={slug: sizes[path] for slug, path in addons.items()},
+            backups={name: sizes[path] for name, path in backups.items()} | skipped,
+            folders={folder: sizes[path] for folder, path in folders.items()},
+        )
+        _LOGGER.debug("Disk usage scan of %d directories completed", len(sizes))
+        return self._usage
+
+    async def update(self) -> DiskUsage:
+        """Scan directories for changes.
+
+        Callers arriving while a scan runs share its result.
+        """
+        if not self._update or self._update.done():
+            self._update = self.sys_create_task(self._scan())
+        return await asyncio.shield(self._update)
+
+    async def get_usage(self) -> DiskUsage:
+        """Return result of last scan, scanning if there was none yet."""
+        if self._usage:
+            return self._usage
+        return await self.update()
@@ -1,14 +1,53 @@
 """Info control for host."""
 import asyncio
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime
 import logging
+from uuid import UUID
 
 from ..coresys import CoreSysAttributes
 from ..dbus.const import MulticastProtocolEnabled
-from ..exceptions import DBusError, HostError
+from ..exceptions import DBusError, HostError, JobNotFound
+from ..utils.dt import utcnow
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# With a sample every 30 minutes this covers the last day
+DISK_METRICS_HISTORY = 48
+
+# Jobs writing enough data to the disk to take a new sample when they end
+DISK_METRICS_JOBS = frozenset(
+    {
+        "addon_manager_install",
+        "addon_manager_rebuild",
+        "addon_manager_restore",
+        "addon_manager_update",
+        "addon_uninstall",
+        "backup_manager_full_backup",
+        "backup_manager_full_restore",
+        "backup_manager_partial_backup",
+        "backup_manager_partial_restore",
+        "data_disk_migrate",
+        "home_assistant_core_install",
+        "home_assistant_core_rebuild",
+        "home_assistant_core_update",
+        "os_manager_update",
+    }
+)
+
+
+@dataclass(slots=True, frozen=True)
+class DiskMetrics:
+    """Sample of disk usage for the supervisor data directory."""
+
+    timestamp: datetime
+    total_space: float
+    used_space: float
+    free_space: float
+    disk_life_time: float | None
+
 
 class InfoCenter(CoreSysAttributes):
     """Handle local system information controls."""
@@ -16,6 +55,10 @@ class InfoCenter(CoreSysAttributes):
     def __init__(self, coresys):
         """Initialize system center handling."""
         self.coresys = coresys
+        self._disk_metrics: DiskMetrics | None = None
+        self._disk_history: deque[DiskMetrics] = deque(maxlen=DISK_METRICS_HISTORY)
+        self._disk_sample: asyncio.Task | None = None
+        self._disk_jobs: set[UUID] = set()
 
     @property
     def hostname(self) -> str | None:
@@ -102,38 +145,113 @@ class InfoCenter(CoreSysAttributes):
         return self.sys_dbus.systemd.boot_timestamp
 
     @property
-    def total_space(self) -> float:
+    def disk_metrics(self) -> DiskMetrics | None:
+        """Return latest disk usage sample."""
+        return self._disk_metrics
+
+    @property
+    def disk_history(self) -> list[DiskMetrics]:
+        """Return recent disk usage samples, oldest first."""
+        return list(self._disk_history)
+
+    @property
+    def total_space(self) -> float | None:
         """Return total space (GiB) on disk for supervisor data directory."""
-        return self.sys_hardware.disk.get_disk_total_space(
-            self.coresys.config.path_supervisor
-        )
+        return self._disk_metrics.total_space if self._disk_metrics else None
 
     @property
-    def used_space(self) -> float:
+    def used_space(self) -> float | None:
         """Return used space (GiB) on disk for supervisor data directory."""
-        return self.sys_hardware.disk.get_disk_used_space(
-            self.coresys.config.path_supervisor
-        )
+        return self._disk_metrics.used_space if self._disk_metrics else None
 
     @property
-    def free_space(self) -> float:
+    def free_space(self) -> float | None:
         """Return available space (GiB) on disk for supervisor data directory."""
-        return self.sys_hardware.disk.get_disk_free_space(
-            self.coresys.config.path_supervisor
-        )
+        return self._disk_metrics.free_space if self._disk_metrics else None
 
     @property
-    def disk_life_time(self) -> float:
+    def disk_life_time(self) -> float | None:
         """Return the estimated life-time usage (in %) of the SSD storing the data directory."""
-        return self.sys_hardware.disk.get_disk_life_time(
-            self.coresys.config.path_supervisor
-        )
+        return self._disk_metrics.disk_life_time if self._disk_metrics else None
 
     @property
     def virtualization(self) -> str | None:
         """Return virtualization hypervisor being used."""
         return self.sys_dbus.systemd.virtualization
 
+    def _sample_disk_metrics(self) -> DiskMetrics:
+        """Read disk usage of supervisor data directory.
+
+        Must be run in executor.
+        """
+        path = self.coresys.config.path_supervisor
+        return DiskMetrics(
+            timestamp=utcnow(),
+            total_space=self.sys_hardware.disk.get_disk_total_space(path),
+            used_space=self.sys_hardware.disk.get_disk_used_space(path),
+            free_space=self.sys_hardware.disk.get_disk_free_space(path),
+            disk_life_time=self.sys_hardware.disk.get_disk_life_time(path),
+        )
+
+    async def load(self) -> None:
+        """Take first disk usage sample."""
+        try:
+            await self.record_disk_metrics()
+        except OSError as err:
+            _LOGGER.warning("Can't read disk usage: %s", err)
+
+    async def _update_disk_metrics(self) -> DiskMetrics:
+        """Take a disk usage sample in executor."""
+        self._disk_metrics = await self.sys_run_in_executor(self._sample_disk_metrics)
+        return self._disk_metrics
+
+    async def update_disk_metrics(self) -> DiskMetrics:
+        """Take a new disk usage sample.
+
+        Callers arriving while a sample is taken share its result.
+        """
+        if not self._disk_sample or self._disk_sample.done():
+            self._disk_sample = self.sys_create_task(self._update_disk_metrics())
+        return await asyncio.shield(self._disk_sample)
+
+    async def record_disk_metrics(self) -> DiskMetrics:
+        """Take a new disk usage sample and add it to the history.
+
+        Only the scheduled sample is recorded, keeping the history evenly spaced.
+        """
+        metrics = await self.update_disk_metrics()
+        self._disk_history.append(metrics)
+        return metrics
+
+    async def get_free_space(self) -> float:
+        """Read available space (GiB) on disk for supervisor data directory."""
+        return await self.sys_run_in_executor(
+            self.sys_hardware.disk.get_disk_free_space,
+            self.coresys.config.path_supervisor,
+        )
+
+    async def get_disk_metrics(self) -> DiskMetrics:
+        """Return latest disk usage sample, taking one if there is none yet."""
+        if self._disk_metrics:
+            return self._disk_metrics
+        return await self.update_disk_metrics()
+
+    async def disk_job_started(self, uuid: UUID) -> None:
+        """Remember jobs which change disk usage."""
+        with suppress(JobNotFound):
+            if self.sys_jobs.get_job(uuid).name in DISK_METRICS_JOBS:
+                self._disk_jobs.add(uuid)
+
+    async def disk_job_ended(self, uuid: UUID) -> None:
+        """Sample disk usage after a job which changed it."""
+        if uuid not in self._disk_jobs:
+            return
+        self._disk_jobs.discard(uuid)
+        try:
+            await self.update_disk_metrics()
+        except OSError as err:
+            _LOGGER.warning("Can't read disk usage: %s", err)
+
     async def get_dmesg(self) -> bytes:
         """Return host dmesg output."""
         proc = await asyncio.create_subprocess_shell(
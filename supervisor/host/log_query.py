@@ -0,0 +1,156 @@
+"""Aggregate journal entries streamed as JSON from systemd-journal-gatewayd."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import re
+from re import _parser as sre_parse  # pylint: disable=import-private-name
+import time
+from typing import Any
+
+from ..utils.json import json_loads
+
+# Entries are parsed and matched in the executor in batches of this many lines
+LOG_QUERY_BATCH_SIZE = 1000
+LOG_QUERY_READ_SIZE = 64 * 1024
+LOG_QUERY_MAX_ENTRIES = 100000
+LOG_QUERY_MAX_BUCKETS = 1000
+# Identifiers beyond this count are summed up as IDENTIFIER_OTHER
+LOG_QUERY_MAX_IDENTIFIERS = 250
+# Time the executor may spend on parsing and matching entries of one query
+LOG_QUERY_MAX_PROCESS_TIME = timedelta(seconds=10)
+
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT)
+
+IDENTIFIER_OTHER = "_other_"
+IDENTIFIER_UNKNOWN = "_unknown_"
+PRIORITY_UNKNOWN = "unknown"
+
+
+def _field(entry: dict[str, Any], name: str) -> str | None:
+    """Return text of a journal JSON field.
+
+    Binary fields are serialized as array of bytes, fields repeated in an
+    entry as array of values. Only the first value is used in that case.
+    """
+    match value := entry.get(name):
+        case str() | None:
+            return value
+        case [int(), *_]:
+            return bytes(value).decode("utf-8", errors="replace")
+        case [first, *_]:
+            return _field({name: first}, name)
+    return str(value)
+
+
+def _subpatterns(value: Any) -> Iterator[sre_parse.SubPattern]:
+    """Return subpatterns in arguments of a parsed regex item."""
+    if isinstance(value, sre_parse.SubPattern):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _subpatterns(item)
+
+
+def _has_nested_repeat(pattern: sre_parse.SubPattern, repeated: bool = False) -> bool:
+    """Return true if a parsed regex repeats a repetition."""
+    for op, av in pattern:
+        if op in _REPEATS:
+            _, max_repeat, subpattern = av
+            if max_repeat > 1 and repeated:
+                return True
+            if _has_nested_repeat(subpattern, repeated or max_repeat > 1):
+                return True
+        elif any(_has_nested_repeat(sub, repeated) for sub in _subpatterns(av)):
+            return True
+    return False
+
+
+def compile_pattern(regex: str) -> re.Pattern[str]:
+    """Compile regex of a client, raising re.error if it is invalid.
+
+    Nested repetitions like (a+)+ can backtrack for longer than any limit
+    checked between entries, they are rejected.
+    """
+    if _has_nested_repeat(sre_parse.parse(regex)):
+        raise re.error("nested repetitions are not supported")
+    return re.compile(regex)
+
+
+@dataclass(slots=True)
+class LogAggregation:
+    """Counts of journal entries by identifier, priority and time bucket."""
+
+    since: datetime
+    bucket_size: timedelta
+    pattern: re.Pattern[str] | None = None
+    scanned: int = 0
+    matched: int = 0
+    reached_since: bool = False
+    timed_out: bool = False
+    process_time: float = 0.0
+    identifiers: Counter[str] = field(default_factory=Counter)
+    priorities: Counter[str] = field(default_factory=Counter)
+    buckets: Counter[int] = field(default_factory=Counter)
+
+    def process(self, lines: list[bytes]) -> None:
+        """Parse, match and count a batch of JSON entries.
+
+        Stops once LOG_QUERY_MAX_PROCESS_TIME is used up across batches.
+        Must be run in executor.
+        """
+        since = int(self.since.timestamp() * 1e6)
+        bucket_size = int(self.bucket_size.total_seconds() * 1e6)
+        deadline = (
+            time.monotonic()
+            + LOG_QUERY_MAX_PROCESS_TIME.total_seconds()
+            - self.process_time
+        )
+        start = time.monotonic()
+
+        for line in lines:
+            if time.monotonic() > deadline:
+                self.timed_out = True
+                break
+
+            try:
+                entry = json_loads(line)
+            except ValueError:
+                continue
+
+            self.scanned += 1
+            try:
+                timestamp = int(entry["__REALTIME_TIMESTAMP"])
+            except (KeyError, ValueError):
+                continue
+            if timestamp < since:
+                self.reached_since = True
+                continue
+
+            if self.pattern and not self.pattern.search(_field(entry, "MESSAGE") or ""):
+                continue
+
+            self.matched += 1
+            identifier = _field(entry, "SYSLOG_IDENTIFIER") or IDENTIFIER_UNKNOWN
+            if (
+                identifier not in self.identifiers
+                and len(self.identifiers) >= LOG_QUERY_MAX_IDENTIFIERS
+            ):
+                identifier = IDENTIFIER_OTHER
+            self.identifiers[identifier] += 1
+            self.priorities[_field(entry, "PRIORITY") or PRIORITY_UNKNOWN] += 1
+            self.buckets[(timestamp - since) // bucket_size] += 1
+
+        self.process_time += time.monotonic() - start
+
+    def covers_period(self, max_entries: int) -> bool:
+        """Return true if all entries since start of period were processed.
+
+        The newest max entries are read, older ones of the period are missed
+        unless an entry before its start or fewer entries were read.
+        """
+        return not self.timed_out and (
+            self.reached_since or self.scanned < max_entries
+        )
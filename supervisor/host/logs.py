@@ -21,6 +21,7 @@ from ..exceptions import (
 )
 from ..utils.json import read_json_file
 from .const import PARAM_BOOT_ID, PARAM_SYSLOG_IDENTIFIER, LogFormat
+from .log_query import LOG_QUERY_BATCH_SIZE, LOG_QUERY_READ_SIZE, LogAggregation
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -126,6 +127,47 @@ class LogsControl(CoreSysAttributes):
                 _LOGGER.error,
             ) from err
 
+    async def aggregate_logs(
+        self,
+        aggregation: LogAggregation,
+        params: dict[str, str | list[str]],
+        max_entries: int,
+    ) -> LogAggregation:
+        """Stream newest journal entries as JSON into an aggregation.
+
+        Only one batch of raw entries is held in memory at a time, parsing and
+        matching happens in the executor. Reading stops once the aggregation
+        timed out.
+        """
+        try:
+            async with self.journald_logs(
+                params=params,
+                range_header=f"entries=:-{max_entries}:{max_entries}",
+                accept=LogFormat.JSON,
+            ) as resp:
+                batch: list[bytes] = []
+                remainder = b""
+                while chunk := await resp.content.read(LOG_QUERY_READ_SIZE):
+                    lines = (remainder + chunk).split(b"\n")
+                    remainder = lines.pop()
+                    batch.extend(line for line in lines if line)
+                    if len(batch) >= LOG_QUERY_BATCH_SIZE:
+                        await self.sys_run_in_executor(aggregation.process, batch)
+                        batch = []
+                        if aggregation.timed_out:
+                            return aggregation
+
+                if remainder:
+                    batch.append(remainder)
+                if batch:
+                    await self.sys_run_in_executor(aggregation.process, batch)
+        except (ClientError, TimeoutError) as err:
+            raise HostLogError(
+                "Could not query logs from systemd-journal-gatewayd", _LOGGER.error
+            ) from err
+
+        return aggregation
+
     @asynccontextmanager
     async def journald_logs(
         self,
@@ -9,10 +9,11 @@ from ..const import BusEvent
 from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import HassioError, HostLogError, PulseAudioError
 from ..hardware.const import PolicyGroup
-from ..hardware.data import Device
+from ..hardware.data import DeviceChanges
 from .apparmor import AppArmorControl
 from .const import HostFeature
 from .control import SystemControl
+from .disk_usage import DiskUsageControl
 from .info import InfoCenter
 from .logs import LogsControl
 from .network import NetworkManager
@@ -36,6 +37,7 @@ class HostManager(CoreSysAttributes):
         self._network: NetworkManager = NetworkManager(coresys)
         self._sound: SoundControl = SoundControl(coresys)
         self._logs: LogsControl = LogsControl(coresys)
+        self._disk_usage: DiskUsageControl = DiskUsageControl(coresys)
 
     @property
     def apparmor(self) -> AppArmorControl:
@@ -72,6 +74,11 @@ class HostManager(CoreSysAttributes):
         """Return host logs handler."""
         return self._logs
 
+    @property
+    def disk_usage(self) -> DiskUsageControl:
+        """Return host disk usage handler."""
+        return self._disk_usage
+
     @property
     def features(self) -> list[HostFeature]:
         """Return a list of host features."""
@@ -149,6 +156,8 @@ class HostManager(CoreSysAttributes):
 
     async def load(self):
         """Load host information."""
+        await self.info.load()
+
         with suppress(HassioError):
             if self.sys_dbus.systemd.is_connected:
                 await self.services.update()
@@ -162,9 +171,14 @@ class HostManager(CoreSysAttributes):
             await self.network.load()
 
         # Register for events
-        self.sys_bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, self._hardware_events)
         self.sys_bus.register_event(
-            BusEvent.HARDWARE_REMOVE_DEVICE, self._hardware_events
+            BusEvent.HARDWARE_DEVICES_CHANGED, self._hardware_events
+        )
+        self.sys_bus.register_event(
+            BusEvent.SUPERVISOR_JOB_START, self.info.disk_job_started
+        )
+        self.sys_bus.register_event(
+            BusEvent.SUPERVISOR_JOB_END, self.info.disk_job_ended
         )
 
         # Load profile data
@@ -173,7 +187,11 @@ class HostManager(CoreSysAttributes):
         except HassioError as err:
             _LOGGER.warning("Loading host AppArmor on start failed: %s", err)
 
-    async def _hardware_events(self, device: Device) -> None:
+    async def _hardware_events(self, changes: DeviceChanges) -> None:
         """Process hardware requests."""
-        if self.sys_hardware.policy.is_match_cgroup(PolicyGroup.AUDIO, device):
+        # Reload audio once per batch, no matter how many sound devices changed
+        if any(
+            self.sys_hardware.policy.is_match_cgroup(PolicyGroup.AUDIO, device)
+            for device in changes.devices
+        ):
             await self.sound.update(reload_pulse=True)
@@ -106,6 +106,9 @@ class SupervisorJob:
     errors: list[SupervisorJobError] = field(
         init=False, factory=list, on_setattr=_on_change
     )
+    extra: dict[str, Any] | None = field(
+        default=None, validator=[_invalid_if_done], on_setattr=_on_change
+    )
     release_event: asyncio.Event | None = None
 
     def as_dict(self) -> dict[str, Any]:
@@ -119,6 +122,7 @@ class SupervisorJob:
             "done": self.done,
             "parent_id": self.parent_id,
             "errors": [err.as_dict() for err in self.errors],
+            "extra": self.extra,
         }
 
     def capture_error(self, err: HassioError | None = None) -> None:
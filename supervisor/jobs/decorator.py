@@ -370,16 +370,16 @@ class Job(CoreSysAttributes):
                 f"'{method_name}' blocked from execution, system is not frozen - {coresys.sys_core.state!s}"
             )
 
-        if (
-            JobCondition.FREE_SPACE in used_conditions
-            and coresys.sys_host.info.free_space < MINIMUM_FREE_SPACE_THRESHOLD
-        ):
-            coresys.sys_resolution.create_issue(
-                IssueType.FREE_SPACE, ContextType.SYSTEM
-            )
-            raise JobConditionException(
-                f"'{method_name}' blocked from execution, not enough free space ({coresys.sys_host.info.free_space}GB) left on the device"
-            )
+        if JobCondition.FREE_SPACE in used_conditions:
+            # Read in executor, statfs can stall on network storage
+            free_space = await coresys.sys_host.info.get_free_space()
+            if free_space < MINIMUM_FREE_SPACE_THRESHOLD:
+                coresys.sys_resolution.create_issue(
+                    IssueType.FREE_SPACE, ContextType.SYSTEM
+                )
+                raise JobConditionException(
+                    f"'{method_name}' blocked from execution, not enough free space ({free_space}GB) left on the device"
+                )
 
         if JobCondition.INTERNET_SYSTEM in used_conditions:
             await coresys.sys_supervisor.check_connectivity()
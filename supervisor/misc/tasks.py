@@ -7,7 +7,7 @@ import logging
 from ..addons.const import ADDON_UPDATE_CONDITIONS
 from ..const import AddonState
 from ..coresys import CoreSysAttributes
-from ..exceptions import AddonsError, HomeAssistantError, ObserverError
+from ..exceptions import AddonsError, BackupJobError, HomeAssistantError, ObserverError
 from ..homeassistant.const import LANDINGPAGE
 from ..jobs.decorator import Job, JobCondition
 from ..plugins.const import PLUGIN_UPDATE_CONDITIONS
@@ -23,11 +23,7 @@ HASS_WATCHDOG_MAX_REANIMATE_ATTEMPTS = 5
 
 RUN_UPDATE_SUPERVISOR = 29100
 RUN_UPDATE_ADDONS = 57600
-RUN_UPDATE_CLI = 28100
-RUN_UPDATE_DNS = 30100
-RUN_UPDATE_AUDIO = 30200
-RUN_UPDATE_MULTICAST = 30300
-RUN_UPDATE_OBSERVER = 30400
+RUN_UPDATE_PLUGINS = 28100
 
 RUN_RELOAD_ADDONS = 10800
 RUN_RELOAD_BACKUPS = 72000
@@ -35,6 +31,11 @@ RUN_RELOAD_HOST = 7600
 RUN_RELOAD_UPDATER = 7200
 RUN_RELOAD_INGRESS = 930
 RUN_RELOAD_MOUNTS = 900
+RUN_CHECK_MOUNTS = 300
+RUN_RELOAD_DISK_METRICS = 1800
+RUN_RELOAD_DISK_USAGE = 3600
+RUN_INITIAL_DISK_USAGE = 60
+RUN_BENCHMARK_BACKUP_LOCATIONS = 86400
 
 RUN_WATCHDOG_HOMEASSISTANT_API = 120
 
@@ -57,11 +58,7 @@ class Tasks(CoreSysAttributes):
         # Update
         self.sys_scheduler.register_task(self._update_addons, RUN_UPDATE_ADDONS)
         self.sys_scheduler.register_task(self._update_supervisor, RUN_UPDATE_SUPERVISOR)
-        self.sys_scheduler.register_task(self._update_cli, RUN_UPDATE_CLI)
-        self.sys_scheduler.register_task(self._update_dns, RUN_UPDATE_DNS)
-        self.sys_scheduler.register_task(self._update_audio, RUN_UPDATE_AUDIO)
-        self.sys_scheduler.register_task(self._update_multicast, RUN_UPDATE_MULTICAST)
-        self.sys_scheduler.register_task(self._update_observer, RUN_UPDATE_OBSERVER)
+        self.sys_scheduler.register_task(self._update_plugins, RUN_UPDATE_PLUGINS)
 
         # Reload
         self.sys_scheduler.register_task(self._reload_store, RUN_RELOAD_ADDONS)
@@ -70,6 +67,22 @@ class Tasks(CoreSysAttributes):
         self.sys_scheduler.register_task(self.sys_host.reload, RUN_RELOAD_HOST)
         self.sys_scheduler.register_task(self.sys_ingress.reload, RUN_RELOAD_INGRESS)
         self.sys_scheduler.register_task(self.sys_mounts.reload, RUN_RELOAD_MOUNTS)
+        self.sys_scheduler.register_task(
+            self.sys_mounts.monitor.check_all, RUN_CHECK_MOUNTS
+        )
+        self.sys_scheduler.register_task(
+            self._reload_disk_metrics, RUN_RELOAD_DISK_METRICS
+        )
+        self.sys_scheduler.register_task(
+            self.sys_host.disk_usage.update, RUN_RELOAD_DISK_USAGE
+        )
+        # First scan shortly after start instead of an hour later
+        self.sys_scheduler.register_task(
+            self.sys_host.disk_usage.update, RUN_INITIAL_DISK_USAGE, repeat=False
+        )
+        self.sys_scheduler.register_task(
+            self._benchmark_backup_locations, RUN_BENCHMARK_BACKUP_LOCATIONS
+        )
 
         # Watchdog
         self.sys_scheduler.register_task(
@@ -211,64 +224,10 @@ class Tasks(CoreSysAttributes):
         finally:
             self._cache[HASS_WATCHDOG_API_FAILURES] = 0
 
-    @Job(name="tasks_update_cli", conditions=PLUGIN_AUTO_UPDATE_CONDITIONS)
-    async def _update_cli(self):
-        """Check and run update of cli."""
-        if not self.sys_plugins.cli.need_update:
-            return
-
-        _LOGGER.info(
-            "Found new cli version %s, updating", self.sys_plugins.cli.latest_version
-        )
-        await self.sys_plugins.cli.update()
-
-    @Job(name="tasks_update_dns", conditions=PLUGIN_AUTO_UPDATE_CONDITIONS)
-    async def _update_dns(self):
-        """Check and run update of CoreDNS plugin."""
-        if not self.sys_plugins.dns.need_update:
-            return
-
-        _LOGGER.info(
-            "Found new CoreDNS plugin version %s, updating",
-            self.sys_plugins.dns.latest_version,
-        )
-        await self.sys_plugins.dns.update()
-
-    @Job(name="tasks_update_audio", conditions=PLUGIN_AUTO_UPDATE_CONDITIONS)
-    async def _update_audio(self):
-        """Check and run update of PulseAudio plugin."""
-        if not self.sys_plugins.audio.need_update:
-            return
-
-        _LOGGER.info(
-            "Found new PulseAudio plugin version %s, updating",
-            self.sys_plugins.audio.latest_version,
-        )
-        await self.sys_plugins.audio.update()
-
-    @Job(name="tasks_update_observer", conditions=PLUGIN_AUTO_UPDATE_CONDITIONS)
-    async def _update_observer(self):
-        """Check and run update of Observer plugin."""
-        if not self.sys_plugins.observer.need_update:
-            return
-
-        _LOGGER.info(
-            "Found new Observer plugin version %s, updating",
-            self.sys_plugins.observer.latest_version,
-        )
-        await self.sys_plugins.observer.update()
-
-    @Job(name="tasks_update_multicast", conditions=PLUGIN_AUTO_UPDATE_CONDITIONS)
-    async def _update_multicast(self):
-        """Check and run update of multicast."""
-        if not self.sys_plugins.multicast.need_update:
-            return
-
-        _LOGGER.info(
-            "Found new Multicast version %s, updating",
-            self.sys_plugins.multicast.latest_version,
-        )
-        await self.sys_plugins.multicast.update()
+    @Job(name="tasks_update_plugins", conditions=PLUGIN_AUTO_UPDATE_CONDITIONS)
+    async def _update_plugins(self):
+        """Check and run update of plugins."""
+        await self.sys_plugins.update()
 
     async def _watchdog_observer_application(self):
         """Check running state of application and rebuild if they is not response."""
@@ -317,6 +276,20 @@ class Tasks(CoreSysAttributes):
             finally:
                 self._cache[addon.slug] = 0
 
+    async def _reload_disk_metrics(self) -> None:
+        """Take a disk usage sample of the data directory."""
+        try:
+            await self.sys_host.info.record_disk_metrics()
+        except OSError as err:
+            _LOGGER.warning("Can't read disk usage: %s", err)
+
+    async def _benchmark_backup_locations(self) -> None:
+        """Measure throughput of backup locations for automatic selection."""
+        try:
+            await self.sys_backups.benchmark_locations()
+        except BackupJobError as err:
+            _LOGGER.info("Skipping benchmark of backup locations: %s", err)
+
     @Job(name="tasks_reload_store", conditions=[JobCondition.SUPERVISOR_UPDATED])
     async def _reload_store(self) -> None:
         """Reload store and check for addon updates."""
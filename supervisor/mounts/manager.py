@@ -22,6 +22,7 @@ from .const import (
     FILE_CONFIG_MOUNTS,
     MountUsage,
 )
+from .monitor import MountMonitor
 from .mount import BindMount, Mount
 from .validate import SCHEMA_MOUNTS_CONFIG
 
@@ -52,12 +53,18 @@ class MountManager(FileConfiguration, CoreSysAttributes):
             for mount in self._data[ATTR_MOUNTS]
         }
         self._bound_mounts: dict[str, BoundMount] = {}
+        self._monitor: MountMonitor = MountMonitor(coresys)
 
     @property
     def mounts(self) -> list[Mount]:
         """Return list of mounts."""
         return list(self._mounts.values())
 
+    @property
+    def monitor(self) -> MountMonitor:
+        """Return mount health monitor."""
+        return self._monitor
+
     @property
     def backup_mounts(self) -> list[Mount]:
         """Return list of backup mounts."""
@@ -229,6 +236,7 @@ class MountManager(FileConfiguration, CoreSysAttributes):
         await mount.unmount()
         if not retain_entry:
             del self._mounts[name]
+            self._monitor.remove(name)
 
         if self._data.get(ATTR_DEFAULT_BACKUP_MOUNT) == mount.name:
             self.default_backup_mount = None
@@ -252,6 +260,7 @@ class MountManager(FileConfiguration, CoreSysAttributes):
 
         _LOGGER.info("Reloading mount: %s", name)
         await self._mounts[name].reload()
+        self._monitor.reset(name)
 
         if (bound_mount := self._bound_mounts.get(name)) and bound_mount.emergency:
             await self._bind_mount(bound_mount.mount, bound_mount.bind_mount.where)
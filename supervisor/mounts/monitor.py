@@ -0,0 +1,225 @@
+"""Probe health of network mounts."""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import errno
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from ..coresys import CoreSys, CoreSysAttributes
+from ..dbus.const import UnitActiveState
+from ..exceptions import MountError, MountJobError
+from ..utils.dt import utcnow
+from .mount import Mount
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+MOUNT_PROBE_FILE = ".supervisor_probe"
+MOUNT_PROBE_HISTORY = 24
+# Workers left stuck on previous instances of a mount, besides the current one
+MOUNT_PROBE_MAX_STALE = 1
+MOUNT_PROBE_SIZE = 65_536
+MOUNT_PROBE_SLOW = timedelta(seconds=2)
+MOUNT_PROBE_TIMEOUT = timedelta(seconds=10)
+
+
+@dataclass(slots=True, frozen=True)
+class MountProbe:
+    """Result of a single probe of a mount.
+
+    Latency is the time a stat call took in seconds, throughput the bytes per
+    second written and read back. Throughput is none for read-only mounts.
+    """
+
+    timestamp: datetime
+    latency: float | None = None
+    throughput: float | None = None
+    error: str | None = None
+
+
+def _probe_path(path: Path, write: bool) -> tuple[float, float | None]:
+    """Stat path and write and read back a file in it.
+
+    Must be run in a worker thread, calls may hang on unresponsive servers.
+    """
+    start = time.monotonic()
+    os.stat(path)
+    latency = time.monotonic() - start
+    if not write:
+        return latency, None
+
+    probe_file = path / MOUNT_PROBE_FILE
+    data = os.urandom(MOUNT_PROBE_SIZE)
+    start = time.monotonic()
+    try:
+        with probe_file.open("wb") as probe:
+            probe.write(data)
+            probe.flush()
+            os.fsync(probe.fileno())
+        if probe_file.read_bytes() != data:
+            raise OSError(errno.EIO, "Probe data read back differs")
+    finally:
+        with suppress(OSError):
+            probe_file.unlink()
+
+    elapsed = time.monotonic() - start
+    return latency, 2 * MOUNT_PROBE_SIZE / elapsed if elapsed else None
+
+
+class MountMonitor(CoreSysAttributes):
+    """Probe mounts with bounded time and remount unresponsive ones."""
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize mount monitor."""
+        self.coresys: CoreSys = coresys
+        self._history: dict[str, deque[MountProbe]] = {}
+        self._degraded: set[str] = set()
+        self._pending: dict[str, tuple[Mount, asyncio.Future]] = {}
+        self._stale: dict[str, set[asyncio.Future]] = {}
+
+    def is_degraded(self, name: str) -> bool:
+        """Return true if last probe of mount failed or was slow."""
+        return name in self._degraded
+
+    def get_history(self, name: str) -> list[MountProbe]:
+        """Return recent probes of mount, oldest first."""
+        return list(self._history.get(name, []))
+
+    def remove(self, name: str) -> None:
+        """Drop probe results of a removed mount."""
+        self._history.pop(name, None)
+        self._degraded.discard(name)
+        self.reset(name)
+
+    def reset(self, name: str) -> None:
+        """Forget a probe pending on mount name before it was remounted.
+
+        A worker stuck on the old mount can't be stopped, it is left to return
+        on its own. Its result is not held against the new mount, but it still
+        counts against the number of workers a mount may have.
+        """
+        if not (pending := self._pending.pop(name, None)) or pending[1].done():
+            return
+        _LOGGER.warning(
+            "Probe of previous mount %s did not return, it is left running", name
+        )
+        stale = self._stale.setdefault(name, set())
+        stale.add(pending[1])
+
+        def _returned(future: asyncio.Future) -> None:
+            stale.discard(future)
+            # Retrieve late exception so it is not logged as never retrieved
+            if not future.cancelled():
+                future.exception()
+
+        pending[1].add_done_callback(_returned)
+
+    def run_in_worker(self, name: str, func: Callable, *args) -> asyncio.Future:
+        """Run func accessing mount name in a daemon thread.
+
+        The default executor can't be used, its threads are joined on shutdown
+        and a thread stuck on a hung mount would never return.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _set_result(result: Any) -> None:
+            if not future.done():
+                future.set_result(result)
+
+        def _set_exception(err: Exception) -> None:
+            if not future.done():
+                future.set_exception(err)
+
+        def _worker() -> None:
+            try:
+                result = func(*args)
+            except Exception as err:  # pylint: disable=broad-except
+                loop.call_soon_threadsafe(_set_exception, err)
+            else:
+                loop.call_soon_threadsafe(_set_result, result)
+
+        threading.Thread(target=_worker, name=f"MountProbe-{name}", daemon=True).start()
+        return future
+
+    async def probe(self, mount: Mount) -> MountProbe | None:
+        """Probe mount and record result, none if it is not mounted."""
+        if mount.state != UnitActiveState.ACTIVE or not mount.local_where:
+            self._degraded.discard(mount.name)
+            return None
+
+        # A worker pending on a mount replaced since is not held against it
+        if (pending := self._pending.get(mount.name)) and pending[0] is not mount:
+            self.reset(mount.name)
+
+        # Don't start another worker while one is stuck on this mount, or
+        # too many are still stuck on previous instances of it
+        if (pending := self._pending.get(mount.name)) and not pending[1].done():
+            result = MountProbe(utcnow(), error="Previous probe did not return")
+        elif len(self._stale.get(mount.name, ())) >= MOUNT_PROBE_MAX_STALE:
+            result = MountProbe(
+                utcnow(), error="Probes of previous mounts did not return"
+            )
+        else:
+            future = self.run_in_worker(
+                mount.name, _probe_path, mount.local_where, not mount.read_only
+            )
+            self._pending[mount.name] = (mount, future)
+            await asyncio.wait({future}, timeout=MOUNT_PROBE_TIMEOUT.total_seconds())
+
+            if not future.done():
+                result = MountProbe(
+                    utcnow(),
+                    error=f"No response within {MOUNT_PROBE_TIMEOUT.total_seconds()} seconds",
+                )
+            elif err := future.exception():
+                result = MountProbe(utcnow(), error=str(err))
+            else:
+                latency, throughput = future.result()
+                result = MountProbe(utcnow(), latency, throughput)
+
+        history = self._history.setdefault(
+            mount.name, deque(maxlen=MOUNT_PROBE_HISTORY)
+        )
+        history.append(result)
+
+        if result.error or result.latency > MOUNT_PROBE_SLOW.total_seconds():
+            if mount.name not in self._degraded:
+                _LOGGER.warning(
+                    "Mount %s is degraded: %s",
+                    mount.name,
+                    result.error or f"stat took {result.latency:.1f} seconds",
+                )
+            self._degraded.add(mount.name)
+        elif mount.name in self._degraded:
+            _LOGGER.info("Mount %s is responding normally again", mount.name)
+            self._degraded.discard(mount.name)
+
+        return result
+
+    async def check(self, mount: Mount) -> MountProbe | None:
+        """Probe mount and remount it once if it does not respond."""
+        if not (result := await self.probe(mount)) or not result.error:
+            return result
+
+        _LOGGER.warning("Mount %s does not respond, remounting it", mount.name)
+        try:
+            await self.sys_mounts.reload_mount(mount.name)
+        except (MountError, MountJobError) as err:
+            _LOGGER.warning("Can't remount %s: %s", mount.name, err)
+            return result
+
+        self.reset(mount.name)
+        return await self.probe(mount)
+
+    async def check_all(self) -> None:
+        """Probe all mounts, remounting those which do not respond."""
+        await asyncio.gather(*[self.check(mount) for mount in self.sys_mounts.mounts])
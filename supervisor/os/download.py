@@ -0,0 +1,259 @@
+"""Resumable download of OS update bundles."""
+
+import asyncio
+from datetime import timedelta
+import errno
+import hashlib
+import logging
+from pathlib import Path
+import re
+import time
+from typing import BinaryIO
+
+import aiohttp
+from aiohttp import hdrs
+
+from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import HassOSUpdateError
+from ..jobs import SupervisorJob
+from ..resolution.const import UnhealthyReason
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 1_048_576
+DOWNLOAD_ATTEMPTS = 5
+DOWNLOAD_RETRY_DELAY = timedelta(seconds=10)
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=60 * 60, connect=180, sock_read=60)
+# Progress updates are sent to Home Assistant, don't flood it
+DOWNLOAD_PROGRESS_INTERVAL = timedelta(seconds=1)
+
+PARTIAL_SUFFIX = ".part"
+
+RE_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class _RestartDownload(Exception):
+    """Server did not resume at the requested offset."""
+
+
+class BundleDownload(CoreSysAttributes):
+    """Download a file resuming from where a previous attempt stopped.
+
+    Data is written to a partial file next to the target in executor and
+    hashed on the way. The partial file is kept on failure, so a later
+    update attempt of the same version continues from it.
+    """
+
+    def __init__(
+        self,
+        coresys: CoreSys,
+        url: str,
+        path: Path,
+        job: SupervisorJob | None = None,
+    ):
+        """Initialize bundle download."""
+        self.coresys: CoreSys = coresys
+        self.url: str = url
+        self.path: Path = path
+        self.job: SupervisorJob | None = job
+        self.partial: Path = path.with_name(path.name + PARTIAL_SUFFIX)
+
+        self._sha256 = hashlib.sha256()
+        self._offset: int = 0
+        self._total: int | None = None
+        self._etag: str | None = None
+        self._progress_time: float = 0
+        self._progress_offset: int = 0
+
+    @property
+    def sha256(self) -> str:
+        """Return SHA256 hash of downloaded data."""
+        return self._sha256.hexdigest()
+
+    def _load_partial(self) -> None:
+        """Hash data of a previous attempt.
+
+        Must be run in executor.
+        """
+        self._sha256 = hashlib.sha256()
+        self._offset = 0
+        if not self.partial.exists():
+            return
+
+        with self.partial.open("rb") as partial:
+            while chunk := partial.read(DOWNLOAD_CHUNK_SIZE):
+                self._sha256.update(chunk)
+                self._offset += len(chunk)
+
+    def _restart(self) -> None:
+        """Drop downloaded data to start over from the beginning."""
+        self._sha256 = hashlib.sha256()
+        self._offset = 0
+        self._etag = None
+
+    def _open_partial(self) -> BinaryIO:
+        """Open partial file for writing at current offset.
+
+        Must be run in executor.
+        """
+        partial = self.partial.open("ab" if self._offset else "wb")
+        partial.truncate(self._offset)
+        return partial
+
+    def _write(self, partial: BinaryIO, chunk: bytes) -> None:
+        """Hash and write chunk.
+
+        Must be run in executor.
+        """
+        self._sha256.update(chunk)
+        partial.write(chunk)
+
+    def _complete(self) -> None:
+        """Move completed download to target.
+
+        Must be run in executor.
+        """
+        self.partial.replace(self.path)
+
+    def _update_progress(self, force: bool = False) -> None:
+        """Report progress and throughput to job."""
+        if not self.job:
+            return
+
+        now = time.monotonic()
+        elapsed = now - self._progress_time
+        if not force and elapsed < DOWNLOAD_PROGRESS_INTERVAL.total_seconds():
+            return
+
+        speed = int((self._offset - self._progress_offset) / elapsed) if elapsed else 0
+        self._progress_time = now
+        self._progress_offset = self._offset
+
+        self.job.extra = {
+            "downloaded": self._offset,
+            "total": self._total,
+            "speed": speed,
+        }
+        if self._total:
+            self.job.progress = min(100, self._offset / self._total * 100)
+
+    def _resume_offset(self, response: aiohttp.ClientResponse) -> None:
+        """Check where the server continues and read the total size."""
+        if response.status == 200:
+            if self._offset:
+                _LOGGER.info("Server does not resume %s, starting over", self.url)
+                raise _RestartDownload()
+            self._total = response.content_length
+            return
+
+        match = RE_CONTENT_RANGE.fullmatch(response.headers.get(hdrs.CONTENT_RANGE, ""))
+        if not match or int(match.group(1)) != self._offset:
+            raise _RestartDownload()
+        if match.group(3) != "*":
+            self._total = int(match.group(3))
+
+    async def _fetch(self) -> None:
+        """Run one attempt, continuing at current offset."""
+        headers = {}
+        if self._offset:
+            headers[hdrs.RANGE] = f"bytes={self._offset}-"
+            if self._etag:
+                headers[hdrs.IF_RANGE] = self._etag
+
+        async with self.sys_websession.get(
+            self.url, headers=headers, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            if response.status == 416 and self._offset:
+                # Partial file is not a prefix of what the server has
+                raise _RestartDownload()
+            if response.status not in (200, 206):
+                raise HassOSUpdateError(
+                    f"Error raised from OTA Webserver: {response.status}",
+                    _LOGGER.error,
+                )
+
+            self._resume_offset(response)
+            self._etag = response.headers.get(hdrs.ETAG)
+            if self._offset:
+                _LOGGER.info(
+                    "Resuming download of %s at %d bytes", self.url, self._offset
+                )
+
+            partial = await self.sys_run_in_executor(self._open_partial)
+            try:
+                buffer = bytearray()
+                async for data in response.content.iter_any():
+                    buffer += data
+                    if len(buffer) < DOWNLOAD_CHUNK_SIZE:
+                        continue
+
+                    await self.sys_run_in_executor(self._write, partial, bytes(buffer))
+                    self._offset += len(buffer)
+                    buffer.clear()
+                    self._update_progress()
+
+                if buffer:
+                    await self.sys_run_in_executor(self._write, partial, bytes(buffer))
+                    self._offset += len(buffer)
+            finally:
+                await self.sys_run_in_executor(partial.close)
+
+        if self._total is not None and self._offset != self._total:
+            raise aiohttp.ClientPayloadError(
+                f"Download ended at {self._offset} of {self._total} bytes"
+            )
+
+    async def run(self) -> None:
+        """Download file, retrying with resume on connection errors."""
+        try:
+            await self.sys_run_in_executor(self._load_partial)
+            self._progress_time = time.monotonic()
+            self._progress_offset = self._offset
+
+            attempt = 0
+            while True:
+                try:
+                    await self._fetch()
+                    break
+                except _RestartDownload as err:
+                    if not self._offset:
+                        raise HassOSUpdateError(
+                            f"OTA Webserver sent an invalid range for {self.url}",
+                            _LOGGER.error,
+                        ) from err
+                    # Starting over is not a failed attempt
+                    self._restart()
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    attempt += 1
+                    _LOGGER.warning(
+                        "Download of %s interrupted at %d bytes (attempt %d/%d): %s",
+                        self.url,
+                        self._offset,
+                        attempt,
+                        DOWNLOAD_ATTEMPTS,
+                        err,
+                    )
+                    if attempt >= DOWNLOAD_ATTEMPTS:
+                        self.sys_supervisor.connectivity = False
+                        raise HassOSUpdateError(
+                            f"Can't fetch OTA update from {self.url}: {err!s}",
+                            _LOGGER.error,
+                        ) from err
+                    await asyncio.sleep(DOWNLOAD_RETRY_DELAY.total_seconds() * attempt)
+
+            await self.sys_run_in_executor(self._complete)
+
+        except OSError as err:
+            if err.errno == errno.EBADMSG:
+                self.sys_resolution.unhealthy = UnhealthyReason.OSERROR_BAD_MESSAGE
+            raise HassOSUpdateError(
+                f"Can't write OTA file: {err!s}", _LOGGER.error
+            ) from err
+
+        self._update_progress(force=True)
+        _LOGGER.info(
+            "Completed download of OTA update file %s (%d bytes, SHA256 %s)",
+            self.path,
+            self._offset,
+            self.sha256,
+        )
@@ -2,11 +2,9 @@
 from collections.abc import Awaitable
 from dataclasses import dataclass
 from datetime import datetime
-import errno
 import logging
 from pathlib import Path, PurePath
 
-import aiohttp
 from awesomeversion import AwesomeVersion, AwesomeVersionException
 from cpe import CPE
 
@@ -22,13 +20,24 @@ from ..exceptions import (
 )
 from ..jobs.const import JobCondition, JobExecutionLimit
 from ..jobs.decorator import Job
-from ..resolution.const import UnhealthyReason
 from ..utils.sentry import capture_exception
 from .data_disk import DataDisk
+from .download import PARTIAL_SUFFIX, BundleDownload
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
+def _remove_partial_downloads(raucb: Path) -> None:
+    """Remove partial bundle downloads except the one for raucb.
+
+    Must be run in executor.
+    """
+    keep = raucb.name + PARTIAL_SUFFIX
+    for partial in raucb.parent.glob(f"*.raucb{PARTIAL_SUFFIX}"):
+        if partial.name != keep:
+            partial.unlink(missing_ok=True)
+
+
 @dataclass(slots=True, frozen=True)
 class SlotStatus:
     """Status of a slot."""
@@ -206,37 +215,10 @@ class OSManager(CoreSysAttributes):
     async def _download_raucb(self, url: str, raucb: Path) -> None:
         """Download rauc bundle (OTA) from URL."""
         _LOGGER.info("Fetch OTA update from %s", url)
-        try:
-            timeout = aiohttp.ClientTimeout(total=60 * 60, connect=180)
-            async with self.sys_websession.get(url, timeout=timeout) as request:
-                if request.status != 200:
-                    raise HassOSUpdateError(
-                        f"Error raised from OTA Webserver: {request.status}",
-                        _LOGGER.error,
-                    )
-
-                # Download RAUCB file
-                with raucb.open("wb") as ota_file:
-                    while True:
-                        chunk = await request.content.read(1_048_576)
-                        if not chunk:
-                            break
-                        ota_file.write(chunk)
-
-            _LOGGER.info("Completed download of OTA update file %s", raucb)
-
-        except (aiohttp.ClientError, TimeoutError) as err:
-            self.sys_supervisor.connectivity = False
-            raise HassOSUpdateError(
-                f"Can't fetch OTA update from {url}: {err!s}", _LOGGER.error
-            ) from err
 
-        except OSError as err:
-            if err.errno == errno.EBADMSG:
-                self.sys_resolution.unhealthy = UnhealthyReason.OSERROR_BAD_MESSAGE
-            raise HassOSUpdateError(
-                f"Can't write OTA file: {err!s}", _LOGGER.error
-            ) from err
+        # Drop partial downloads of other versions
+        await self.sys_run_in_executor(_remove_partial_downloads, raucb)
+        await BundleDownload(self.coresys, url, raucb, self.sys_jobs.current).run()
 
     @Job(name="os_manager_reload", conditions=[JobCondition.HAOS], internal=True)
     async def reload(self) -> None:
@@ -6,9 +6,9 @@ import errno
 import logging
 from pathlib import Path, PurePath
 import shutil
+from typing import TYPE_CHECKING
 
 from awesomeversion import AwesomeVersion
-import jinja2
 
 from ..const import LogLevel
 from ..coresys import CoreSys
@@ -34,8 +34,12 @@ from .const import (
     WATCHDOG_THROTTLE_MAX_CALLS,
     WATCHDOG_THROTTLE_PERIOD,
 )
+from .utils import load_template
 from .validate import SCHEMA_AUDIO_CONFIG
 
+if TYPE_CHECKING:
+    import jinja2
+
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 # pylint: disable=no-member
@@ -84,8 +88,8 @@ class PluginAudio(PluginBase):
         """Load Audio setup."""
         # Initialize Client Template
         try:
-            self.client_template = jinja2.Template(
-                PULSE_CLIENT_TMPL.read_text(encoding="utf-8")
+            self.client_template = await self.sys_run_in_executor(
+                load_template, PULSE_CLIENT_TMPL
             )
         except OSError as err:
             if err.errno == errno.EBADMSG:
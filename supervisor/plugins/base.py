@@ -209,6 +209,15 @@ class PluginBase(ABC, FileConfiguration, CoreSysAttributes):
         self.image = self.default_image
         self.save_data()
 
+    async def pull(self, version: AwesomeVersion | None = None) -> None:
+        """Download image of a new version while the plugin keeps running.
+
+        A following update uses the image without pulling and validating it again.
+        """
+        await self.instance.pull(
+            version or self.latest_version, image=self.default_image
+        )
+
     async def update(self, version: str | None = None) -> None:
         """Update system plugin."""
         version = version or self.latest_version
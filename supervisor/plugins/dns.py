@@ -8,10 +8,10 @@ import errno
 from ipaddress import IPv4Address
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import attr
 from awesomeversion import AwesomeVersion
-import jinja2
 import voluptuous as vol
 
 from ..const import ATTR_SERVERS, DNS_SUFFIX, LogLevel
@@ -42,8 +42,12 @@ from .const import (
     WATCHDOG_THROTTLE_MAX_CALLS,
     WATCHDOG_THROTTLE_PERIOD,
 )
+from .utils import load_template
 from .validate import SCHEMA_DNS_CONFIG
 
+if TYPE_CHECKING:
+    import jinja2
+
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 # pylint: disable=no-member
@@ -148,16 +152,16 @@ class PluginDns(PluginBase):
         """Load DNS setup."""
         # Initialize CoreDNS Template
         try:
-            self.resolv_template = jinja2.Template(
-                RESOLV_TMPL.read_text(encoding="utf-8")
+            self.resolv_template = await self.sys_run_in_executor(
+                load_template, RESOLV_TMPL
             )
         except OSError as err:
             if err.errno == errno.EBADMSG:
                 self.sys_resolution.unhealthy = UnhealthyReason.OSERROR_BAD_MESSAGE
             _LOGGER.error("Can't read resolve.tmpl: %s", err)
         try:
-            self.hosts_template = jinja2.Template(
-                HOSTS_TMPL.read_text(encoding="utf-8")
+            self.hosts_template = await self.sys_run_in_executor(
+                load_template, HOSTS_TMPL
             )
         except OSError as err:
             if err.errno == errno.EBADMSG:
@@ -80,16 +80,48 @@ class PluginManager(CoreSysAttributes):
             return
 
         # Check requirements
-        for plugin in self.all_plugins:
-            # Check if need an update
-            if not plugin.need_update:
-                continue
+        await self.update()
+
+    async def update(self) -> None:
+        """Update plugins which have a new version available.
+
+        Images are pulled concurrently while all plugins keep running. The
+        containers are swapped afterwards one after another.
+        """
+        # CoreDNS first, so restarted plugins resolve through the new version.
+        # Observer last, it keeps watching the system while others restart.
+        plugins = [
+            plugin
+            for plugin in (
+                self._dns,
+                self._audio,
+                self._multicast,
+                self._cli,
+                self._observer,
+            )
+            if plugin.need_update
+        ]
+        if not plugins:
+            return
 
+        for plugin in plugins:
             _LOGGER.info(
                 "%s does not have the latest version %s, updating",
                 plugin.slug,
                 plugin.latest_version,
             )
+
+        results = await asyncio.gather(
+            *[plugin.pull() for plugin in plugins], return_exceptions=True
+        )
+        for plugin, result in zip(plugins, results):
+            # Update pulls again and reports the error
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Can't pull %s image ahead of update: %s", plugin.slug, result
+                )
+
+        for plugin in plugins:
             try:
                 await plugin.update()
             except HassioError:
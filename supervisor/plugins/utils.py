@@ -0,0 +1,18 @@
+"""Utils for plugins."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import jinja2
+
+
+def load_template(path: Path) -> "jinja2.Template":
+    """Read and compile a template.
+
+    Must be run in executor, jinja2 is imported there and not on the event loop.
+    """
+    # pylint: disable=import-outside-toplevel
+    import jinja2
+
+    return jinja2.Template(path.read_text(encoding="utf-8"))
@@ -32,10 +32,12 @@ class ResolutionNotify(CoreSysAttributes):
 
         for issue in self.sys_resolution.issues:
             if issue.type == IssueType.FREE_SPACE:
+                # Read it like the check which created the issue
+                free_space = await self.sys_host.info.get_free_space()
                 messages.append(
                     {
                         "title": "Available space is less than 1GB!",
-                        "message": f"Available space is {self.sys_host.info.free_space}GB, see https://www.home-assistant.io/more-info/free-space for more information.",
+                        "message": f"Available space is {free_space}GB, see https://www.home-assistant.io/more-info/free-space for more information.",
                         "notification_id": "supervisor_issue_free_space",
                     }
                 )
@@ -3,7 +3,7 @@ import asyncio
 from collections.abc import Awaitable
 import logging
 
-from ..const import ATTR_REPOSITORIES, URL_HASSIO_ADDONS
+from ..const import ATTR_RELOAD_CONCURRENCY, ATTR_REPOSITORIES, URL_HASSIO_ADDONS
 from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import (
     StoreError,
@@ -20,6 +20,7 @@ from .addon import AddonStore
 from .const import FILE_HASSIO_STORE, StoreType
 from .data import StoreData
 from .repository import Repository
+from .search import AddonSearchIndex
 from .validate import (
     BUILTIN_REPOSITORIES,
     SCHEMA_STORE_FILE,
@@ -38,6 +39,7 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         self.coresys: CoreSys = coresys
         self.data = StoreData(coresys)
         self._repositories: dict[str, Repository] = {}
+        self.search = AddonSearchIndex()
 
     @property
     def all(self) -> list[Repository]:
@@ -49,6 +51,16 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         """Return repositories dictionary."""
         return self._repositories
 
+    @property
+    def reload_concurrency(self) -> int:
+        """Return how many repositories are synced with their remote at once."""
+        return self._data[ATTR_RELOAD_CONCURRENCY]
+
+    @reload_concurrency.setter
+    def reload_concurrency(self, value: int) -> None:
+        """Set how many repositories are synced with their remote at once."""
+        self._data[ATTR_RELOAD_CONCURRENCY] = value
+
     @property
     def repository_urls(self) -> list[str]:
         """Return source URL for all git repositories."""
@@ -74,6 +86,7 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
 
     async def load(self) -> None:
         """Start up add-on management."""
+        await self.data.load_index()
         await self.data.update()
 
         # Init custom repositories and load add-ons
@@ -90,8 +103,14 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         """Update add-ons from repository and reload list."""
         # Make a copy to prevent race with other tasks
         repositories = [repository] if repository else self.all.copy()
+        semaphore = asyncio.Semaphore(self.reload_concurrency)
+
+        async def _update(repo: Repository) -> bool:
+            async with semaphore:
+                return await repo.update()
+
         results: list[bool | Exception] = await asyncio.gather(
-            *[repo.update() for repo in repositories], return_exceptions=True
+            *[_update(repo) for repo in repositories], return_exceptions=True
         )
 
         # Determine which repositories were updated
@@ -304,3 +323,6 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         # remove
         for slug in del_addons:
             self.sys_addons.store.pop(slug)
+
+        # Re-index changed add-ons for search
+        self.search.update(self.sys_addons.store)
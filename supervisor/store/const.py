@@ -6,6 +6,16 @@ from ..const import SUPERVISOR_DATA
 
 FILE_HASSIO_STORE = Path(SUPERVISOR_DATA, "store.json")
 
+# Deadline for syncing a single repository with its remote
+GIT_PULL_TIMEOUT = 120
+
+# Left in the git folder while a pull changes the checkout, the next pull finishes it
+GIT_PULL_INCOMPLETE = "SUPERVISOR_PULL_INCOMPLETE"
+
+# Default and upper bound of repositories synced with their remote at once
+STORE_RELOAD_CONCURRENCY = 4
+STORE_RELOAD_CONCURRENCY_MAX = 16
+
 
 class StoreType(StrEnum):
     """Store Types."""
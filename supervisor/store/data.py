@@ -1,10 +1,13 @@
 """Init file for Supervisor add-on data."""
+from contextlib import suppress
+from copy import deepcopy
 from dataclasses import dataclass
 import errno
 import logging
 from pathlib import Path
 from typing import Any
 
+import git
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
@@ -16,16 +19,18 @@ from ..const import (
     ATTR_TRANSLATIONS,
     ATTR_VERSION,
     ATTR_VERSION_TIMESTAMP,
+    FILE_HASSIO_STORE_INDEX,
     FILE_SUFFIX_CONFIGURATION,
     REPOSITORY_CORE,
     REPOSITORY_LOCAL,
+    SUPERVISOR_VERSION,
 )
 from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import ConfigurationFileError
 from ..resolution.const import ContextType, IssueType, SuggestionType, UnhealthyReason
 from ..utils.common import find_one_filetype, read_json_or_yaml_file
 from ..utils.dt import utcnow
-from ..utils.json import read_json_file
+from ..utils.json import read_json_file, write_json_file
 from .const import StoreType
 from .utils import extract_hash_from_path
 from .validate import SCHEMA_REPOSITORY_CONFIG
@@ -42,6 +47,43 @@ class ProcessedRepository:
     config: dict[str, Any]
 
 
+@dataclass(slots=True)
+class IndexedAddon:
+    """Add-on files as read from a folder and git tree id of that folder."""
+
+    tree_id: str
+    config: dict[str, Any]
+    translations: dict[str, Any]
+
+
+def _read_git_tree_ids(path: Path, addon_list: list[Path]) -> dict[Path, str]:
+    """Return git tree object id of each add-on folder at HEAD of repository.
+
+    Store checkouts are reset to the fetched commit on every pull, so HEAD
+    describes the files without walking the working tree.
+    Should be run in the executor.
+    """
+    try:
+        repo = git.Repo(path)
+    except (git.GitError, OSError):
+        return {}
+
+    tree_ids: dict[Path, str] = {}
+    with repo:
+        try:
+            tree = repo.head.commit.tree
+        except (git.GitError, ValueError):
+            return {}
+
+        for addon in addon_list:
+            folder = addon.parent.relative_to(path).as_posix()
+            try:
+                tree_ids[addon] = (tree if folder == "." else tree / folder).hexsha
+            except KeyError:
+                continue
+    return tree_ids
+
+
 def _read_addon_translations(addon_path: Path) -> dict:
     """Read translations from add-ons folder.
 
@@ -107,6 +149,56 @@ class StoreData(CoreSysAttributes):
         self.coresys: CoreSys = coresys
         self.repositories: dict[str, Any] = {}
         self.addons: dict[str, dict[str, Any]] = {}
+        self._index: dict[Path, IndexedAddon] = {}
+        self._index_changed: bool = False
+
+    async def load_index(self) -> None:
+        """Load index of add-on files stored on disk.
+
+        Indexes written by another Supervisor version are not reused.
+        """
+
+        def _load_index() -> dict[Path, IndexedAddon]:
+            if not FILE_HASSIO_STORE_INDEX.is_file():
+                return {}
+            try:
+                data = read_json_file(FILE_HASSIO_STORE_INDEX)
+                if data[ATTR_VERSION] != SUPERVISOR_VERSION:
+                    return {}
+                return {
+                    Path(config_file): IndexedAddon(
+                        entry["tree_id"], entry["config"], entry["translations"]
+                    )
+                    for config_file, entry in data["addons"].items()
+                }
+            except (ConfigurationFileError, KeyError, TypeError, AttributeError):
+                _LOGGER.warning("Ignoring invalid store index, reading all add-ons")
+                return {}
+
+        self._index = await self.sys_run_in_executor(_load_index)
+
+    async def save_index(self) -> None:
+        """Store index of add-on files on disk if it changed."""
+        if not self._index_changed:
+            return
+
+        data = {
+            ATTR_VERSION: SUPERVISOR_VERSION,
+            "addons": {
+                config_file.as_posix(): {
+                    "tree_id": indexed.tree_id,
+                    "config": indexed.config,
+                    "translations": indexed.translations,
+                }
+                for config_file, indexed in self._index.items()
+            },
+        }
+        # Errors are logged on write, reading all add-ons on next start is fine
+        with suppress(ConfigurationFileError):
+            await self.sys_run_in_executor(
+                write_json_file, FILE_HASSIO_STORE_INDEX, data
+            )
+            self._index_changed = False
 
     async def update(self) -> None:
         """Read data from add-on repository."""
@@ -138,6 +230,17 @@ class StoreData(CoreSysAttributes):
             repositories[repo.slug] = repo.config
             addons.update(await self._read_addons_folder(repo.path, repo.slug))
 
+        # Forget add-ons which are gone
+        locations = {Path(config[ATTR_LOCATON]) for config in addons.values()}
+        index = {
+            config_file: indexed
+            for config_file, indexed in self._index.items()
+            if config_file.parent in locations
+        }
+        self._index_changed |= len(index) != len(self._index)
+        self._index = index
+        await self.save_index()
+
         # Add a timestamp when we first see a new version
         for slug, config in addons.items():
             old_config = self.addons.get(slug)
@@ -198,32 +301,55 @@ class StoreData(CoreSysAttributes):
             return {}
 
         def _process_addons_config() -> dict[str, dict[str, Any]]:
+            # Users edit the local repository in place, HEAD may not describe it
+            tree_ids = (
+                _read_git_tree_ids(path, addon_list)
+                if repository != REPOSITORY_LOCAL
+                else {}
+            )
             addons_config: dict[str, dict[str, Any]] = {}
             for addon in addon_list:
+                # Folder unchanged in git since last read, skip reading its files
+                tree_id = tree_ids.get(addon)
+                indexed = self._index.get(addon)
+                if tree_id and indexed and indexed.tree_id == tree_id:
+                    raw_config = indexed.config
+                else:
+                    indexed = None
+                    try:
+                        raw_config = read_json_or_yaml_file(addon)
+                    except ConfigurationFileError:
+                        _LOGGER.warning(
+                            "Can't read %s from repository %s", addon, repository
+                        )
+                        continue
+
+                # validate, the index holds configs as they were read
                 try:
-                    addon_config = read_json_or_yaml_file(addon)
-                except ConfigurationFileError:
-                    _LOGGER.warning(
-                        "Can't read %s from repository %s", addon, repository
-                    )
-                    continue
-
-                # validate
-                try:
-                    addon_config = SCHEMA_ADDON_CONFIG(addon_config)
+                    addon_config = SCHEMA_ADDON_CONFIG(deepcopy(raw_config))
                 except vol.Invalid as ex:
                     _LOGGER.warning(
-                        "Can't read %s: %s", addon, humanize_error(addon_config, ex)
+                        "Can't read %s: %s", addon, humanize_error(raw_config, ex)
                     )
                     continue
 
+                if indexed:
+                    translations = indexed.translations
+                else:
+                    translations = _read_addon_translations(addon.parent)
+                    if tree_id:
+                        self._index[addon] = IndexedAddon(
+                            tree_id, raw_config, translations
+                        )
+                        self._index_changed = True
+
                 # Generate slug
                 addon_slug = f"{repository}_{addon_config[ATTR_SLUG]}"
 
                 # store
                 addon_config[ATTR_REPOSITORY] = repository
                 addon_config[ATTR_LOCATON] = str(addon.parent)
-                addon_config[ATTR_TRANSLATIONS] = _read_addon_translations(addon.parent)
+                addon_config[ATTR_TRANSLATIONS] = deepcopy(translations)
                 addons_config[addon_slug] = addon_config
 
             return addons_config
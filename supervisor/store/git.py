@@ -1,23 +1,50 @@
 """Init file for Supervisor add-on Git."""
 import asyncio
+from collections.abc import Callable
+from datetime import datetime
 import functools as ft
 import logging
 from pathlib import Path
+import time
+from typing import Any
 
 import git
 
 from ..const import ATTR_BRANCH, ATTR_URL, URL_HASSIO_ADDONS
 from ..coresys import CoreSys, CoreSysAttributes
-from ..exceptions import StoreGitCloneError, StoreGitError, StoreJobError
+from ..exceptions import (
+    StoreGitCloneError,
+    StoreGitError,
+    StoreGitTimeoutError,
+    StoreJobError,
+)
 from ..jobs.decorator import Job, JobCondition
 from ..resolution.const import ContextType, IssueType, SuggestionType
 from ..utils import remove_folder
+from ..utils.dt import utcnow
+from .const import GIT_PULL_INCOMPLETE, GIT_PULL_TIMEOUT
 from .utils import get_hash_from_repository
 from .validate import RE_REPOSITORY
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
+def _run_until(deadline: float, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run git command, killing it once deadline passed.
+
+    Must be run in executor.
+    """
+    timeout = max(deadline - time.monotonic(), 1.0)
+    begin = time.monotonic()
+    try:
+        return func(*args, kill_after_timeout=timeout, **kwargs)
+    except git.CommandError as err:
+        # Failing only after running for the whole timeout means it got killed
+        if time.monotonic() - begin >= timeout:
+            raise StoreGitTimeoutError() from err
+        raise
+
+
 class GitRepo(CoreSysAttributes):
     """Manage Add-on Git repository."""
 
@@ -29,6 +56,8 @@ class GitRepo(CoreSysAttributes):
         self.repo: git.Repo | None = None
         self.path: Path = path
         self.lock: asyncio.Lock = asyncio.Lock()
+        self.last_pull: datetime | None = None
+        self.last_pull_duration: float | None = None
 
         self.data: dict[str, str] = RE_REPOSITORY.match(url).groupdict()
 
@@ -128,42 +157,18 @@ class GitRepo(CoreSysAttributes):
 
         async with self.lock:
             _LOGGER.info("Update add-on %s repository", self.url)
+            start = time.monotonic()
 
             try:
-                branch = self.repo.active_branch.name
-
-                # Download data
-                await self.sys_run_in_executor(
-                    ft.partial(
-                        self.repo.remotes.origin.fetch,
-                        **{"update-shallow": True, "depth": 1},
-                    )
-                )
-
-                if changed := self.repo.commit(branch) != self.repo.commit(
-                    f"origin/{branch}"
-                ):
-                    # Jump on top of that
-                    await self.sys_run_in_executor(
-                        ft.partial(self.repo.git.reset, f"origin/{branch}", hard=True)
-                    )
-
-                # Update submodules
-                await self.sys_run_in_executor(
-                    ft.partial(
-                        self.repo.git.submodule,
-                        "update",
-                        "--init",
-                        "--recursive",
-                        "--depth",
-                        "1",
-                    )
+                return await self.sys_run_in_executor(
+                    self._pull, start + GIT_PULL_TIMEOUT
                 )
 
-                # Cleanup old data
-                await self.sys_run_in_executor(ft.partial(self.repo.git.clean, "-xdf"))
-
-                return changed
+            except StoreGitTimeoutError as err:
+                raise StoreGitTimeoutError(
+                    f"Update of {self.url} repo did not complete within {GIT_PULL_TIMEOUT}s",
+                    _LOGGER.warning,
+                ) from err
 
             except (
                 git.InvalidGitRepositoryError,
@@ -182,6 +187,60 @@ class GitRepo(CoreSysAttributes):
                 )
                 raise StoreGitError() from err
 
+            finally:
+                self.last_pull = utcnow()
+                self.last_pull_duration = time.monotonic() - start
+
+    def _pull(self, deadline: float) -> bool:
+        """Sync repository with its remote and return True if it changed.
+
+        Must be run in executor.
+        """
+        branch = self.repo.active_branch.name
+        local_head = self.repo.commit(branch).hexsha
+        incomplete = Path(self.repo.git_dir, GIT_PULL_INCOMPLETE)
+        finish = incomplete.exists()
+
+        # Cheap check on remote head before downloading anything
+        remote_head = _run_until(
+            deadline, self.repo.git.ls_remote, "origin", f"refs/heads/{branch}"
+        )
+        if not finish and remote_head and remote_head.split()[0] == local_head:
+            _LOGGER.debug("Add-on %s repository is up to date", self.url)
+            return False
+
+        # Download data
+        _run_until(
+            deadline,
+            self.repo.remotes.origin.fetch,
+            **{"update-shallow": True, "depth": 1},
+        )
+        if not finish and self.repo.commit(f"origin/{branch}").hexsha == local_head:
+            return False
+
+        if finish:
+            _LOGGER.info("Finishing interrupted update of %s repository", self.url)
+        incomplete.touch()
+
+        # Jump on top of that, killing it could leave the index locked
+        self.repo.git.reset(f"origin/{branch}", hard=True)
+
+        # Update submodules
+        _run_until(
+            deadline,
+            self.repo.git.submodule,
+            "update",
+            "--init",
+            "--recursive",
+            "--depth",
+            "1",
+        )
+
+        # Cleanup old data, killing it could leave the index locked
+        self.repo.git.clean("-xdf")
+        incomplete.unlink()
+        return True
+
     async def _remove(self):
         """Remove a repository."""
         if self.lock.locked():
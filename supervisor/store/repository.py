@@ -1,5 +1,6 @@
 """Represent a Supervisor repository."""
 
+from datetime import datetime
 import logging
 from pathlib import Path
 
@@ -73,6 +74,16 @@ class Repository(CoreSysAttributes):
         """Return url of repository."""
         return self.data.get(ATTR_MAINTAINER, UNKNOWN)
 
+    @property
+    def last_update(self) -> datetime | None:
+        """Return when repository was last synced with its remote."""
+        return self.git.last_pull if self.git else None
+
+    @property
+    def last_update_duration(self) -> float | None:
+        """Return how long last sync with remote took in seconds."""
+        return self.git.last_pull_duration if self.git else None
+
     def validate(self) -> bool:
         """Check if store is valid."""
         if self.type != StoreType.GIT:
@@ -0,0 +1,166 @@
+"""In-memory search index over add-ons inside the store."""
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+import re
+
+from .addon import AddonStore
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+RE_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> set[str]:
+    """Split text into lower case search tokens."""
+    return set(RE_TOKEN.findall(text.casefold()))
+
+
+@dataclass(slots=True, frozen=True)
+class IndexedDocument:
+    """Searchable fields of a store add-on."""
+
+    name: str
+    slug: str
+    description: str
+    repository: str
+    arch: tuple[str, ...]
+    stage: str
+
+    @classmethod
+    def from_addon(cls, addon: AddonStore) -> "IndexedDocument":
+        """Read searchable fields from a store add-on."""
+        return cls(
+            name=addon.name,
+            slug=addon.slug,
+            description=addon.description,
+            repository=addon.repository,
+            arch=tuple(addon.supported_arch),
+            stage=str(addon.stage),
+        )
+
+    @property
+    def tokens(self) -> set[str]:
+        """Return all search tokens of the document."""
+        return tokenize(
+            " ".join(
+                (
+                    self.name,
+                    self.slug,
+                    self.description,
+                    self.repository,
+                    *self.arch,
+                    self.stage,
+                )
+            )
+        )
+
+
+class AddonSearchIndex:
+    """Inverted index over name, slug, description, repository, arch and stage."""
+
+    def __init__(self):
+        """Initialize search index."""
+        self._documents: dict[str, IndexedDocument] = {}
+        self._tokens: dict[str, set[str]] = {}
+        self._sorted_tokens: list[str] | None = None
+
+    def __len__(self) -> int:
+        """Return number of indexed add-ons."""
+        return len(self._documents)
+
+    def update(self, addons: Mapping[str, AddonStore]) -> None:
+        """Sync index with add-ons, re-indexing only the ones which changed."""
+        removed = self._documents.keys() - addons.keys()
+        for slug in removed:
+            self._remove(slug)
+
+        changed = 0
+        for slug, addon in addons.items():
+            try:
+                document = IndexedDocument.from_addon(addon)
+            except KeyError:
+                # Add-on data vanished between reload and index update
+                continue
+
+            if self._documents.get(slug) == document:
+                continue
+
+            self._remove(slug)
+            self._add(slug, document)
+            changed += 1
+
+        _LOGGER.debug(
+            "Search index updated: %d add-ons - %d changed - %d removed",
+            len(self._documents),
+            changed,
+            len(removed),
+        )
+
+    def _add(self, slug: str, document: IndexedDocument) -> None:
+        """Add document to index."""
+        self._documents[slug] = document
+        for token in document.tokens:
+            if token not in self._tokens:
+                self._tokens[token] = set()
+                self._sorted_tokens = None
+            self._tokens[token].add(slug)
+
+    def _remove(self, slug: str) -> None:
+        """Remove document from index."""
+        if not (document := self._documents.pop(slug, None)):
+            return
+
+        for token in document.tokens:
+            if not (slugs := self._tokens.get(token)):
+                continue
+            slugs.discard(slug)
+            if not slugs:
+                del self._tokens[token]
+                self._sorted_tokens = None
+
+    def _match_prefix(self, prefix: str) -> set[str]:
+        """Return slugs with a token starting with prefix."""
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._tokens)
+
+        slugs: set[str] = set()
+        index = bisect_left(self._sorted_tokens, prefix)
+        while index < len(self._sorted_tokens) and self._sorted_tokens[
+            index
+        ].startswith(prefix):
+            slugs |= self._tokens[self._sorted_tokens[index]]
+            index += 1
+        return slugs
+
+    def search(
+        self,
+        query: str | None = None,
+        *,
+        repository: str | None = None,
+        arch: str | None = None,
+        stage: str | None = None,
+    ) -> list[str]:
+        """Return slugs of add-ons matching all query terms and filters.
+
+        Every term of the query has to be a prefix of a token of the add-on.
+        Results are ordered by name.
+        """
+        candidates: set[str] | None = None
+        for term in sorted(tokenize(query or ""), key=len, reverse=True):
+            matches = self._match_prefix(term)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+
+        slugs = self._documents if candidates is None else candidates
+        documents = [
+            document
+            for document in map(self._documents.__getitem__, slugs)
+            if (repository is None or document.repository == repository)
+            and (arch is None or arch in document.arch)
+            and (stage is None or document.stage == stage)
+        ]
+        documents.sort(key=lambda document: (document.name.casefold(), document.slug))
+        return [document.slug for document in documents]
@@ -2,9 +2,15 @@
 
 import voluptuous as vol
 
-from ..const import ATTR_MAINTAINER, ATTR_NAME, ATTR_REPOSITORIES, ATTR_URL
+from ..const import (
+    ATTR_MAINTAINER,
+    ATTR_NAME,
+    ATTR_RELOAD_CONCURRENCY,
+    ATTR_REPOSITORIES,
+    ATTR_URL,
+)
 from ..validate import RE_REPOSITORY
-from .const import StoreType
+from .const import STORE_RELOAD_CONCURRENCY, STORE_RELOAD_CONCURRENCY_MAX, StoreType
 
 URL_COMMUNITY_ADDONS = "https://github.com/hassio-addons/repository"
 URL_ESPHOME = "https://github.com/esphome/home-assistant-addon"
@@ -50,11 +56,18 @@ def ensure_builtin_repositories(addon_repositories: list[str]) -> list[str]:
 # pylint: disable=no-value-for-parameter
 repositories = vol.All([validate_repository], vol.Unique(), ensure_builtin_repositories)
 
+reload_concurrency = vol.All(
+    vol.Coerce(int), vol.Range(min=1, max=STORE_RELOAD_CONCURRENCY_MAX)
+)
+
 SCHEMA_STORE_FILE = vol.Schema(
     {
         vol.Optional(
             ATTR_REPOSITORIES, default=list(BUILTIN_REPOSITORIES)
         ): repositories,
+        vol.Optional(
+            ATTR_RELOAD_CONCURRENCY, default=STORE_RELOAD_CONCURRENCY
+        ): reload_concurrency,
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 import logging
+from pathlib import Path
 from typing import Any
 
 from dbus_fast import (
@@ -12,6 +16,7 @@ from dbus_fast import (
     Message,
     MessageType,
     Variant,
+    unpack_variants as unpack_dbus_variants,
 )
 from dbus_fast.aio.message_bus import MessageBus
 from dbus_fast.aio.proxy_object import ProxyInterface, ProxyObject
@@ -32,14 +37,221 @@ from ..exceptions import (
     DBusServiceUnkownError,
     DBusTimeoutError,
     HassioNotSupportedError,
+    JsonFileError,
 )
+from .json import read_json_file, write_json_file
 from .sentry import capture_exception
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 DBUS_INTERFACE_OBJECT_MANAGER: str = "org.freedesktop.DBus.ObjectManager"
 DBUS_INTERFACE_PROPERTIES: str = "org.freedesktop.DBus.Properties"
+DBUS_METHOD_GET: str = "Get"
 DBUS_METHOD_GETALL: str = "org.freedesktop.DBus.Properties.GetAll"
+DBUS_METHOD_GET_MANAGED_OBJECTS: str = "GetManagedObjects"
+
+
+@dataclass(slots=True)
+class ManagedObjects:
+    """Objects, interfaces and properties of a service from its object manager."""
+
+    bus_name: str
+    version: str | None
+    objects: dict[str, dict[str, dict[str, Any]]] = field(default_factory=dict)
+
+    def get_interfaces(self, bus_name: str, object_path: str) -> frozenset[str] | None:
+        """Return interfaces of object, none if object is unknown."""
+        if bus_name != self.bus_name or object_path not in self.objects:
+            return None
+        return frozenset(self.objects[object_path])
+
+    def get_properties(
+        self, bus_name: str, object_path: str, interface: str
+    ) -> dict[str, Any] | None:
+        """Return properties of interface on object, none if unknown."""
+        if bus_name != self.bus_name:
+            return None
+        return self.objects.get(object_path, {}).get(interface)
+
+
+# Snapshot of managed objects for the bring-up running in the current task
+_MANAGED_OBJECTS: ContextVar[ManagedObjects | None] = ContextVar(
+    "dbus_managed_objects", default=None
+)
+
+IntrospectionKey = tuple[str, frozenset[str], str | None]
+
+
+class IntrospectionCache:
+    """Introspection shared by objects of a service implementing the same interfaces.
+
+    Entries are keyed by bus name, interfaces and service version. They can be
+    stored on disk to skip introspection of known objects on the next start.
+    """
+
+    def __init__(self) -> None:
+        """Initialize introspection cache."""
+        self._nodes: dict[IntrospectionKey, Node] = {}
+        self._used: set[IntrospectionKey] = set()
+        self._changed: bool = False
+
+    def get(self, key: IntrospectionKey) -> Node | None:
+        """Return introspection for key."""
+        if node := self._nodes.get(key):
+            self._used.add(key)
+        return node
+
+    def set(self, key: IntrospectionKey, node: Node) -> None:
+        """Store introspection for key."""
+        self._nodes[key] = node
+        self._used.add(key)
+        self._changed = True
+
+    def remove(self, key: IntrospectionKey) -> None:
+        """Remove introspection for key."""
+        self._nodes.pop(key, None)
+        self._used.discard(key)
+        self._changed = True
+
+    def load(self, path: Path) -> None:
+        """Load introspection stored on disk.
+
+        Must be run in executor.
+        """
+        if not path.is_file():
+            return
+
+        try:
+            entries = read_json_file(path)
+        except JsonFileError:
+            return
+
+        for entry in entries:
+            try:
+                key = (
+                    entry["bus_name"],
+                    frozenset(entry["interfaces"]),
+                    entry["version"],
+                )
+                self._nodes.setdefault(key, Node.parse(entry["xml"]))
+            except (KeyError, TypeError, ValueError, SyntaxError) as err:
+                _LOGGER.debug("Ignoring invalid introspection in %s: %s", path, err)
+        _LOGGER.debug("Loaded %d cached D-Bus introspections", len(self._nodes))
+
+    def save(self, path: Path) -> None:
+        """Store introspection used since start on disk.
+
+        Entries of services which changed version are dropped this way.
+        Must be run in executor.
+        """
+        if not self._changed and self._used == self._nodes.keys():
+            return
+
+        write_json_file(
+            path,
+            [
+                {
+                    "bus_name": bus_name,
+                    "interfaces": sorted(interfaces),
+                    "version": version,
+                    "xml": self._nodes[bus_name, interfaces, version].tostring(),
+                }
+                for bus_name, interfaces, version in self._used
+            ],
+        )
+        self._changed = False
+
+
+INTROSPECTION_CACHE = IntrospectionCache()
+
+
+def _introspection_matches(node: Node, interfaces: dict[str, dict[str, Any]]) -> bool:
+    """Return true if introspection has all interfaces and properties of an object."""
+    node_interfaces = {interface.name: interface for interface in node.interfaces}
+    for name, properties in interfaces.items():
+        if name not in node_interfaces:
+            return False
+        if not properties.keys() <= {
+            prop.name for prop in node_interfaces[name].properties
+        }:
+            return False
+    return True
+
+
+@asynccontextmanager
+async def managed_objects(
+    bus: MessageBus, bus_name: str, object_path: str, version: str | None
+) -> AsyncIterator[ManagedObjects | None]:
+    """Use one GetManagedObjects call for objects connected or updated in context.
+
+    Within the context introspection of objects is shared between objects with
+    the same interfaces and properties are taken from the snapshot instead of
+    calling GetAll for each object. Services without object manager at
+    object_path fall back to individual calls.
+    """
+    snapshot: ManagedObjects | None = None
+    try:
+        reply = await bus.call(
+            Message(
+                destination=bus_name,
+                path=object_path,
+                interface=DBUS_INTERFACE_OBJECT_MANAGER,
+                member=DBUS_METHOD_GET_MANAGED_OBJECTS,
+            )
+        )
+    except (EOFError, TimeoutError) as err:
+        _LOGGER.debug("Can't get managed objects of %s: %s", bus_name, err)
+    else:
+        if reply.message_type == MessageType.METHOD_RETURN and reply.body:
+            snapshot = ManagedObjects(
+                bus_name, version, unpack_dbus_variants(reply.body[0])
+            )
+        else:
+            _LOGGER.debug("No object manager for %s at %s", bus_name, object_path)
+
+    token = _MANAGED_OBJECTS.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _MANAGED_OBJECTS.reset(token)
+
+
+async def read_property(
+    bus: MessageBus, bus_name: str, object_path: str, interface: str, name: str
+) -> Any:
+    """Read a single property of an object without introspecting it.
+
+    Uses the managed objects snapshot of the current context if it has the object.
+    """
+    if (snapshot := _MANAGED_OBJECTS.get()) and name in (
+        properties := snapshot.get_properties(bus_name, object_path, interface) or {}
+    ):
+        return properties[name]
+
+    try:
+        reply = await bus.call(
+            Message(
+                destination=bus_name,
+                path=object_path,
+                interface=DBUS_INTERFACE_PROPERTIES,
+                member=DBUS_METHOD_GET,
+                signature="ss",
+                body=[interface, name],
+            )
+        )
+    except (EOFError, TimeoutError) as err:
+        raise DBusTimeoutError(
+            f"No reply reading {name} of {object_path}: {err!s}"
+        ) from err
+
+    if reply.message_type == MessageType.ERROR:
+        raise DBus.from_dbus_error(
+            DBusFastDBusError(
+                reply.error_name or ErrorType.FAILED,
+                reply.body[0] if reply.body else "",
+            )
+        )
+    return unpack_dbus_variants(reply.body[0])
 
 
 class DBus:
@@ -124,7 +336,37 @@ class DBus:
         }
 
     async def introspect(self) -> Node:
-        """Return introspection for dbus object."""
+        """Return introspection for dbus object.
+
+        Shares introspection with objects of the same service and interfaces
+        during a managed objects bring-up.
+        """
+        snapshot = _MANAGED_OBJECTS.get()
+        if not snapshot or not (
+            interfaces := snapshot.get_interfaces(self.bus_name, self.object_path)
+        ):
+            return await self._introspect()
+
+        key = (self.bus_name, interfaces, snapshot.version)
+        if introspection := INTROSPECTION_CACHE.get(key):
+            if _introspection_matches(
+                introspection, snapshot.objects[self.object_path]
+            ):
+                return introspection
+
+            _LOGGER.debug(
+                "Cached introspection of %s - %s is outdated",
+                self.bus_name,
+                self.object_path,
+            )
+            INTROSPECTION_CACHE.remove(key)
+
+        introspection = await self._introspect()
+        INTROSPECTION_CACHE.set(key, introspection)
+        return introspection
+
+    async def _introspect(self) -> Node:
+        """Fetch introspection for dbus object."""
         for _ in range(3):
             try:
                 return await self._bus.introspect(
@@ -210,6 +452,13 @@ class DBus:
             raise DBusInterfaceError(
                 f"DBus Object does not have interface {DBUS_INTERFACE_PROPERTIES}"
             )
+
+        if (snapshot := _MANAGED_OBJECTS.get()) and (
+            properties := snapshot.get_properties(
+                self.bus_name, self.object_path, interface
+            )
+        ) is not None:
+            return dict(properties)
         return await self.properties.call_get_all(interface)
 
     def sync_property_changes(
@@ -8,6 +8,12 @@ from aiohttp import ClientResponse
 from supervisor.exceptions import MalformedBinaryEntryError
 from supervisor.host.const import LogFormatter
 
+# Read the export stream in large blocks instead of line by line
+READ_BLOCK_SIZE = 64 * 1024
+JOURNAL_FIELD_CURSOR = "__CURSOR"
+JOURNAL_FIELD_SIZE_BYTES = 8
+NEWLINE = ord("\n")
+
 
 def formatter(required_fields: list[str]):
     """Decorate journal entry formatters with list of required fields.
@@ -58,11 +64,90 @@ def journal_verbose_formatter(entries: dict[str, str]) -> str:
     return f"{ts} {entries.get("_HOSTNAME", "")} {identifier}: {entries.get("MESSAGE", "")}"
 
 
+def _parse_entries(
+    buffer: bytearray, fields: set[str], entry: dict[str, str]
+) -> tuple[int, list[dict[str, str]]]:
+    """Parse complete fields from buffer into entries.
+
+    Returns offset up to which the buffer was consumed and the finished entries.
+    Fields of the entry which is still incomplete are collected in entry.
+    """
+    entries: list[dict[str, str]] = []
+    pos = 0
+    while (eol := buffer.find(b"\n", pos)) != -1:
+        # newline means end of entry
+        if eol == pos:
+            pos += 1
+            if entry:
+                entries.append(entry.copy())
+                entry.clear()
+            continue
+
+        # Journal fields consisting only of valid non-control UTF-8 codepoints
+        # are serialized as they are (i.e. the field name, followed by '=',
+        # followed by field data), followed by a newline as separator to the next
+        # field. Note that fields containing newlines cannot be formatted like
+        # this. Non-control UTF-8 codepoints are the codepoints with value at or
+        # above 32 (' '), or equal to 9 (TAB).
+        if (sep := buffer.find(b"=", pos, eol)) != -1:
+            name = buffer[pos:sep]
+            data_start, data_end = sep + 1, eol
+        else:
+            # Other journal fields are serialized in a special binary safe way:
+            # field name, followed by newline, followed by a binary 64-bit little
+            # endian size value, followed by the binary field data, followed by a
+            # newline as separator to the next field.
+            name = buffer[pos:eol]
+            data_start = eol + 1 + JOURNAL_FIELD_SIZE_BYTES
+            if len(buffer) < data_start:
+                break
+            data_end = data_start + int.from_bytes(
+                buffer[eol + 1 : data_start], byteorder="little"
+            )
+            if len(buffer) <= data_end:
+                break
+            if buffer[data_end] != NEWLINE:
+                raise MalformedBinaryEntryError(
+                    f"Failed parsing binary entry {bytes(buffer[data_start:data_end + 1])}"
+                )
+
+        pos = data_end + 1
+        if (name := name.decode("utf-8")) in fields:
+            entry[name] = buffer[data_start:data_end].decode("utf-8")
+
+    return pos, entries
+
+
+async def journal_entries_reader(
+    journal_logs: ClientResponse, fields: set[str]
+) -> AsyncGenerator[dict[str, str], None]:
+    """Read entries from systemd journal export stream in large blocks.
+
+    Only the given fields are decoded, everything else is skipped.
+    """
+    async with journal_logs as resp:
+        buffer = bytearray()
+        entry: dict[str, str] = {}
+        while chunk := await resp.content.read(READ_BLOCK_SIZE):
+            buffer += chunk
+            consumed, entries = _parse_entries(buffer, fields, entry)
+            del buffer[:consumed]
+            for parsed in entries:
+                yield parsed
+
+        # Stream ended without an empty line after the last entry
+        if entry:
+            yield entry
+
+
 async def journal_logs_reader(
     journal_logs: ClientResponse,
     log_formatter: LogFormatter = LogFormatter.PLAIN,
-) -> AsyncGenerator[str, None]:
-    """Read logs from systemd journal line by line, formatted using the given formatter."""
+) -> AsyncGenerator[tuple[str | None, str], None]:
+    """Read logs from systemd journal, formatted using the given formatter.
+
+    Yields tuples of the cursor of the entry and the formatted line.
+    """
     match log_formatter:
         case LogFormatter.PLAIN:
             formatter_ = journal_plain_formatter
@@ -71,45 +156,9 @@ async def journal_logs_reader(
         case _:
             raise ValueError(f"Unknown log format: {log_formatter}")
 
-    async with journal_logs as resp:
-        entries: dict[str, str] = {}
-        while not resp.content.at_eof():
-            line = await resp.content.readuntil(b"\n")
-            # newline means end of message, also empty line is sometimes returned
-            # at EOF (likely race between at_eof and EOF check in readuntil)
-            if line == b"\n" or not line:
-                if entries:
-                    yield formatter_(entries)
-                entries = {}
-                continue
-
-            # Journal fields consisting only of valid non-control UTF-8 codepoints
-            # are serialized as they are (i.e. the field name, followed by '=',
-            # followed by field data), followed by a newline as separator to the next
-            # field. Note that fields containing newlines cannot be formatted like
-            # this. Non-control UTF-8 codepoints are the codepoints with value at or
-            # above 32 (' '), or equal to 9 (TAB).
-            name, sep, data = line.partition(b"=")
-            if not sep:
-                # Other journal fields are serialized in a special binary safe way:
-                # field name, followed by newline
-                name = name[:-1]  # strip \n
-                # followed by a binary 64-bit little endian size value,
-                length_raw = await resp.content.readexactly(8)
-                length = int.from_bytes(length_raw, byteorder="little")
-                # followed by the binary field data,
-                data = await resp.content.readexactly(length + 1)
-                # followed by a newline as separator to the next field.
-                if not data.endswith(b"\n"):
-                    raise MalformedBinaryEntryError(
-                        f"Failed parsing binary entry {data}"
-                    )
-
-            name = name.decode("utf-8")
-            if name not in formatter_.required_fields:
-                # we must read to the end of the entry in the stream, so we can
-                # only continue the loop here
-                continue
-
-            # strip \n for simple fields before decoding
-            entries[name] = data[:-1].decode("utf-8")
+    fields = {*formatter_.required_fields, JOURNAL_FIELD_CURSOR}
+    async for entry in journal_entries_reader(journal_logs, fields):
+        # entry has none of the fields the formatter needs
+        if entry.keys() <= {JOURNAL_FIELD_CURSOR}:
+            continue
+        yield entry.get(JOURNAL_FIELD_CURSOR), formatter_(entry)
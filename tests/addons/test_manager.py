@@ -1,11 +1,13 @@
 """Test addon manager."""
 
 import asyncio
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 
 from awesomeversion import AwesomeVersion
 import pytest
+import time_machine
 
 from supervisor.addons.addon import Addon
 from supervisor.arch import CpuArch
@@ -27,6 +29,7 @@ from supervisor.plugins.dns import PluginDns
 from supervisor.store.repository import Repository
 from supervisor.utils import check_exception_chain
 from supervisor.utils.common import write_json_file
+from supervisor.utils.dt import utcnow
 
 from tests.common import load_json_fixture
 from tests.const import TEST_ADDON_SLUG
@@ -441,3 +444,108 @@ async def test_watchdog_runs_during_update(
         await asyncio.sleep(0)
         start.assert_called_once()
         restart.assert_not_called()
+
+
+async def test_from_token(coresys: CoreSys, install_addon_ssh: Addon):
+    """Test add-on lookup by Supervisor token uses and refreshes the index."""
+    install_addon_ssh.persist["access_token"] = "abc123"
+    assert coresys.addons.from_token("abc123") is install_addon_ssh
+    assert coresys.addons.from_token(None) is None
+
+    # Unknown tokens don't rebuild the index on every lookup
+    with patch.object(
+        type(coresys.addons), "update_token_index"
+    ) as update_token_index:
+        assert coresys.addons.from_token("abc123") is install_addon_ssh
+        assert coresys.addons.from_token("bad") is None
+        update_token_index.assert_not_called()
+
+    # Rotated token is not served from the stale index
+    install_addon_ssh.persist["access_token"] = "def456"
+    assert coresys.addons.from_token("abc123") is None
+    assert coresys.addons.from_token("def456") is None
+
+    with time_machine.travel(utcnow() + timedelta(seconds=10)):
+        assert coresys.addons.from_token("def456") is install_addon_ssh
+
+
+def _boot_addon_mock(slug: str, boot_after: list[str], started: list[str]) -> Mock:
+    """Return add-on mock recording the order of starts."""
+    addon = Mock(
+        spec=Addon,
+        slug=slug,
+        repository="local",
+        boot=AddonBoot.AUTO,
+        startup=AddonStartup.APPLICATION,
+        boot_after=boot_after,
+        state=AddonState.STOPPED,
+    )
+
+    async def _startup():
+        await asyncio.sleep(0.01)
+        addon.state = AddonState.STARTED
+
+    async def _start():
+        started.append(slug)
+        return asyncio.create_task(_startup())
+
+    addon.start = _start
+    return addon
+
+
+async def test_boot_dependency_order(
+    coresys: CoreSys, caplog: pytest.LogCaptureFixture
+):
+    """Test add-ons start after the add-ons listed in boot_after."""
+    started: list[str] = []
+    addons = {
+        "app_1": _boot_addon_mock("app_1", ["database"], started),
+        "app_2": _boot_addon_mock("app_2", ["database", "not_installed"], started),
+        "database": _boot_addon_mock("database", [], started),
+        "other": _boot_addon_mock("other", [], started),
+    }
+
+    with patch.dict(coresys.addons.local, addons, clear=True):
+        await coresys.addons.boot(AddonStartup.APPLICATION)
+
+    assert started[:2] == ["database", "other"]
+    assert set(started[2:]) == {"app_1", "app_2"}
+    assert all(addon.state == AddonState.STARTED for addon in addons.values())
+    assert "Add-on database is started after" in caplog.text
+
+
+async def test_boot_circular_dependency(
+    coresys: CoreSys, caplog: pytest.LogCaptureFixture
+):
+    """Test add-ons with circular boot dependencies are started anyway."""
+    started: list[str] = []
+    addons = {
+        "first": _boot_addon_mock("first", ["second"], started),
+        "second": _boot_addon_mock("second", ["first"], started),
+        "third": _boot_addon_mock("third", ["second"], started),
+    }
+
+    with patch.dict(coresys.addons.local, addons, clear=True):
+        await coresys.addons.boot(AddonStartup.APPLICATION)
+
+    # Add-ons waiting for an add-on in a cycle still wait for it
+    assert set(started[:2]) == {"first", "second"}
+    assert started[2] == "third"
+    assert "first, second have circular boot dependencies" in caplog.text
+
+
+async def test_boot_dependency_repository_slug(
+    coresys: CoreSys, caplog: pytest.LogCaptureFixture
+):
+    """Test boot_after entries are resolved within the repository of the add-on."""
+    started: list[str] = []
+    addons = {
+        "local_app": _boot_addon_mock("local_app", ["database", "missing"], started),
+        "local_database": _boot_addon_mock("local_database", [], started),
+    }
+
+    with patch.dict(coresys.addons.local, addons, clear=True):
+        await coresys.addons.boot(AddonStartup.APPLICATION)
+
+    assert started == ["local_database", "local_app"]
+    assert "Add-on local_app waits on boot for unknown add-on missing" in caplog.text
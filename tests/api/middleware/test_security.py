@@ -10,6 +10,14 @@ import urllib3
 
 from supervisor.addons.addon import Addon
 from supervisor.api import RestAPI
+from supervisor.api.middleware.security import (
+    ADDONS_API_BYPASS,
+    ADDONS_ROLE_ACCESS,
+    BLACKLIST,
+    NO_SECURITY_CHECK,
+    OBSERVER_CHECK,
+    resolve_path_access,
+)
 from supervisor.const import ROLE_ALL, CoreState
 from supervisor.coresys import CoreSys
 
@@ -205,3 +213,48 @@ async def test_token_validation(
             request_path, headers={"Authorization": "Bearer abc123"}
         )
         assert resp.status == 403
+
+
+@pytest.mark.parametrize(
+    "request_path",
+    [
+        "/",
+        "/info",
+        "/auth",
+        "/auth/cache",
+        "/core/api/hassio/app",
+        "/core/api/states",
+        "/core/websocket",
+        "/homeassistant/api/hassio/app",
+        "/supervisor/ping",
+        "/supervisor/info",
+        "/ingress/abc-123/index.html",
+        "/app/entrypoint.js",
+        "/addons",
+        "/addons/reload",
+        "/addons/self/info",
+        "/addons/self/security",
+        "/addons/self/update",
+        "/addons/self/options/config",
+        "/addons/local_ssh/logo",
+        "/addons/local_ssh/security",
+        "/store/addons/local_ssh/icon",
+        "/backups/new/full",
+        "/discovery/abc123",
+        "/os/datadisk/wipe",
+        "/os/datadisk/move",
+        "/services/mqtt",
+    ],
+)
+async def test_resolve_path_access(request_path: str):
+    """Test resolved path access matches the access rules."""
+    access = resolve_path_access(request_path)
+
+    assert access.blacklisted is bool(BLACKLIST.match(request_path))
+    assert access.no_security_check is bool(NO_SECURITY_CHECK.match(request_path))
+    assert access.observer is bool(OBSERVER_CHECK.match(request_path))
+    assert access.addons_api_bypass is bool(ADDONS_API_BYPASS.match(request_path))
+    assert access.roles == {
+        role for role, regex in ADDONS_ROLE_ACCESS.items() if regex.match(request_path)
+    }
+    assert resolve_path_access(request_path) is access
@@ -0,0 +1,45 @@
+"""Test API response cache."""
+
+from aiohttp.test_utils import TestClient
+
+from supervisor.addons.addon import Addon
+from supervisor.const import BusEvent
+from supervisor.coresys import CoreSys
+
+
+async def test_addons_etag(
+    api_client: TestClient, coresys: CoreSys, install_addon_ssh: Addon
+):
+    """Test conditional requests are answered with 304 until invalidated."""
+    resp = await api_client.get("/addons")
+    assert resp.status == 200
+    assert (etag := resp.headers["ETag"])
+
+    resp = await api_client.get("/addons", headers={"If-None-Match": etag})
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+
+    resp = await api_client.get("/addons", headers={"If-None-Match": '"other"'})
+    assert resp.status == 200
+
+    coresys.api.response_cache.invalidate()
+    resp = await api_client.get("/addons", headers={"If-None-Match": etag})
+    assert resp.status == 200
+    assert resp.headers["ETag"] == etag
+
+
+async def test_invalidate_on_event(api_client: TestClient, coresys: CoreSys):
+    """Test cache is invalidated by bus events."""
+    await coresys.api.response_cache.load()
+
+    resp = await api_client.get("/supervisor/info")
+    etag = resp.headers["ETag"]
+    assert coresys.api.response_cache.get("/supervisor/info") == etag.strip('"')
+
+    await coresys.api.response_cache._invalidate_on_event(
+        BusEvent.SUPERVISOR_JOB_END
+    )
+    assert coresys.api.response_cache.get("/supervisor/info") is None
+
+    resp = await api_client.get("/supervisor/info", headers={"If-None-Match": etag})
+    assert resp.status == 200
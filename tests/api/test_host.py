@@ -1,14 +1,17 @@
 """Test Host API."""
 
+from pathlib import Path
 from unittest.mock import ANY, MagicMock
 
 from aiohttp.test_utils import TestClient
 import pytest
 
+from supervisor.addons.addon import Addon
 from supervisor.coresys import CoreSys
 from supervisor.dbus.resolved import Resolved
 from supervisor.host.const import LogFormat, LogFormatter
 
+from tests.common import load_fixture
 from tests.dbus_service_mocks.base import DBusServiceMock
 from tests.dbus_service_mocks.systemd import Systemd as SystemdService
 
@@ -41,6 +44,57 @@ async def test_api_host_info(api_client: TestClient, coresys_disk_info: CoreSys)
     assert result["data"]["apparmor_version"] == "2.13.2"
 
 
+async def test_api_host_disk_metrics(
+    api_client: TestClient, coresys_disk_info: CoreSys
+):
+    """Test disk metrics api returns latest sample and history."""
+    coresys = coresys_disk_info
+    await coresys.host.info.load()
+
+    resp = await api_client.get("/host/disk/metrics")
+    result = await resp.json()
+    assert result["data"]["disk_free"] == 5000
+    assert result["data"]["disk_used"] == 45000
+    assert len(result["data"]["history"]) == 1
+
+    coresys.hardware.disk.get_disk_free_space = lambda _: 4000
+    await coresys.host.info.record_disk_metrics()
+
+    resp = await api_client.get("/host/disk/metrics")
+    result = await resp.json()
+    assert result["data"]["disk_free"] == 4000
+    assert [sample["disk_free"] for sample in result["data"]["history"]] == [
+        5000,
+        4000,
+    ]
+
+
+async def test_api_host_disk_usage(
+    api_client: TestClient,
+    coresys: CoreSys,
+    install_addon_ssh: Addon,
+    tmp_supervisor_data: Path,
+):
+    """Test disk usage of add-on data, backups and share."""
+    install_addon_ssh.path_data.mkdir()
+    (install_addon_ssh.path_data / "options.json").write_bytes(b"0" * 10000)
+    (coresys.config.path_share / "file").write_bytes(b"0" * 20000)
+
+    resp = await api_client.get(f"/addons/{install_addon_ssh.slug}/info")
+    result = await resp.json()
+    assert result["data"]["disk_usage"] is None
+
+    resp = await api_client.get("/host/disk/usage")
+    result = await resp.json()
+    assert result["data"]["addons"][install_addon_ssh.slug] >= 10000
+    assert result["data"]["share"] >= 20000
+    assert result["data"]["backups"] == [{"location": None, "size": ANY}]
+
+    resp = await api_client.get(f"/addons/{install_addon_ssh.slug}/info")
+    result = await resp.json()
+    assert result["data"]["disk_usage"] >= 10000
+
+
 async def test_api_host_features(
     api_client: TestClient, coresys_disk_info: CoreSys, dbus_is_connected
 ):
@@ -236,6 +290,124 @@ async def test_advanced_logs(
     )
 
 
+async def test_advanced_logs_cursor_and_filters(
+    api_client: TestClient, coresys: CoreSys, journald_logs: MagicMock
+):
+    """Test advanced logging API with cursor pagination and filters."""
+    cursor = "s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2ce"
+
+    await api_client.get(f"/host/logs/identifiers/dropbear?since={cursor}&lines=20")
+    journald_logs.assert_called_once_with(
+        params={"SYSLOG_IDENTIFIER": "dropbear"},
+        range_header=f"entries={cursor}:1:20",
+        accept=LogFormat.JOURNAL,
+    )
+
+    journald_logs.reset_mock()
+
+    await api_client.get(f"/host/logs?until={cursor}&priority=3")
+    journald_logs.assert_called_once_with(
+        params={
+            "SYSLOG_IDENTIFIER": coresys.host.logs.default_identifiers,
+            "PRIORITY": ["0", "1", "2", "3"],
+        },
+        range_header=f"entries={cursor}:-100:100",
+        accept=LogFormat.JOURNAL,
+    )
+
+    journald_logs.reset_mock()
+
+    await api_client.get("/host/logs?identifier=kernel&identifier=systemd")
+    journald_logs.assert_called_once_with(
+        params={"SYSLOG_IDENTIFIER": ["kernel", "systemd"]},
+        range_header=DEFAULT_RANGE,
+        accept=LogFormat.JOURNAL,
+    )
+
+    journald_logs.reset_mock()
+
+    resp = await api_client.get(f"/host/logs?since={cursor}&until={cursor}")
+    assert resp.status == 400
+    resp = await api_client.get("/host/logs?priority=8")
+    assert resp.status == 400
+    journald_logs.assert_not_called()
+
+
+async def test_advanced_logs_first_cursor_and_text(
+    api_client: TestClient, journald_gateway: MagicMock
+):
+    """Test cursor of first entry is returned and text filter is applied."""
+    journald_gateway.feed_data(load_fixture("logs_export_host.txt").encode("utf-8"))
+    journald_gateway.feed_eof()
+
+    resp = await api_client.get("/host/logs/identifiers/systemd?text=HOSTNAME")
+    assert resp.headers["X-First-Cursor"].startswith(
+        "s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2ce;"
+    )
+    assert await resp.text() == "Started Hostname Service.\n"
+
+
+async def test_advanced_logs_text_counts_matches(
+    api_client: TestClient, journald_gateway: MagicMock
+):
+    """Test lines counts entries matching the text filter, not entries read."""
+    export = "".join(
+        f"__CURSOR=c{i}\nSYSLOG_IDENTIFIER=systemd\nMESSAGE={message} {i}\n\n"
+        for i, message in enumerate(["foo", "bar", "foo", "bar", "foo", "bar"])
+    )
+
+    # Last matches before the end, scanning further back than lines
+    journald_gateway.feed_data(export.encode("utf-8"))
+    journald_gateway.feed_eof()
+    resp = await api_client.get("/host/logs/identifiers/systemd?lines=2&text=foo")
+    assert resp.headers["X-First-Cursor"] == "c2"
+    assert await resp.text() == "foo 2\nfoo 4\n"
+
+
+async def test_advanced_logs_text_since(
+    api_client: TestClient, coresys: CoreSys, journald_logs: MagicMock
+):
+    """Test entries are scanned past lines for matches after a cursor."""
+    await api_client.get("/host/logs/identifiers/systemd?since=c0&lines=2&text=foo")
+    journald_logs.assert_called_once_with(
+        params={"SYSLOG_IDENTIFIER": "systemd"},
+        range_header="entries=c0:1:10000",
+        accept=LogFormat.JOURNAL,
+    )
+
+
+async def test_aggregate_logs(
+    api_client: TestClient, coresys: CoreSys, journald_logs: MagicMock
+):
+    """Test aggregating logs with filters."""
+    resp = await api_client.get(
+        "/host/logs/aggregate?identifier=kernel&priority=2&boot=0&lines=50"
+        "&period=600&bucket=60&regex=err.*"
+    )
+    assert resp.status == 200
+    result = await resp.json()
+    assert result["data"]["bucket_size"] == 60
+    assert result["data"]["scanned"] == 0
+    assert result["data"]["complete"] is True
+    assert result["data"]["buckets"] == []
+    journald_logs.assert_called_once_with(
+        params={
+            "SYSLOG_IDENTIFIER": ["kernel"],
+            "_BOOT_ID": "ccc",
+            "PRIORITY": ["0", "1", "2"],
+        },
+        range_header="entries=:-50:50",
+        accept=LogFormat.JSON,
+    )
+
+    resp = await api_client.get("/host/logs/aggregate?regex=(")
+    assert resp.status == 400
+    resp = await api_client.get("/host/logs/aggregate?regex=(a%2B)%2B")
+    assert resp.status == 400
+    resp = await api_client.get("/host/logs/aggregate?period=86400&bucket=1")
+    assert resp.status == 400
+
+
 async def test_advanced_logs_boot_id_offset(
     api_client: TestClient, coresys: CoreSys, journald_logs: MagicMock
 ):
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 from aiohttp.test_utils import TestClient
 
+from supervisor.const import IngressSessionDataUser
 from supervisor.coresys import CoreSys
 
 
@@ -86,3 +87,40 @@ async def test_validate_session_with_user_id(
         assert (
             coresys.ingress.get_session_data(session).user.display_name == "Some Name"
         )
+
+
+async def test_create_session_user_cache(api_client: TestClient, coresys: CoreSys):
+    """Test user lookups for ingress sessions are served from cache."""
+    with patch(
+        "aiohttp.web_request.BaseRequest.__getitem__",
+        return_value=coresys.homeassistant,
+    ), patch.object(
+        type(coresys.homeassistant),
+        "get_users",
+        new=AsyncMock(
+            return_value=[
+                IngressSessionDataUser(
+                    id="some-id", display_name="Some Name", username="sn"
+                )
+            ]
+        ),
+    ) as get_users:
+        for _ in range(3):
+            resp = await api_client.post(
+                "/ingress/session", json={"user_id": "some-id"}
+            )
+            session = (await resp.json())["data"]["session"]
+            assert coresys.ingress.get_session_data(session).user.id == "some-id"
+
+        get_users.assert_called_once()
+
+        # Unknown users are negative cached
+        get_users.reset_mock()
+        for _ in range(3):
+            resp = await api_client.post(
+                "/ingress/session", json={"user_id": "unknown-id"}
+            )
+            session = (await resp.json())["data"]["session"]
+            assert coresys.ingress.get_session_data(session) is None
+
+        get_users.assert_called_once()
@@ -108,6 +108,7 @@ async def test_jobs_tree_representation(api_client: TestClient, coresys: CoreSys
             "stage": None,
             "done": False,
             "errors": [],
+            "extra": None,
             "child_jobs": [
                 {
                     "name": "test_jobs_tree_inner",
@@ -118,6 +119,7 @@ async def test_jobs_tree_representation(api_client: TestClient, coresys: CoreSys
                     "done": False,
                     "child_jobs": [],
                     "errors": [],
+                    "extra": None,
                 },
             ],
         },
@@ -130,6 +132,7 @@ async def test_jobs_tree_representation(api_client: TestClient, coresys: CoreSys
             "done": False,
             "child_jobs": [],
             "errors": [],
+            "extra": None,
         },
     ]
 
@@ -148,6 +151,7 @@ async def test_jobs_tree_representation(api_client: TestClient, coresys: CoreSys
             "done": True,
             "child_jobs": [],
             "errors": [],
+            "extra": None,
         },
     ]
     await outer_task
@@ -189,6 +193,7 @@ async def test_job_manual_cleanup(api_client: TestClient, coresys: CoreSys):
         "done": False,
         "child_jobs": [],
         "errors": [],
+        "extra": None,
     }
 
     # Only done jobs can be deleted via API
@@ -80,6 +80,7 @@ async def test_api_create_mount(
             "server": "backup.local",
             "share": "backups",
             "state": "active",
+            "degraded": False,
             "read_only": False,
         }
     ]
@@ -256,6 +257,7 @@ async def test_api_update_mount(
             "server": "backup.local",
             "share": "new_backups",
             "state": "active",
+            "degraded": False,
             "read_only": False,
         }
     ]
@@ -324,6 +326,7 @@ async def test_api_update_dbus_error_mount_remains(
             "server": "backup.local",
             "share": "backups",
             "state": None,
+            "degraded": False,
             "read_only": False,
         }
     ]
@@ -371,6 +374,7 @@ async def test_api_update_dbus_error_mount_remains(
             "server": "backup.local",
             "share": "backups",
             "state": None,
+            "degraded": False,
             "read_only": False,
         }
     ]
@@ -395,6 +399,24 @@ async def test_api_reload_mount(
     ]
 
 
+async def test_api_mount_health(
+    api_client: TestClient, coresys: CoreSys, mount, mock_is_mount
+):
+    """Test mount health API returns probe results."""
+    await coresys.mounts.monitor.check_all()
+
+    resp = await api_client.get("/mounts/backup_test/health")
+    result = await resp.json()
+    assert result["data"]["degraded"] is False
+    assert len(history := result["data"]["history"]) == 1
+    assert history[0]["error"] is None
+    assert history[0]["latency"] >= 0
+    assert history[0]["throughput"] > 0
+
+    resp = await api_client.get("/mounts/bad/health")
+    assert resp.status == 400
+
+
 async def test_api_reload_error_mount_missing(
     api_client: TestClient, mount_propagation
 ):
@@ -827,6 +849,7 @@ async def test_api_create_read_only_cifs_mount(
             "server": "media.local",
             "share": "media",
             "state": "active",
+            "degraded": False,
             "read_only": True,
         }
     ]
@@ -867,6 +890,7 @@ async def test_api_create_read_only_nfs_mount(
             "server": "media.local",
             "path": "/media/camera",
             "state": "active",
+            "degraded": False,
             "read_only": True,
         }
     ]
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Generator
+from contextlib import asynccontextmanager
+import gzip
 from json import dumps
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from aiohttp import ClientWebSocketResponse
 from aiohttp.http_websocket import WSMessage, WSMsgType
@@ -16,6 +18,7 @@ import pytest
 from supervisor.addons.addon import Addon
 from supervisor.api.proxy import APIProxy
 from supervisor.const import ATTR_ACCESS_TOKEN
+from supervisor.homeassistant.api import HomeAssistantAPI
 
 
 def id_generator() -> Generator[int, None, None]:
@@ -175,3 +178,73 @@ async def test_proxy_invalid_auth(
     auth_not_ok = await websocket.receive_json()
     assert auth_not_ok["type"] == "auth_invalid"
     assert auth_not_ok["message"] == "Invalid access"
+
+
+async def test_proxy_api_streams_response(
+    api_client: TestClient, install_addon_ssh: Addon
+):
+    """Test API responses from Home Assistant are streamed in chunks."""
+    install_addon_ssh.persist[ATTR_ACCESS_TOKEN] = "abc123"
+    chunks = [b'{"hello": ', b'"world"}']
+
+    async def iter_chunked(_: int) -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    upstream = MagicMock()
+    upstream.status = 200
+    upstream.content_type = "application/json"
+    upstream.charset = "utf-8"
+    upstream.headers = {"Content-Length": str(sum(len(chunk) for chunk in chunks))}
+    upstream.content.iter_chunked = iter_chunked
+    upstream.read.side_effect = AssertionError("Body must not be buffered")
+
+    @asynccontextmanager
+    async def make_request(*args, **kwargs):
+        yield upstream
+
+    with patch.object(HomeAssistantAPI, "make_request", new=make_request):
+        resp = await api_client.get(
+            "/core/api/states",
+            headers={"Authorization": f"Bearer {install_addon_ssh.supervisor_token}"},
+        )
+
+    assert resp.status == 200
+    assert resp.content_type == "application/json"
+    assert await resp.json() == {"hello": "world"}
+
+
+async def test_proxy_api_encoded_response(
+    api_client: TestClient, install_addon_ssh: Addon
+):
+    """Test length of an encoded response from Home Assistant is not forwarded."""
+    install_addon_ssh.persist[ATTR_ACCESS_TOKEN] = "abc123"
+    body = dumps({"hello": "world" * 100}).encode()
+
+    async def iter_chunked(_: int) -> AsyncIterator[bytes]:
+        # Client session hands out the decompressed body
+        yield body
+
+    upstream = MagicMock()
+    upstream.status = 200
+    upstream.content_type = "application/json"
+    upstream.charset = "utf-8"
+    upstream.headers = {
+        "Content-Encoding": "gzip",
+        "Content-Length": str(len(gzip.compress(body))),
+    }
+    upstream.content.iter_chunked = iter_chunked
+
+    @asynccontextmanager
+    async def make_request(*args, **kwargs):
+        yield upstream
+
+    with patch.object(HomeAssistantAPI, "make_request", new=make_request):
+        resp = await api_client.get(
+            "/core/api/states",
+            headers={"Authorization": f"Bearer {install_addon_ssh.supervisor_token}"},
+        )
+
+    assert resp.status == 200
+    assert resp.headers.get("Content-Length") != str(len(gzip.compress(body)))
+    assert await resp.read() == body
@@ -44,6 +44,21 @@ async def test_api_store(
     )
 
 
+async def test_api_store_options(api_client: TestClient, coresys: CoreSys):
+    """Test setting how many repositories are reloaded at once."""
+    resp = await api_client.get("/store")
+    assert (await resp.json())["data"]["reload_concurrency"] == 4
+
+    resp = await api_client.post("/store/options", json={"reload_concurrency": 2})
+    assert resp.status == 200
+    assert coresys.store.reload_concurrency == 2
+    coresys.store.save_data.assert_called_once()
+
+    resp = await api_client.post("/store/options", json={"reload_concurrency": 0})
+    assert resp.status == 400
+    assert coresys.store.reload_concurrency == 2
+
+
 @pytest.mark.asyncio
 async def test_api_store_addons(api_client: TestClient, store_addon: AddonStore):
     """Test /store/addons REST API."""
@@ -53,6 +68,55 @@ async def test_api_store_addons(api_client: TestClient, store_addon: AddonStore)
     assert result["data"]["addons"][-1]["slug"] == store_addon.slug
 
 
+@pytest.mark.asyncio
+async def test_api_store_addons_search(
+    api_client: TestClient, coresys: CoreSys, store_addon: AddonStore
+):
+    """Test /store/addons/search REST API."""
+    coresys.store.search.update(coresys.addons.store)
+
+    resp = await api_client.get("/store/addons/search", params={"query": "tes add"})
+    result = await resp.json()
+    assert result["data"]["total"] == 1
+    assert result["data"]["addons"][0]["slug"] == store_addon.slug
+
+    resp = await api_client.get(
+        "/store/addons/search",
+        params={"query": "test", "arch": "aarch64", "stage": "stable"},
+    )
+    result = await resp.json()
+    assert result["data"]["total"] == 0
+
+    resp = await api_client.get(
+        "/store/addons/search", params={"repository": "a474bbd1", "installed": "false"}
+    )
+    result = await resp.json()
+    assert result["data"]["addons"][0]["slug"] == store_addon.slug
+
+    resp = await api_client.get(
+        "/store/addons/search", params={"offset": 1, "limit": 1}
+    )
+    result = await resp.json()
+    assert result["data"]["offset"] == 1
+    assert len(result["data"]["addons"]) == min(1, result["data"]["total"] - 1)
+
+    resp = await api_client.get("/store/addons/search", params={"limit": 0})
+    assert resp.status == 400
+
+    # Index follows changes of the add-on data
+    coresys.store.data.addons[store_addon.slug]["description"] = "Something else"
+    coresys.store.search.update(coresys.addons.store)
+    resp = await api_client.get("/store/addons/search", params={"query": "something"})
+    result = await resp.json()
+    assert result["data"]["addons"][0]["slug"] == store_addon.slug
+
+    coresys.addons.store.pop(store_addon.slug)
+    coresys.store.search.update(coresys.addons.store)
+    resp = await api_client.get("/store/addons/search", params={"query": "something"})
+    result = await resp.json()
+    assert result["data"]["total"] == 0
+
+
 @pytest.mark.asyncio
 async def test_api_store_addons_addon(api_client: TestClient, store_addon: AddonStore):
     """Test /store/addons/{addon} REST API."""
@@ -278,3 +342,46 @@ async def test_api_detached_addon_documentation(
     assert resp.status == 200
     result = await resp.text()
     assert result == "Addon local_ssh with version latest does not exist in the store"
+
+
+async def test_api_store_addons_changelog_cached(
+    api_client: TestClient, coresys: CoreSys, store_addon: AddonStore, tmp_path: Path
+):
+    """Test changelog is served from asset cache with ETag and gzip variant."""
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text("## 1.0.0\n\n- Initial release\n" * 100)
+    store_addon._path_changelog_exists = True  # pylint: disable=protected-access
+
+    with patch.object(
+        AddonStore, "path_location", new=PropertyMock(return_value=tmp_path)
+    ):
+        resp = await api_client.get(
+            f"/store/addons/{store_addon.slug}/changelog",
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert resp.status == 200
+        assert await resp.text() == changelog.read_text()
+        assert resp.headers["Cache-Control"] == "private, no-cache"
+        etag = resp.headers["ETag"]
+
+        resp = await api_client.get(
+            f"/store/addons/{store_addon.slug}/changelog",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+        )
+        assert resp.status == 304
+
+        resp = await api_client.get(
+            f"/store/addons/{store_addon.slug}/changelog",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["ETag"] != etag
+        assert await resp.text() == changelog.read_text()
+
+        changelog.write_text("## 2.0.0\n")
+        resp = await api_client.get(
+            f"/store/addons/{store_addon.slug}/changelog",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+        )
+        assert resp.status == 200
+        assert await resp.text() == "## 2.0.0\n"
@@ -0,0 +1,49 @@
+"""Test backup location benchmark."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from supervisor.backups.benchmark import (
+    BENCHMARK_FILE,
+    LocationBenchmark,
+    benchmark_path,
+)
+
+
+def test_benchmark_path(tmp_path: Path):
+    """Test benchmark of a directory."""
+    write, read, fsync = benchmark_path(tmp_path)
+
+    assert write > 0
+    assert read > 0
+    assert fsync >= 0
+    assert not (tmp_path / BENCHMARK_FILE).exists()
+
+
+def test_benchmark_path_error(tmp_path: Path):
+    """Test benchmark of a missing directory raises."""
+    missing = tmp_path / "missing"
+    with pytest.raises(OSError):
+        benchmark_path(missing)
+
+
+def test_location_benchmark_dict():
+    """Test benchmark stored as dictionary."""
+    benchmark = LocationBenchmark(
+        "backup_test",
+        datetime.fromisoformat("2024-01-01T00:00:00+00:00"),
+        100_000_000.0,
+        200_000_000.0,
+        0.005,
+    )
+
+    assert benchmark.to_dict() == {
+        "location": "backup_test",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "write_throughput": 100_000_000.0,
+        "read_throughput": 200_000_000.0,
+        "fsync_latency": 0.005,
+    }
+    assert LocationBenchmark.from_dict(benchmark.to_dict()) == benchmark
@@ -5,6 +5,7 @@ import errno
 from functools import partial
 from pathlib import Path
 from shutil import rmtree
+import threading
 from unittest.mock import ANY, AsyncMock, MagicMock, Mock, PropertyMock, patch
 
 from awesomeversion import AwesomeVersion
@@ -33,8 +34,10 @@ from supervisor.exceptions import (
 from supervisor.homeassistant.api import HomeAssistantAPI
 from supervisor.homeassistant.core import HomeAssistantCore
 from supervisor.homeassistant.module import HomeAssistant
+from supervisor.host.disk_usage import DiskUsage, DiskUsageControl
 from supervisor.jobs.const import JobCondition
 from supervisor.mounts.mount import Mount
+from supervisor.utils.dt import utcnow
 from supervisor.utils.json import read_json_file, write_json_file
 
 from tests.const import TEST_ADDON_SLUG
@@ -1035,6 +1038,7 @@ def _make_backup_message_for_assert(
                 "done": done,
                 "parent_id": None,
                 "errors": [],
+                "extra": None,
             },
         },
     }
@@ -1750,3 +1754,130 @@ async def test_reload_error(
 
         assert "Could not list backups" in caplog.text
         assert coresys.core.healthy is healthy_expected
+
+
+async def test_select_location(
+    coresys: CoreSys, tmp_supervisor_data, path_extern, mount_propagation, mock_is_mount
+):
+    """Test selecting fastest backup location within backup window."""
+    (coresys.config.path_mounts / "backup_test").mkdir()
+    await coresys.mounts.load()
+    mount = Mount.from_dict(
+        coresys,
+        {
+            "name": "backup_test",
+            "usage": "backup",
+            "type": "cifs",
+            "server": "test.local",
+            "share": "test",
+        },
+    )
+    await coresys.mounts.create_mount(mount)
+
+    coresys.backups._data["benchmarks"] = [  # pylint: disable=protected-access
+        {
+            "location": None,
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "write_throughput": 50_000_000.0,
+            "read_throughput": 50_000_000.0,
+            "fsync_latency": 0.001,
+        },
+        {
+            "location": "backup_test",
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "write_throughput": 100_000_000.0,
+            "read_throughput": 100_000_000.0,
+            "fsync_latency": 0.01,
+        },
+    ]
+    assert await coresys.backups.select_location() == mount
+
+    # Degraded mounts are skipped
+    with patch.object(coresys.mounts.monitor, "is_degraded", return_value=True):
+        assert await coresys.backups.select_location() is None
+
+    # Locations too slow for backup window are skipped
+    with patch.object(
+        BackupManager, "_estimate_backup_size", return_value=10_000_000_000
+    ):
+        coresys.backups.backup_window = 150
+        assert await coresys.backups.select_location() == mount
+
+        coresys.backups.backup_window = 60
+        with pytest.raises(BackupError):
+            await coresys.backups.select_location()
+
+
+async def test_estimate_partial_backup_size(coresys: CoreSys):
+    """Test partial backups are estimated by their content."""
+    usage = DiskUsage(
+        utcnow(),
+        addons={"local_ssh": 1000, "local_big": 10_000_000_000},
+        folders={FOLDER_SHARE: 500, FOLDER_HOMEASSISTANT: 2000, "ssl": 0},
+    )
+    # Unknown until disk usage was accounted
+    with patch.object(DiskUsageControl, "usage", new=PropertyMock(return_value=None)):
+        assert await coresys.backups._estimate_backup_size(True, ["local_ssh"]) is None
+
+    # Size of full backups is not used
+    with (
+        patch.object(DiskUsageControl, "usage", new=PropertyMock(return_value=usage)),
+        patch.object(
+            BackupManager, "list_backups", new=PropertyMock(side_effect=AssertionError)
+        ),
+    ):
+        assert (
+            await coresys.backups._estimate_backup_size(
+                True, ["local_ssh"], [FOLDER_SHARE]
+            )
+            == 1500
+        )
+        assert (
+            await coresys.backups._estimate_backup_size(
+                True, [], [FOLDER_HOMEASSISTANT], homeassistant=True
+            )
+            == 2000
+        )
+
+        # Empty backup is known to fit any backup window
+        assert await coresys.backups._estimate_backup_size(True, [], ["ssl"]) == 0
+
+
+async def test_benchmark_skipped_during_backup(coresys: CoreSys):
+    """Test benchmark does not take backup lock and skips while a backup runs."""
+    coresys.core.state = CoreState.RUNNING
+    active_job = PropertyMock(return_value=Mock())
+    with (
+        patch.object(BackupManager, "active_job", new=active_job),
+        patch.object(BackupManager, "_benchmark_location") as benchmark_location,
+        pytest.raises(BackupJobError),
+    ):
+        await coresys.backups.benchmark_locations()
+    benchmark_location.assert_not_called()
+
+    with patch.object(
+        BackupManager, "_benchmark_location", return_value=(1.0, 1.0, 0.001)
+    ):
+        assert list(await coresys.backups.benchmark_locations()) == [None]
+    assert coresys.backups.active_job is None
+
+
+async def test_benchmark_hung_mount(coresys: CoreSys, tmp_path: Path):
+    """Test benchmark of a hung mount times out without using the executor."""
+    release = threading.Event()
+
+    def _hang(path: Path):
+        release.wait()
+        return 1.0, 1.0, 0.001
+
+    with (
+        patch("supervisor.backups.manager.benchmark_path", new=_hang),
+        patch("supervisor.backups.manager.BENCHMARK_TIMEOUT") as timeout,
+        patch.object(coresys, "run_in_executor") as run_in_executor,
+    ):
+        timeout.total_seconds.return_value = 0.01
+        with pytest.raises(TimeoutError):
+            await coresys.backups._benchmark_location("backup_test", tmp_path)
+
+    run_in_executor.assert_not_called()
+    release.set()
@@ -321,7 +321,9 @@ async def coresys(
     coresys_obj._resolution.save_data = MagicMock()
     coresys_obj._addons.data.save_data = MagicMock()
     coresys_obj._store.save_data = MagicMock()
+    coresys_obj._store.data.save_index = AsyncMock()
     coresys_obj._mounts.save_data = MagicMock()
+    coresys_obj._dbus.save_introspection = AsyncMock()
 
     # Mock test client
     coresys_obj._supervisor.instance._meta = {
@@ -651,6 +653,11 @@ async def journald_logs(coresys: CoreSys) -> MagicMock:
         ),
         patch.object(LogsControl, "journald_logs", new=MagicMock()) as logs,
     ):
+        # Empty export stream, readers must see the end of it
+        stream = asyncio.StreamReader(loop=asyncio.get_running_loop())
+        stream.feed_eof()
+        logs.return_value.__aenter__.return_value.content = stream
+
         await coresys.host.logs.load()
         yield logs
 
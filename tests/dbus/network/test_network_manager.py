@@ -17,6 +17,7 @@ from supervisor.exceptions import (
 )
 from supervisor.utils.dbus import DBus
 
+from tests.common import mock_dbus_services
 from tests.const import TEST_INTERFACE, TEST_INTERFACE_WLAN
 from tests.dbus_service_mocks.base import DBusServiceMock
 from tests.dbus_service_mocks.network_connection_settings import SETTINGS_FIXTURE
@@ -190,13 +191,21 @@ async def test_handling_bad_devices(
 
 
 async def test_ignore_veth_only_changes(
-    network_manager_service: NetworkManagerService, network_manager: NetworkManager
+    network_manager_service: NetworkManagerService,
+    network_manager: NetworkManager,
+    dbus_session_bus: MessageBus,
 ):
-    """Changes to list of devices is ignored unless it changes managed devices."""
+    """Veths are skipped and connected devices are not connected again."""
+    await mock_dbus_services(
+        {"network_device": ["/org/freedesktop/NetworkManager/Devices/35"]},
+        dbus_session_bus,
+    )
     assert network_manager.properties["Devices"] == [
         "/org/freedesktop/NetworkManager/Devices/1",
         "/org/freedesktop/NetworkManager/Devices/3",
     ]
+    wlan = network_manager.get(TEST_INTERFACE_WLAN)
+
     with patch.object(NetworkInterface, "connect") as connect:
         network_manager_service.emit_properties_changed(
             {
@@ -214,7 +223,96 @@ async def test_ignore_veth_only_changes(
             {"Devices": ["/org/freedesktop/NetworkManager/Devices/35"]}
         )
         await network_manager_service.ping()
-        connect.assert_called_once()
+        connect.assert_not_called()
+
+    assert not network_manager.interfaces
+    assert wlan.is_connected is False
+
+
+async def test_added_device_connected(
+    network_manager_service: NetworkManagerService,
+    network_manager: NetworkManager,
+    dbus_session_bus: MessageBus,
+):
+    """Only devices added are connected on change of devices."""
+    await mock_dbus_services(
+        {"network_device": ["/org/freedesktop/NetworkManager/Devices/5"]},
+        dbus_session_bus,
+    )
+    wlan = network_manager.get(TEST_INTERFACE_WLAN)
+
+    with patch.object(
+        NetworkInterface, "connect", autospec=True, side_effect=NetworkInterface.connect
+    ) as connect:
+        network_manager_service.emit_properties_changed(
+            {
+                "Devices": [
+                    "/org/freedesktop/NetworkManager/Devices/1",
+                    "/org/freedesktop/NetworkManager/Devices/3",
+                    "/org/freedesktop/NetworkManager/Devices/5",
+                ]
+            }
+        )
+        await network_manager_service.ping()
+
+    connect.assert_called_once()
+    assert connect.call_args.args[0].object_path == (
+        "/org/freedesktop/NetworkManager/Devices/5"
+    )
+    assert network_manager.get(TEST_INTERFACE_WLAN) is wlan
+    assert len(network_manager.interfaces) == 3
+    assert "en0" in network_manager
+
+
+async def test_devices_kept_when_giving_up(
+    network_manager_service: NetworkManagerService,
+    network_manager: NetworkManager,
+    dbus_session_bus: MessageBus,
+    capture_exception: Mock,
+):
+    """Devices connected in the same pass are kept when NetworkManager stops replying."""
+    await mock_dbus_services(
+        {"network_device": ["/org/freedesktop/NetworkManager/Devices/5"]},
+        dbus_session_bus,
+    )
+    load_interface = NetworkManager._load_interface
+
+    async def _load_interface(self: NetworkManager, device: str):
+        if device == "/org/freedesktop/NetworkManager/Devices/100":
+            raise DBusServiceUnkownError()
+        return await load_interface(self, device)
+
+    with patch.object(NetworkManager, "_load_interface", new=_load_interface):
+        network_manager_service.emit_properties_changed(
+            {
+                "Devices": [
+                    "/org/freedesktop/NetworkManager/Devices/1",
+                    "/org/freedesktop/NetworkManager/Devices/3",
+                    "/org/freedesktop/NetworkManager/Devices/100",
+                    "/org/freedesktop/NetworkManager/Devices/5",
+                ]
+            }
+        )
+        await network_manager_service.ping()
+
+    capture_exception.assert_called_once()
+    assert "en0" in network_manager
+    en0 = network_manager.get("en0")
+    assert en0.is_connected is True
+
+    # Device is not connected again on next change
+    with patch.object(NetworkInterface, "connect") as connect:
+        await network_manager.update(
+            {
+                "Devices": [
+                    "/org/freedesktop/NetworkManager/Devices/1",
+                    "/org/freedesktop/NetworkManager/Devices/3",
+                    "/org/freedesktop/NetworkManager/Devices/5",
+                ]
+            }
+        )
+    connect.assert_not_called()
+    assert network_manager.get("en0") is en0
 
 
 async def test_network_manager_stopped(
@@ -1,7 +1,7 @@
 """Test Docker interface."""
 import asyncio
 from typing import Any
-from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, call, patch
 
 from awesomeversion import AwesomeVersion
 from docker.errors import DockerException, NotFound
@@ -230,6 +230,32 @@ async def test_attach_total_failure(coresys: CoreSys):
         await coresys.homeassistant.core.instance.attach(AwesomeVersion("2022.7.3"))
 
 
+async def test_pull_ahead_of_install(coresys: CoreSys):
+    """Test image pulled ahead is used by install without pulling and validating again."""
+    image = Mock(id="sha256:abc", attrs={"Config": {"Labels": {}}})
+    with patch.object(
+        coresys.docker.images, "pull", return_value=image
+    ) as pull, patch.object(
+        coresys.docker.images, "get", return_value=image
+    ), patch.object(
+        DockerInterface, "_validate_trust", new=AsyncMock()
+    ) as validate_trust:
+        instance = DockerInterface(coresys)
+        await instance.pull(AwesomeVersion("1.2.3"), "test")
+        assert instance.meta_config == {}
+        validate_trust.assert_called_once()
+
+        await instance.install(AwesomeVersion("1.2.3"), "test")
+        assert instance.meta_config == {"Labels": {}}
+        pull.assert_called_once()
+        validate_trust.assert_called_once()
+
+        # Image is only used once as is
+        await instance.install(AwesomeVersion("1.2.3"), "test")
+        assert pull.call_count == 2
+        assert validate_trust.call_count == 2
+
+
 @pytest.mark.parametrize("err", [DockerException(), RequestException()])
 async def test_image_pull_fail(
     coresys: CoreSys, capture_exception: Mock, err: Exception
@@ -98,3 +98,8 @@ def test_try_get_emmc_life_time(coresys, tmp_path):
     ):
         value = coresys.hardware.disk._try_get_emmc_life_time("mmcblk0")
     assert value == 20.0
+
+
+def test_get_disk_life_time_unknown_mount(coresys, tmp_path):
+    """Test life time of a path which is not a mount point."""
+    assert coresys.hardware.disk.get_disk_life_time(tmp_path) is None
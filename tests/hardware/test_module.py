@@ -1,5 +1,8 @@
 """Test HardwareManager Module."""
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pyudev
 
 from supervisor.hardware.const import UdevSubsystem
 from supervisor.hardware.data import Device
@@ -130,3 +133,71 @@ def test_device_filter(coresys):
         for device in coresys.hardware.devices
         if device.subsystem == UdevSubsystem.SERIAL
     )
+
+
+def test_device_index_update_delete(coresys):
+    """Test secondary indexes follow updated and deleted devices."""
+    device = Device(
+        "ttyUSB0",
+        Path("/dev/ttyUSB0"),
+        Path("/sys/bus/usb/001"),
+        "tty",
+        None,
+        [Path("/dev/serial/by-id/xyx")],
+        {},
+        [],
+    )
+    coresys.hardware.update_device(device)
+    assert coresys.hardware.get_by_path(Path("/dev/serial/by-id/xyx")) is device
+
+    # Replugged with another by-id link
+    replugged = Device(
+        "ttyUSB0",
+        Path("/dev/ttyUSB0"),
+        Path("/sys/bus/usb/001"),
+        "tty",
+        None,
+        [Path("/dev/serial/by-id/abc")],
+        {},
+        [],
+    )
+    coresys.hardware.update_device(replugged)
+    assert coresys.hardware.get_by_path(Path("/dev/ttyUSB0")) is replugged
+    assert coresys.hardware.get_by_path(Path("/dev/serial/by-id/abc")) is replugged
+    assert not coresys.hardware.exists_device_node(Path("/dev/serial/by-id/xyx"))
+
+    coresys.hardware.delete_device(replugged)
+    assert not coresys.hardware.exists_device_node(Path("/dev/ttyUSB0"))
+    assert not coresys.hardware.exists_device_node(Path("/sys/bus/usb/001"))
+    assert not coresys.hardware.exists_device_node(Path("/dev/serial/by-id/abc"))
+    assert coresys.hardware.filter_devices(subsystem=UdevSubsystem.SERIAL) == []
+
+
+def test_check_subsystem_parents_cached(coresys):
+    """Test parent subsystems are looked up in udev once per device."""
+    device = Device(
+        "ttyUSB0",
+        Path("/dev/ttyUSB0"),
+        Path("/sys/bus/usb/001"),
+        "tty",
+        None,
+        [],
+        {},
+        [],
+    )
+    coresys.hardware.update_device(device)
+    udev_device = MagicMock(
+        ancestors=[MagicMock(subsystem="usb-serial"), MagicMock(subsystem="usb")]
+    )
+
+    with patch.object(
+        pyudev.Devices, "from_sys_path", return_value=udev_device
+    ) as from_sys_path:
+        assert coresys.hardware.check_subsystem_parents(device, UdevSubsystem.USB)
+        assert not coresys.hardware.check_subsystem_parents(device, UdevSubsystem.PCI)
+        from_sys_path.assert_called_once()
+
+        # Updating the device drops the cached parents
+        coresys.hardware.update_device(device)
+        assert coresys.hardware.check_subsystem_parents(device, UdevSubsystem.USB)
+        assert from_sys_path.call_count == 2
@@ -0,0 +1,169 @@
+"""Test hardware monitor."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pyudev
+
+from supervisor.const import BusEvent
+from supervisor.coresys import CoreSys
+from supervisor.hardware.data import Device, DeviceChanges
+from supervisor.hardware.monitor import HwMonitor
+
+# pylint: disable=protected-access
+
+SYS_PATH = "/sys/devices/platform/soc/usb1/1-1/1-1:1.0/ttyUSB0/tty/ttyUSB0"
+
+
+def _kernel_event(action: str, sys_path: str = SYS_PATH) -> MagicMock:
+    """Return a mocked kernel event."""
+    return MagicMock(
+        action=action,
+        sys_path=sys_path,
+        device_node=f"/dev/{Path(sys_path).name}",
+    )
+
+
+def _device(sys_path: str = SYS_PATH) -> Device:
+    """Return a device for sys path."""
+    name = Path(sys_path).name
+    return Device(name, Path(f"/dev/{name}"), Path(sys_path), "tty", None, [], {}, [])
+
+
+async def test_udev_events_coalesced(coresys: CoreSys):
+    """Test events of a device within the window are processed as one batch."""
+    monitor = HwMonitor(coresys)
+    monitor.udev_observer = MagicMock()
+    new_device = AsyncMock()
+    changed = AsyncMock()
+    coresys.bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, new_device)
+    coresys.bus.register_event(BusEvent.HARDWARE_DEVICES_CHANGED, changed)
+    udev = MagicMock(is_initialized=False)
+
+    with (
+        patch("supervisor.hardware.monitor.UDEV_EVENT_WINDOW") as window,
+        patch.object(pyudev.Devices, "from_sys_path", return_value=udev),
+        patch.object(Device, "import_udev", side_effect=lambda _: _device()),
+    ):
+        window.total_seconds.return_value = 0.01
+        monitor._udev_events(_kernel_event("add"))
+        monitor._udev_events(_kernel_event("bind"))
+        monitor._udev_events(_kernel_event("change"))
+
+        # Waiting for udev to finish with the device
+        await asyncio.sleep(0.05)
+        new_device.assert_not_called()
+
+        monitor._udev_ready_events(MagicMock(sys_path=SYS_PATH))
+        await asyncio.sleep(0.01)
+
+    new_device.assert_called_once_with(_device())
+    changed.assert_called_once_with(DeviceChanges(added=[_device()]))
+    assert coresys.hardware.get_by_path(Path(SYS_PATH)) == _device()
+    assert not monitor._pending
+    assert not monitor._udev_ready
+
+
+async def test_udev_device_initialized_without_event(coresys: CoreSys):
+    """Test device is picked up once udev initialized it, even if event is missed."""
+    monitor = HwMonitor(coresys)
+    monitor.udev_observer = MagicMock()
+    new_device = AsyncMock()
+    coresys.bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, new_device)
+    udev = MagicMock(is_initialized=False)
+
+    with (
+        patch("supervisor.hardware.monitor.UDEV_EVENT_WINDOW") as window,
+        patch("supervisor.hardware.monitor.UDEV_POLL_INTERVAL") as interval,
+        patch.object(pyudev.Devices, "from_sys_path", return_value=udev),
+        patch.object(Device, "import_udev", side_effect=lambda _: _device()),
+    ):
+        window.total_seconds.return_value = 0.01
+        interval.total_seconds.return_value = 0.01
+        monitor._udev_events(_kernel_event("add"))
+
+        await asyncio.sleep(0.05)
+        new_device.assert_not_called()
+
+        udev.is_initialized = True
+        await asyncio.sleep(0.05)
+
+    new_device.assert_called_once_with(_device())
+    assert not monitor._pending
+    assert not monitor._udev_ready
+
+
+async def test_udev_added_then_changed_initialized_without_event(coresys: CoreSys):
+    """Test device added and changed in one window is picked up once initialized."""
+    monitor = HwMonitor(coresys)
+    monitor.udev_observer = MagicMock()
+    new_device = AsyncMock()
+    coresys.bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, new_device)
+    udev = MagicMock(is_initialized=False)
+
+    with (
+        patch("supervisor.hardware.monitor.UDEV_EVENT_WINDOW") as window,
+        patch("supervisor.hardware.monitor.UDEV_POLL_INTERVAL") as interval,
+        patch.object(pyudev.Devices, "from_sys_path", return_value=udev),
+        patch.object(Device, "import_udev", side_effect=lambda _: _device()),
+    ):
+        window.total_seconds.return_value = 0.01
+        interval.total_seconds.return_value = 0.01
+        monitor._udev_events(_kernel_event("add"))
+        monitor._udev_events(_kernel_event("change"))
+
+        await asyncio.sleep(0.05)
+        new_device.assert_not_called()
+
+        udev.is_initialized = True
+        await asyncio.sleep(0.05)
+
+    new_device.assert_called_once_with(_device())
+    assert not monitor._pending
+    assert not monitor._udev_ready
+
+
+async def test_udev_change_waits_for_udev(coresys: CoreSys):
+    """Test change of an initialized device waits for udev to process it again."""
+    monitor = HwMonitor(coresys)
+    monitor.udev_observer = MagicMock()
+    udev = MagicMock(is_initialized=True)
+    import_udev = MagicMock(side_effect=lambda _: _device())
+
+    with (
+        patch("supervisor.hardware.monitor.UDEV_EVENT_WINDOW") as window,
+        patch("supervisor.hardware.monitor.UDEV_POLL_INTERVAL") as interval,
+        patch.object(pyudev.Devices, "from_sys_path", return_value=udev),
+        patch.object(Device, "import_udev", new=import_udev),
+    ):
+        window.total_seconds.return_value = 0.01
+        interval.total_seconds.return_value = 0.01
+        monitor._udev_events(_kernel_event("change"))
+
+        # Device stays initialized while udev runs its rules again
+        await asyncio.sleep(0.05)
+        import_udev.assert_not_called()
+
+        monitor._udev_ready_events(MagicMock(sys_path=SYS_PATH))
+        await asyncio.sleep(0.01)
+
+    import_udev.assert_called_once_with(udev)
+    assert coresys.hardware.get_by_path(Path(SYS_PATH)) == _device()
+    assert not monitor._udev_ready
+
+
+async def test_udev_events_remove(coresys: CoreSys):
+    """Test removed devices are reported without waiting for udev."""
+    monitor = HwMonitor(coresys)
+    remove_device = AsyncMock()
+    coresys.bus.register_event(BusEvent.HARDWARE_REMOVE_DEVICE, remove_device)
+    coresys.hardware.update_device(_device())
+
+    with patch("supervisor.hardware.monitor.UDEV_EVENT_WINDOW") as window:
+        window.total_seconds.return_value = 0.01
+        monitor._udev_events(_kernel_event("remove"))
+        await asyncio.sleep(0.05)
+
+    remove_device.assert_called_once_with(_device())
+    assert _device() not in coresys.hardware.devices
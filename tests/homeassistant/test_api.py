@@ -0,0 +1,28 @@
+"""Test Home Assistant API."""
+
+from supervisor.coresys import CoreSys
+
+
+async def test_check_api_state_cached(coresys: CoreSys):
+    """Test cached API state avoids probing Core on every call."""
+    get_api_state = coresys.homeassistant.api.get_api_state
+    get_api_state.reset_mock()
+
+    assert await coresys.homeassistant.api.check_api_state_cached() is True
+    assert await coresys.homeassistant.api.check_api_state_cached() is True
+    get_api_state.assert_called_once()
+
+    coresys.homeassistant.api.invalidate_api_state()
+    assert await coresys.homeassistant.api.check_api_state_cached() is True
+    assert get_api_state.call_count == 2
+
+
+async def test_check_api_state_cached_not_running(coresys: CoreSys):
+    """Test a not running state is never served from cache."""
+    get_api_state = coresys.homeassistant.api.get_api_state
+    get_api_state.reset_mock()
+    get_api_state.return_value = "NOT_RUNNING"
+
+    assert await coresys.homeassistant.api.check_api_state_cached() is False
+    assert await coresys.homeassistant.api.check_api_state_cached() is False
+    assert get_api_state.call_count == 2
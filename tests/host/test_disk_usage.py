@@ -0,0 +1,102 @@
+"""Test disk usage accounting."""
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from supervisor.coresys import CoreSys
+from supervisor.dbus.const import UnitActiveState
+from supervisor.host.disk_usage import DirectoryScanner, DiskUsageControl
+from supervisor.mounts.manager import MountManager
+
+# pylint: disable=protected-access
+
+
+def _du(path: Path) -> int:
+    """Return space used by a directory tree like du."""
+    total = path.lstat().st_blocks * 512
+    for entry in path.rglob("*"):
+        total += entry.lstat().st_blocks * 512
+    return total
+
+
+def test_scan_sizes(tmp_path: Path):
+    """Test space used by directory trees is summed up."""
+    first = tmp_path / "first"
+    (first / "sub").mkdir(parents=True)
+    (first / "file").write_bytes(os.urandom(10000))
+    (first / "sub" / "file").write_bytes(os.urandom(20000))
+    second = tmp_path / "second"
+    second.mkdir()
+
+    scanner = DirectoryScanner()
+    sizes = scanner.scan([first, second, tmp_path / "missing"])
+
+    assert sizes[first] == _du(first)
+    assert sizes[second] == _du(second)
+    assert sizes[tmp_path / "missing"] == 0
+
+
+def test_scan_cached_on_mtime(tmp_path: Path):
+    """Test unchanged directories are not listed again."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "file").write_bytes(os.urandom(10000))
+
+    scanner = DirectoryScanner()
+    size = scanner.scan([tmp_path])[tmp_path]
+
+    with patch("os.scandir") as scandir:
+        assert scanner.scan([tmp_path])[tmp_path] == size
+    scandir.assert_not_called()
+
+    # New file changes mtime of its directory
+    (tmp_path / "sub" / "new").write_bytes(os.urandom(20000))
+    assert scanner.scan([tmp_path])[tmp_path] == _du(tmp_path)
+
+    # Removed directories are dropped from cache
+    for file in (tmp_path / "sub").iterdir():
+        file.unlink()
+    (tmp_path / "sub").rmdir()
+    assert scanner.scan([tmp_path])[tmp_path] == _du(tmp_path)
+    assert list(scanner._cache) == [str(tmp_path)]
+
+
+def test_scan_large_file_grows_in_place(tmp_path: Path):
+    """Test large files are checked even if their directory did not change."""
+    (tmp_path / "small").write_bytes(os.urandom(10000))
+    (tmp_path / "large").write_bytes(os.urandom(1024 * 1024))
+
+    scanner = DirectoryScanner()
+    assert scanner.scan([tmp_path])[tmp_path] == _du(tmp_path)
+
+    with (tmp_path / "large").open("ab") as large:
+        large.write(os.urandom(1024 * 1024))
+    with patch("os.scandir") as scandir:
+        assert scanner.scan([tmp_path])[tmp_path] == _du(tmp_path)
+    scandir.assert_not_called()
+
+
+async def test_degraded_mount_not_scanned(
+    coresys: CoreSys, tmp_supervisor_data: Path, tmp_path: Path
+):
+    """Test backup mounts which don't respond are skipped."""
+    (tmp_path / "file").write_bytes(os.urandom(10000))
+    mount = MagicMock(state=UnitActiveState.ACTIVE, local_where=tmp_path)
+    mount.name = "backup_test"
+    control = DiskUsageControl(coresys)
+
+    with patch.object(
+        MountManager, "backup_mounts", new=PropertyMock(return_value=[mount])
+    ):
+        usage = await control.update()
+        assert usage.backups["backup_test"] == _du(tmp_path)
+
+        # Last known size is kept while the mount is degraded
+        with (
+            patch.object(coresys.mounts.monitor, "is_degraded", return_value=True),
+            patch.object(
+                DirectoryScanner, "scan", wraps=control._scanner.scan
+            ) as scan,
+        ):
+            usage = await control.update()
+        assert tmp_path not in scan.call_args.args[0]
+        assert usage.backups["backup_test"] == _du(tmp_path)
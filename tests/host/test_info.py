@@ -1,13 +1,84 @@
 """Test host info."""
+import asyncio
 from unittest.mock import patch
 
+from supervisor.coresys import CoreSys
 from supervisor.host.info import InfoCenter
 
 
-def test_host_free_space(coresys):
+async def test_host_free_space(coresys):
     """Test host free space."""
     info = InfoCenter(coresys)
+    assert info.free_space is None
+
     with patch("shutil.disk_usage", return_value=(42, 42, 2 * (1024.0**3))):
-        free = info.free_space
+        await info.load()
+
+    assert info.free_space == 2.0
+    assert len(info.disk_history) == 1
+
+
+async def test_disk_metrics_cached(coresys: CoreSys):
+    """Test disk usage is served from the latest sample."""
+    info = InfoCenter(coresys)
+    coresys.hardware.disk.get_disk_life_time = lambda _: None
+    coresys.hardware.disk.get_disk_free_space = lambda _: 5000
+    coresys.hardware.disk.get_disk_total_space = lambda _: 50000
+    coresys.hardware.disk.get_disk_used_space = lambda _: 45000
+
+    # Concurrent callers share one sample
+    first, second = await asyncio.gather(
+        info.update_disk_metrics(), info.update_disk_metrics()
+    )
+    assert first is second
+    assert not info.disk_history
+
+    coresys.hardware.disk.get_disk_free_space = lambda _: 4000
+    assert info.free_space == 5000
+    assert (await info.get_disk_metrics()).free_space == 5000
+    assert await info.get_free_space() == 4000
+    assert info.free_space == 5000
+
+    await info.update_disk_metrics()
+    assert info.free_space == 4000
+    assert not info.disk_history
+
+
+async def test_disk_metrics_history(coresys: CoreSys):
+    """Test only recorded samples are added to the history."""
+    info = InfoCenter(coresys)
+    coresys.hardware.disk.get_disk_life_time = lambda _: None
+    coresys.hardware.disk.get_disk_total_space = lambda _: 50000
+    coresys.hardware.disk.get_disk_used_space = lambda _: 45000
+
+    coresys.hardware.disk.get_disk_free_space = lambda _: 5000
+    await info.record_disk_metrics()
+    coresys.hardware.disk.get_disk_free_space = lambda _: 4500
+    await info.update_disk_metrics()
+    coresys.hardware.disk.get_disk_free_space = lambda _: 4000
+    await info.record_disk_metrics()
+
+    assert info.free_space == 4000
+    assert [metrics.free_space for metrics in info.disk_history] == [5000, 4000]
+
+
+async def test_disk_metrics_after_job(coresys: CoreSys):
+    """Test disk usage is sampled again when a write-heavy job ends."""
+    info = InfoCenter(coresys)
+    coresys.hardware.disk.get_disk_life_time = lambda _: None
+    coresys.hardware.disk.get_disk_total_space = lambda _: 50000
+    coresys.hardware.disk.get_disk_used_space = lambda _: 45000
+    coresys.hardware.disk.get_disk_free_space = lambda _: 5000
+    await info.update_disk_metrics()
+    assert info.free_space == 5000
+
+    coresys.hardware.disk.get_disk_free_space = lambda _: 4000
+    job = coresys.jobs.new_job("test_job")
+    await info.disk_job_started(job.uuid)
+    await info.disk_job_ended(job.uuid)
+    assert info.free_space == 5000
 
-    assert free == 2.0
+    job = coresys.jobs.new_job("backup_manager_full_backup")
+    await info.disk_job_started(job.uuid)
+    await info.disk_job_ended(job.uuid)
+    assert info.free_space == 4000
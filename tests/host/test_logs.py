@@ -1,5 +1,7 @@
 """Test host logs control."""
 
+from datetime import timedelta
+import re
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from aiohttp.client_exceptions import UnixClientConnectorError
@@ -9,7 +11,10 @@ import pytest
 from supervisor.coresys import CoreSys
 from supervisor.exceptions import HostNotSupportedError, HostServiceError
 from supervisor.host.const import LogFormatter
+from supervisor.host.log_query import LogAggregation, compile_pattern
 from supervisor.host.logs import LogsControl
+from supervisor.utils.dt import utcnow
+from supervisor.utils.json import json_dumps
 from supervisor.utils.systemd_journal import journal_logs_reader
 
 from tests.common import load_fixture
@@ -40,9 +45,13 @@ async def test_logs(coresys: CoreSys, journald_gateway: MagicMock):
     journald_gateway.feed_eof()
 
     async with coresys.host.logs.journald_logs() as resp:
-        line = await anext(
+        cursor, line = await anext(
             journal_logs_reader(resp, log_formatter=LogFormatter.VERBOSE)
         )
+        assert (
+            cursor
+            == "s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2ce;b=f5a5c442fa6548cf97474d2d57c920b3;m=3191a3c620;t=612ccd299e7af;x=8675b540119d10bb"
+        )
         assert (
             line
             == "2024-03-04 02:52:56.193 homeassistant systemd[1]: Started Hostname Service."
@@ -63,7 +72,7 @@ async def test_logs_coloured(coresys: CoreSys, journald_gateway: MagicMock):
     journald_gateway.feed_eof()
 
     async with coresys.host.logs.journald_logs() as resp:
-        line = await anext(journal_logs_reader(resp))
+        _, line = await anext(journal_logs_reader(resp))
         assert (
             line
             == "\x1b[32m24-03-04 23:56:56 INFO (MainThread) [__main__] Closing Supervisor\x1b[0m"
@@ -130,3 +139,93 @@ async def test_connection_refused_handled(
         with pytest.raises(HostServiceError):
             async with coresys.host.logs.journald_logs():
                 pass
+
+
+async def test_aggregate_logs(coresys: CoreSys, journald_gateway: MagicMock):
+    """Test aggregating JSON entries by identifier, priority and time bucket."""
+    now = utcnow()
+    since = now - timedelta(hours=1)
+
+    def entry(identifier, priority, message, age: timedelta) -> bytes:
+        return json_dumps(
+            {
+                "__REALTIME_TIMESTAMP": str(int((now - age).timestamp() * 1e6)),
+                "SYSLOG_IDENTIFIER": identifier,
+                "PRIORITY": priority,
+                "MESSAGE": message,
+            }
+        ).encode()
+
+    journald_gateway.feed_data(
+        b"\n".join(
+            [
+                entry("kernel", "3", "old error", timedelta(hours=2)),
+                entry("addon_local_ssh", "3", "error: failed", timedelta(minutes=50)),
+                entry("addon_local_ssh", "6", "started", timedelta(minutes=50)),
+                entry("hassio_dns", "3", "error: timeout", timedelta(minutes=5)),
+                # Binary message with a newline
+                entry("hassio_dns", "4", list(b"error:\nbinary"), timedelta(0)),
+            ]
+        )
+    )
+    journald_gateway.feed_eof()
+
+    aggregation = await coresys.host.logs.aggregate_logs(
+        LogAggregation(
+            since=since,
+            bucket_size=timedelta(minutes=30),
+            pattern=re.compile(r"^error:"),
+        ),
+        {},
+        100,
+    )
+
+    assert aggregation.scanned == 5
+    assert aggregation.matched == 3
+    assert aggregation.identifiers == {"hassio_dns": 2, "addon_local_ssh": 1}
+    assert aggregation.priorities == {"3": 2, "4": 1}
+    assert aggregation.buckets == {0: 1, 1: 1, 2: 1}
+    assert aggregation.covers_period(100)
+    assert not aggregation.timed_out
+
+
+def test_aggregation_covers_period():
+    """Test aggregation tells if entries of the whole period were processed."""
+    now = utcnow()
+    entry = json_dumps(
+        {"__REALTIME_TIMESTAMP": str(int(now.timestamp() * 1e6)), "MESSAGE": "a"}
+    ).encode()
+
+    # Lines cap reached before an entry older than the period
+    aggregation = LogAggregation(
+        since=now - timedelta(hours=1), bucket_size=timedelta(hours=1)
+    )
+    aggregation.process([entry, entry])
+    assert aggregation.scanned == 2
+    assert not aggregation.covers_period(2)
+    assert aggregation.covers_period(3)
+
+    # Matching stops once processing time is used up
+    with patch("supervisor.host.log_query.LOG_QUERY_MAX_PROCESS_TIME", timedelta(0)):
+        aggregation = LogAggregation(
+            since=now - timedelta(hours=1), bucket_size=timedelta(hours=1)
+        )
+        aggregation.process([entry, entry])
+    assert aggregation.timed_out
+    assert aggregation.scanned < 2
+    assert not aggregation.covers_period(3)
+
+
+@pytest.mark.parametrize(
+    "regex", ["(a+)+", "(a*)*b", r"(\w+\s?)*$", "(?:x(y+))*", "(?=(a+)+)"]
+)
+def test_compile_pattern_rejects_nested_repetition(regex: str):
+    """Test regexes which can backtrack for long are rejected."""
+    with pytest.raises(re.error):
+        compile_pattern(regex)
+
+
+@pytest.mark.parametrize("regex", ["^error:", "err.*", "(ab|cd){2,5}", "((a)?)+"])
+def test_compile_pattern(regex: str):
+    """Test regexes without nested repetitions are compiled."""
+    assert compile_pattern(regex).pattern == regex
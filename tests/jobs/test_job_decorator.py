@@ -988,6 +988,7 @@ async def test_internal_jobs_no_notify(coresys: CoreSys):
                     "done": True,
                     "parent_id": None,
                     "errors": [],
+                    "extra": None,
                 },
             },
         }
@@ -104,6 +104,7 @@ async def test_notify_on_change(coresys: CoreSys):
                     "done": None,
                     "parent_id": None,
                     "errors": [],
+                    "extra": None,
                 },
             },
         }
@@ -125,6 +126,7 @@ async def test_notify_on_change(coresys: CoreSys):
                     "done": None,
                     "parent_id": None,
                     "errors": [],
+                    "extra": None,
                 },
             },
         }
@@ -146,6 +148,7 @@ async def test_notify_on_change(coresys: CoreSys):
                     "done": None,
                     "parent_id": None,
                     "errors": [],
+                    "extra": None,
                 },
             },
         }
@@ -167,6 +170,7 @@ async def test_notify_on_change(coresys: CoreSys):
                         "done": False,
                         "parent_id": None,
                         "errors": [],
+                        "extra": None,
                     },
                 },
             }
@@ -193,6 +197,7 @@ async def test_notify_on_change(coresys: CoreSys):
                                 "message": "Unknown error, see supervisor logs",
                             }
                         ],
+                        "extra": None,
                     },
                 },
             }
@@ -218,6 +223,7 @@ async def test_notify_on_change(coresys: CoreSys):
                             "message": "Unknown error, see supervisor logs",
                         }
                     ],
+                    "extra": None,
                 },
             },
         }
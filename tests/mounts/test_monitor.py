@@ -0,0 +1,89 @@
+"""Test mount monitor."""
+
+import asyncio
+from pathlib import Path
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from supervisor.coresys import CoreSys
+from supervisor.dbus.const import UnitActiveState
+from supervisor.mounts.monitor import MOUNT_PROBE_FILE, MountMonitor
+
+
+def _mount(path: Path, read_only: bool = False) -> MagicMock:
+    """Return a mocked active mount at path."""
+    mount = MagicMock(
+        state=UnitActiveState.ACTIVE, local_where=path, read_only=read_only
+    )
+    mount.name = "backup_test"
+    return mount
+
+
+async def test_probe_healthy_mount(coresys: CoreSys, tmp_path: Path):
+    """Test probe of a responding mount records latency and throughput."""
+    monitor = MountMonitor(coresys)
+    mount = _mount(tmp_path)
+
+    probe = await monitor.probe(mount)
+    assert probe.error is None
+    assert probe.latency >= 0
+    assert probe.throughput > 0
+    assert not (tmp_path / MOUNT_PROBE_FILE).exists()
+    assert not monitor.is_degraded("backup_test")
+
+    # Nothing is written to read-only mounts
+    probe = await monitor.probe(_mount(tmp_path, read_only=True))
+    assert probe.throughput is None
+    assert len(monitor.get_history("backup_test")) == 2
+
+
+async def test_hung_mount_remounted(coresys: CoreSys, tmp_path: Path):
+    """Test probe of a hung mount times out and triggers a remount."""
+    monitor = MountMonitor(coresys)
+    mount = _mount(tmp_path)
+    release = threading.Event()
+
+    def _hang(path: Path, write: bool):
+        release.wait()
+        return 0.0, None
+
+    with (
+        patch("supervisor.mounts.monitor._probe_path", new=_hang),
+        patch("supervisor.mounts.monitor.MOUNT_PROBE_TIMEOUT") as timeout,
+        patch.object(
+            type(coresys.mounts), "reload_mount", new=AsyncMock()
+        ) as reload_mount,
+    ):
+        timeout.total_seconds.return_value = 0.01
+        probe = await monitor.probe(mount)
+        assert probe.error.startswith("No response")
+        assert monitor.is_degraded("backup_test")
+
+        # No second worker is started while the first one hangs
+        probe = await monitor.probe(mount)
+        assert probe.error == "Previous probe did not return"
+
+        # A remount does not start another worker while the old one hangs,
+        # neither do repeated checks or a new mount of the same name
+        with patch.object(threading, "Thread", wraps=threading.Thread) as thread:
+            for _ in range(3):
+                probe = await monitor.check(mount)
+                assert probe.error == "Probes of previous mounts did not return"
+            probe = await monitor.probe(_mount(tmp_path))
+            assert probe.error == "Probes of previous mounts did not return"
+        assert reload_mount.call_count == 3
+        thread.assert_not_called()
+        assert monitor.is_degraded("backup_test")
+
+        # Removing the mount drops its probe results
+        monitor.remove("backup_test")
+        assert not monitor.get_history("backup_test")
+        assert not monitor.is_degraded("backup_test")
+
+    # Workers return once the server responds again
+    release.set()
+    await asyncio.sleep(0.1)
+    probe = await monitor.probe(mount)
+    assert probe.error is None
+    assert not monitor.is_degraded("backup_test")
+    assert len(monitor.get_history("backup_test")) == 1
@@ -0,0 +1,147 @@
+"""Test OS update bundle download."""
+
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from aiohttp import web
+import pytest
+
+from supervisor.coresys import CoreSys
+from supervisor.exceptions import HassOSUpdateError
+from supervisor.os.download import DOWNLOAD_CHUNK_SIZE, BundleDownload
+
+BUNDLE = os.urandom(3 * DOWNLOAD_CHUNK_SIZE + 100)
+
+
+@pytest.fixture(name="no_retry_delay", autouse=True)
+def fixture_no_retry_delay():
+    """Retry downloads without waiting."""
+    with patch("supervisor.os.download.DOWNLOAD_RETRY_DELAY") as delay:
+        delay.total_seconds.return_value = 0
+        yield
+
+
+async def _serve(aiohttp_server, handler) -> str:
+    """Serve handler and return its URL."""
+    app = web.Application()
+    app.router.add_get("/bundle.raucb", handler)
+    server = await aiohttp_server(app)
+    return str(server.make_url("/bundle.raucb"))
+
+
+def _range_response(request: web.Request) -> web.Response:
+    """Return requested range of bundle."""
+    start = int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+    return web.Response(
+        status=206,
+        body=BUNDLE[start:],
+        headers={"Content-Range": f"bytes {start}-{len(BUNDLE) - 1}/{len(BUNDLE)}"},
+    )
+
+
+async def test_download_resume_after_disconnect(
+    coresys: CoreSys, aiohttp_server, tmp_path: Path
+):
+    """Test download continues where the connection dropped."""
+    ranges: list[str | None] = []
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        ranges.append(request.headers.get("Range"))
+        if len(ranges) > 1:
+            return _range_response(request)
+
+        response = web.StreamResponse(headers={"Content-Length": str(len(BUNDLE))})
+        await response.prepare(request)
+        await response.write(BUNDLE[: DOWNLOAD_CHUNK_SIZE + 10])
+        request.transport.close()
+        return response
+
+    url = await _serve(aiohttp_server, handler)
+    job = coresys.jobs.new_job("test_download")
+    download = BundleDownload(coresys, url, tmp_path / "bundle.raucb", job)
+    await download.run()
+
+    assert ranges == [None, f"bytes={DOWNLOAD_CHUNK_SIZE + 10}-"]
+    assert (tmp_path / "bundle.raucb").read_bytes() == BUNDLE
+    assert not download.partial.exists()
+    assert download.sha256 == hashlib.sha256(BUNDLE).hexdigest()
+    assert job.progress == 100
+    assert job.extra["downloaded"] == job.extra["total"] == len(BUNDLE)
+
+
+async def test_download_resume_partial_file(
+    coresys: CoreSys, aiohttp_server, tmp_path: Path
+):
+    """Test download continues from partial file of a previous attempt."""
+    ranges: list[str | None] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        ranges.append(request.headers.get("Range"))
+        return _range_response(request)
+
+    url = await _serve(aiohttp_server, handler)
+    download = BundleDownload(coresys, url, tmp_path / "bundle.raucb")
+    download.partial.write_bytes(BUNDLE[:1000])
+    await download.run()
+
+    assert ranges == ["bytes=1000-"]
+    assert (tmp_path / "bundle.raucb").read_bytes() == BUNDLE
+    assert download.sha256 == hashlib.sha256(BUNDLE).hexdigest()
+
+
+async def test_download_range_not_supported(
+    coresys: CoreSys, aiohttp_server, tmp_path: Path
+):
+    """Test download starts over if server ignores range."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=BUNDLE)
+
+    url = await _serve(aiohttp_server, handler)
+    download = BundleDownload(coresys, url, tmp_path / "bundle.raucb")
+    download.partial.write_bytes(b"outdated")
+    await download.run()
+
+    assert (tmp_path / "bundle.raucb").read_bytes() == BUNDLE
+
+
+async def test_download_invalid_range(coresys: CoreSys, aiohttp_server, tmp_path: Path):
+    """Test download fails if server never sends the start of the file."""
+    requests = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+        return web.Response(
+            status=206,
+            body=BUNDLE[100:],
+            headers={"Content-Range": f"bytes 100-{len(BUNDLE) - 1}/{len(BUNDLE)}"},
+        )
+
+    url = await _serve(aiohttp_server, handler)
+    download = BundleDownload(coresys, url, tmp_path / "bundle.raucb")
+    download.partial.write_bytes(b"outdated")
+    with pytest.raises(HassOSUpdateError, match="invalid range"):
+        await download.run()
+
+    assert requests == 2
+    assert coresys.supervisor.connectivity
+
+
+async def test_download_error(coresys: CoreSys, aiohttp_server, tmp_path: Path):
+    """Test error status fails download without retrying."""
+    requests = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+        return web.Response(status=404)
+
+    url = await _serve(aiohttp_server, handler)
+    with pytest.raises(HassOSUpdateError):
+        await BundleDownload(coresys, url, tmp_path / "bundle.raucb").run()
+
+    assert requests == 1
+    assert not (tmp_path / "bundle.raucb").exists()
@@ -1,5 +1,6 @@
 """Test plugin manager."""
 
+import asyncio
 from unittest.mock import PropertyMock, patch
 
 from awesomeversion import AwesomeVersion
@@ -42,6 +43,8 @@ async def test_load(coresys: CoreSys):
 
     need_update = PropertyMock(return_value=True)
     with patch.object(DockerInterface, "attach") as attach, patch.object(
+        DockerInterface, "install"
+    ) as install, patch.object(DockerInterface, "pull") as pull, patch.object(
         DockerInterface, "update"
     ) as update, patch.object(Supervisor, "need_update", new=need_update), patch.object(
         PluginBase, "need_update", new=PropertyMock(return_value=True)
@@ -53,10 +56,49 @@ async def test_load(coresys: CoreSys):
         await coresys.plugins.load()
 
         assert attach.call_count == 5
+        install.assert_not_called()
+        pull.assert_not_called()
         update.assert_not_called()
 
         need_update.return_value = False
         await coresys.plugins.load()
 
         assert attach.call_count == 10
+        install.assert_not_called()
+        assert pull.call_count == 5
         assert update.call_count == 5
+
+
+async def test_update_pulls_before_swapping(coresys: CoreSys):
+    """Test plugin images are pulled concurrently before any container is swapped."""
+    coresys.hardware.disk.get_disk_free_space = lambda x: 5000
+    await coresys.updater.load()
+
+    calls: list[str] = []
+    pulling = 0
+    all_pulling = asyncio.Event()
+
+    async def mock_pull(*args, **kwargs):
+        nonlocal pulling
+        pulling += 1
+        if pulling == 5:
+            all_pulling.set()
+        # Pulls run one after another would never all be in progress at once
+        await asyncio.wait_for(all_pulling.wait(), 1)
+        calls.append("pull")
+
+    async def mock_update(*args, **kwargs):
+        calls.append("update")
+
+    with patch.object(DockerInterface, "pull", new=mock_pull), patch.object(
+        DockerInterface, "update", new=mock_update
+    ), patch.object(
+        PluginBase, "need_update", new=PropertyMock(return_value=True)
+    ), patch.object(
+        PluginBase,
+        "version",
+        new=PropertyMock(return_value=AwesomeVersion("1970-01-01")),
+    ):
+        await coresys.plugins.update()
+
+    assert calls == ["pull"] * 5 + ["update"] * 5
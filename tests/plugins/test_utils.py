@@ -0,0 +1,16 @@
+"""Test plugin utils."""
+
+from pathlib import Path
+
+from supervisor.plugins.utils import load_template
+
+
+def test_load_template(tmp_path: Path):
+    """Test reading and compiling a template."""
+    (template_file := tmp_path / "hosts.tmpl").write_text(
+        "{% for entry in entries %}{{ entry }}\n{% endfor %}", encoding="utf-8"
+    )
+
+    template = load_template(template_file)
+
+    assert template.render(entries=["a", "b"]) == "a\nb\n"
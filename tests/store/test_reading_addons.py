@@ -3,9 +3,15 @@ import errno
 from pathlib import Path
 from unittest.mock import patch
 
+from awesomeversion import AwesomeVersion
+import git
+
+from supervisor.const import REPOSITORY_LOCAL
 from supervisor.coresys import CoreSys
 from supervisor.resolution.const import ContextType, IssueType, SuggestionType
 from supervisor.resolution.data import Issue, Suggestion
+from supervisor.store.data import StoreData
+from supervisor.utils.common import read_json_or_yaml_file, write_json_or_yaml_file
 
 # pylint: disable=protected-access
 
@@ -48,3 +54,116 @@ async def test_reading_addon_files_error(coresys: CoreSys):
         assert corrupt_repo in coresys.resolution.issues
         assert reset_repo not in coresys.resolution.suggestions
         assert coresys.core.healthy is False
+
+
+async def test_read_addons_folder_git_index(coresys: CoreSys, tmp_path: Path):
+    """Test unchanged add-ons in a git repository are not parsed again."""
+    repo = git.Repo.init(tmp_path)
+    for slug in ("one", "two"):
+        (tmp_path / slug).mkdir()
+        write_json_or_yaml_file(
+            tmp_path / slug / "config.yaml",
+            {
+                "name": slug,
+                "slug": slug,
+                "version": "1.0.0",
+                "description": slug,
+                "arch": ["amd64"],
+            },
+        )
+    repo.index.add(["one/config.yaml", "two/config.yaml"])
+    actor = git.Actor("test", "test@test")
+    repo.index.commit("init", author=actor, committer=actor)
+
+    addons = await coresys.store.data._read_addons_folder(tmp_path, "test")
+    assert set(addons) == {"test_one", "test_two"}
+
+    # Change only one add-on, the other is served from the index
+    write_json_or_yaml_file(
+        tmp_path / "two" / "config.yaml",
+        {
+            "name": "two",
+            "slug": "two",
+            "version": "2.0.0",
+            "description": "two",
+            "arch": ["amd64"],
+        },
+    )
+    repo.index.add(["two/config.yaml"])
+    repo.index.commit("update", author=actor, committer=actor)
+
+    with patch(
+        "supervisor.store.data.read_json_or_yaml_file",
+        wraps=read_json_or_yaml_file,
+    ) as read_config:
+        addons = await coresys.store.data._read_addons_folder(tmp_path, "test")
+
+    read_config.assert_called_once_with(tmp_path / "two" / "config.yaml")
+    assert addons["test_one"]["version"] == "1.0.0"
+    assert addons["test_two"]["version"] == "2.0.0"
+
+    # Returned configs are copies of the index
+    addons["test_one"]["version"] = "9.9.9"
+    addons = await coresys.store.data._read_addons_folder(tmp_path, "test")
+    assert addons["test_one"]["version"] == "1.0.0"
+
+
+async def test_git_index_persisted(coresys: CoreSys, tmp_path: Path):
+    """Test add-on index is reused after a restart until HEAD changes."""
+    repo_path = tmp_path / "repo"
+    repo = git.Repo.init(repo_path)
+    (repo_path / "one").mkdir()
+    write_json_or_yaml_file(
+        repo_path / "one" / "config.yaml",
+        {
+            "name": "one",
+            "slug": "one",
+            "version": "1.0.0",
+            "description": "one",
+            "arch": ["amd64"],
+        },
+    )
+    repo.index.add(["one/config.yaml"])
+    actor = git.Actor("test", "test@test")
+    repo.index.commit("init", author=actor, committer=actor)
+
+    with patch("supervisor.store.data.FILE_HASSIO_STORE_INDEX", tmp_path / "index"):
+        data = StoreData(coresys)
+        await data.load_index()
+        await data._read_addons_folder(repo_path, "test")
+        await data.save_index()
+
+        # Index of previous start is used, files are not read again
+        data = StoreData(coresys)
+        await data.load_index()
+        with patch(
+            "supervisor.store.data.read_json_or_yaml_file",
+            wraps=read_json_or_yaml_file,
+        ) as read_config:
+            addons = await data._read_addons_folder(repo_path, "test")
+        read_config.assert_not_called()
+        assert addons["test_one"]["version"] == AwesomeVersion("1.0.0")
+        assert isinstance(addons["test_one"]["version"], AwesomeVersion)
+
+        # Index of another Supervisor version is ignored
+        data = StoreData(coresys)
+        with patch("supervisor.store.data.SUPERVISOR_VERSION", "1.0.0"):
+            await data.load_index()
+        with patch(
+            "supervisor.store.data.read_json_or_yaml_file",
+            wraps=read_json_or_yaml_file,
+        ) as read_config:
+            await data._read_addons_folder(repo_path, "test")
+        read_config.assert_called_once_with(repo_path / "one" / "config.yaml")
+
+        # Local repository is edited in place, HEAD does not describe it
+        data = StoreData(coresys)
+        await data.load_index()
+        await data._read_addons_folder(repo_path, REPOSITORY_LOCAL)
+        assert not data._index_changed
+        with patch(
+            "supervisor.store.data.read_json_or_yaml_file",
+            wraps=read_json_or_yaml_file,
+        ) as read_config:
+            await data._read_addons_folder(repo_path, REPOSITORY_LOCAL)
+        read_config.assert_called_once_with(repo_path / "one" / "config.yaml")
@@ -2,13 +2,26 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
-
-from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from git import (
+    Actor,
+    Git,
+    GitCommandError,
+    InvalidGitRepositoryError,
+    NoSuchPathError,
+    Remote,
+    Repo,
+)
 import pytest
 
 from supervisor.coresys import CoreSys
-from supervisor.exceptions import StoreGitCloneError, StoreGitError
+from supervisor.exceptions import (
+    StoreGitCloneError,
+    StoreGitError,
+    StoreGitTimeoutError,
+)
 from supervisor.store.git import GitRepo
 
 REPO_URL = "https://github.com/awesome-developer/awesome-repo"
@@ -97,3 +110,94 @@ async def test_git_load_error(coresys: CoreSys, tmp_path: Path, git_errors: Exce
         await repo.load()
 
     assert len(coresys.resolution.suggestions) == 0
+
+
+async def test_git_pull_skips_unchanged(coresys: CoreSys, tmp_path: Path):
+    """Test pull only downloads and resets when remote head changed."""
+    actor = Actor("test", "test@test")
+    remote = Repo.init(tmp_path / "remote", initial_branch="main")
+    (tmp_path / "remote" / "a").write_text("a")
+    remote.index.add(["a"])
+    remote.index.commit("a", author=actor, committer=actor)
+    Repo.clone_from(f"file://{tmp_path / 'remote'}", tmp_path / "clone", depth=1)
+
+    repo = GitRepo(coresys, tmp_path / "clone", REPO_URL)
+    repo.repo = Repo(tmp_path / "clone")
+
+    with patch.object(Remote, "fetch") as fetch:
+        assert await repo.pull.__wrapped__(repo) is False
+        fetch.assert_not_called()
+
+    assert repo.last_pull is not None
+    assert repo.last_pull_duration is not None
+
+    (tmp_path / "remote" / "b").write_text("b")
+    remote.index.add(["b"])
+    remote.index.commit("b", author=actor, committer=actor)
+
+    assert await repo.pull.__wrapped__(repo) is True
+    assert (tmp_path / "clone" / "b").exists()
+    assert await repo.pull.__wrapped__(repo) is False
+
+
+async def test_git_pull_finishes_interrupted(coresys: CoreSys, tmp_path: Path):
+    """Test pull finishes an interrupted one although remote head is unchanged."""
+    actor = Actor("test", "test@test")
+    remote = Repo.init(tmp_path / "remote", initial_branch="main")
+    (tmp_path / "remote" / "a").write_text("a")
+    remote.index.add(["a"])
+    remote.index.commit("a", author=actor, committer=actor)
+    Repo.clone_from(f"file://{tmp_path / 'remote'}", tmp_path / "clone", depth=1)
+
+    repo = GitRepo(coresys, tmp_path / "clone", REPO_URL)
+    repo.repo = Repo(tmp_path / "clone")
+
+    (tmp_path / "remote" / "b").write_text("b")
+    remote.index.add(["b"])
+    remote.index.commit("b", author=actor, committer=actor)
+
+    # Submodule update killed after reset moved HEAD to remote head
+    with (
+        patch.object(Git, "submodule", create=True, side_effect=StoreGitTimeoutError),
+        pytest.raises(StoreGitTimeoutError),
+    ):
+        await repo.pull.__wrapped__(repo)
+    assert (tmp_path / "clone" / "b").exists()
+    (tmp_path / "clone" / "leftover").write_text("leftover")
+
+    assert await repo.pull.__wrapped__(repo) is True
+    assert not (tmp_path / "clone" / "leftover").exists()
+    assert await repo.pull.__wrapped__(repo) is False
+
+
+async def test_git_pull_timeout_only_when_killed(coresys: CoreSys, tmp_path: Path):
+    """Test git errors past the deadline are only a timeout if the kill fired."""
+    repo = GitRepo(coresys, tmp_path, REPO_URL)
+    repo.repo = MagicMock()
+    error = GitCommandError("ls-remote", 128)
+
+    # Deadline passed, but git failed on its own right away
+    repo.repo.git.ls_remote.side_effect = error
+    with (
+        patch("supervisor.store.git.GIT_PULL_TIMEOUT", 0),
+        pytest.raises(StoreGitError) as err,
+    ):
+        await repo.pull.__wrapped__(repo)
+    assert not isinstance(err.value, StoreGitTimeoutError)
+    assert len(coresys.resolution.issues) == 1
+    assert repo.repo.git.ls_remote.call_args.kwargs["kill_after_timeout"] == 1.0
+
+    # Git ran for its whole timeout and got killed
+    coresys.resolution.dismiss_issue(coresys.resolution.issues[0])
+
+    def _killed(*args, kill_after_timeout: float, **kwargs):
+        time.sleep(kill_after_timeout)
+        raise error
+
+    repo.repo.git.ls_remote.side_effect = _killed
+    with (
+        patch("supervisor.store.git.GIT_PULL_TIMEOUT", 0),
+        pytest.raises(StoreGitTimeoutError),
+    ):
+        await repo.pull.__wrapped__(repo)
+    assert not coresys.resolution.issues
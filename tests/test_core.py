@@ -1,5 +1,6 @@
 """Testing handling with CoreState."""
 # pylint: disable=W0212
+import asyncio
 import datetime
 import errno
 from unittest.mock import AsyncMock, PropertyMock, patch
@@ -7,10 +8,12 @@ from unittest.mock import AsyncMock, PropertyMock, patch
 from pytest import LogCaptureFixture
 
 from supervisor.const import CoreState
+from supervisor.core import SetupPhase
 from supervisor.coresys import CoreSys
-from supervisor.exceptions import WhoamiSSLError
+from supervisor.exceptions import HassioError, WhoamiSSLError
 from supervisor.host.control import SystemControl
 from supervisor.host.info import InfoCenter
+from supervisor.resolution.const import UnhealthyReason
 from supervisor.supervisor import Supervisor
 from supervisor.utils.whoami import WhoamiData
 
@@ -90,3 +93,38 @@ def test_write_state_failure(run_dir, coresys: CoreSys, caplog: LogCaptureFixtur
 
         assert "Can't update the Supervisor state" in caplog.text
         assert coresys.core.healthy is True
+
+
+async def test_setup_phases(coresys: CoreSys):
+    """Test setup phases run concurrently unless they depend on each other."""
+    order: list[str] = []
+    other_started = asyncio.Event()
+
+    async def _first():
+        # Would never return if phases ran one after another
+        await other_started.wait()
+        order.append("first")
+
+    async def _other():
+        other_started.set()
+        order.append("other")
+
+    async def _dependent():
+        order.append("dependent")
+
+    async def _failing():
+        raise HassioError("Phase failed")
+
+    async with asyncio.timeout(5):
+        await coresys.core._run_setup_phases(
+            [
+                SetupPhase("first", _first),
+                SetupPhase("other", _other),
+                SetupPhase("failing", _failing),
+                SetupPhase("dependent", _dependent, ("first", "failing")),
+            ]
+        )
+
+    assert order == ["other", "first", "dependent"]
+    assert coresys.core.setup_times.keys() == {"first", "other", "failing", "dependent"}
+    assert UnhealthyReason.SETUP in coresys.resolution.unhealthy
@@ -1,10 +1,12 @@
 """Test dbus utility."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
-from dbus_fast import ErrorType
+from dbus_fast import ErrorType, Message, MessageType, Variant
 from dbus_fast.aio.message_bus import MessageBus
 from dbus_fast.errors import DBusError as DBusFastDBusError
+from dbus_fast.introspection import Interface, Node
 from dbus_fast.service import method, signal
 import pytest
 
@@ -14,7 +16,12 @@ from supervisor.exceptions import (
     DBusInterfaceError,
     DBusServiceUnkownError,
 )
-from supervisor.utils.dbus import DBus
+from supervisor.utils.dbus import (
+    INTROSPECTION_CACHE,
+    DBus,
+    IntrospectionCache,
+    managed_objects,
+)
 
 from tests.common import load_fixture
 from tests.dbus_service_mocks.base import DBusServiceMock
@@ -187,3 +194,132 @@ def test_from_dbus_error():
     )
 
     assert type(DBus.from_dbus_error(dbus_fast_error)) is DBusServiceUnkownError
+
+
+async def test_managed_objects_snapshot(
+    test_service: TestInterface, dbus_session_bus: MessageBus
+):
+    """Test introspection and properties are taken from managed objects snapshot."""
+    reply = Message.new_method_return(
+        Message(
+            destination="service.test.TestInterface",
+            path="/",
+            member="Test",
+            serial=1,
+        ),
+        "a{oa{sa{sv}}}",
+        [
+            {
+                DBUS_OBJECT_BASE: {
+                    "service.test.TestInterface": {"Name": Variant("s", "test")}
+                }
+            }
+        ],
+    )
+    assert reply.message_type == MessageType.METHOD_RETURN
+    introspection = Node.parse(
+        """<node><interface name="service.test.TestInterface">
+        <property name="Name" type="s" access="read"/>
+        </interface></node>"""
+    )
+
+    with patch.object(
+        MessageBus, "introspect", return_value=introspection
+    ) as introspect:
+        with patch.object(dbus_session_bus, "call", return_value=reply):
+            async with managed_objects(
+                dbus_session_bus, "service.test.TestInterface", "/", "1.0"
+            ) as snapshot:
+                assert snapshot
+                first = await DBus.connect(
+                    dbus_session_bus, "service.test.TestInterface", DBUS_OBJECT_BASE
+                )
+                second = await DBus.connect(
+                    dbus_session_bus, "service.test.TestInterface", DBUS_OBJECT_BASE
+                )
+                assert await first.get_properties("service.test.TestInterface") == {
+                    "Name": "test"
+                }
+
+        assert introspect.call_count == 1
+        assert first.proxies.keys() == second.proxies.keys()
+
+        # Outside of the context objects are introspected individually
+        await DBus.connect(
+            dbus_session_bus, "service.test.TestInterface", DBUS_OBJECT_BASE
+        )
+        assert introspect.call_count == 2
+
+
+def test_introspection_cache_persistence(tmp_path: Path):
+    """Test introspection cache is stored and loaded from disk."""
+    cache_file = tmp_path / "dbus_introspection.json"
+    key = ("service.test", frozenset({"service.test.TestInterface"}), "1.0")
+    unused = ("service.test", frozenset({"service.test.Other"}), "0.9")
+
+    cache = IntrospectionCache()
+    cache.set(key, Node(interfaces=[Interface("service.test.TestInterface")]))
+    cache.save(cache_file)
+
+    cache = IntrospectionCache()
+    cache.load(cache_file)
+    assert [intr.name for intr in cache.get(key).interfaces] == [
+        "service.test.TestInterface"
+    ]
+
+    # Entries not used since start are dropped on save
+    cache.set(unused, Node(interfaces=[Interface("service.test.Other")]))
+    cache.remove(unused)
+    cache.save(cache_file)
+    cache = IntrospectionCache()
+    cache.load(cache_file)
+    assert cache.get(key)
+    assert not cache.get(unused)
+
+    # Broken file is ignored
+    cache_file.write_text("not json")
+    cache = IntrospectionCache()
+    cache.load(cache_file)
+    assert not cache.get(key)
+
+
+async def test_outdated_cached_introspection(
+    test_service: TestInterface, dbus_session_bus: MessageBus
+):
+    """Test cached introspection missing properties of object is not used."""
+    reply = Message.new_method_return(
+        Message(destination="service.test.TestInterface", path="/", member="Test"),
+        "a{oa{sa{sv}}}",
+        [
+            {
+                DBUS_OBJECT_BASE: {
+                    "service.test.TestInterface": {"Name": Variant("s", "test")}
+                }
+            }
+        ],
+    )
+    key = (
+        "service.test.TestInterface",
+        frozenset({"service.test.TestInterface"}),
+        "2.0",
+    )
+    INTROSPECTION_CACHE.set(
+        key, Node(interfaces=[Interface("service.test.TestInterface")])
+    )
+
+    with (
+        patch.object(
+            MessageBus, "introspect", wraps=dbus_session_bus.introspect
+        ) as introspect,
+        patch.object(dbus_session_bus, "call", return_value=reply),
+    ):
+        async with managed_objects(
+            dbus_session_bus, "service.test.TestInterface", "/", "2.0"
+        ):
+            test_obj = await DBus.connect(
+                dbus_session_bus, "service.test.TestInterface", DBUS_OBJECT_BASE
+            )
+
+    introspect.assert_called_once()
+    assert INTROSPECTION_CACHE.get(key) is not None
+    assert hasattr(test_obj.proxies["service.test.TestInterface"], "call_test")
@@ -88,7 +88,7 @@ async def test_parsing_simple():
     """Test plain formatter."""
     journal_logs, stream = _journal_logs_mock()
     stream.feed_data(b"MESSAGE=Hello, world!\n\n")
-    line = await anext(journal_logs_reader(journal_logs))
+    _, line = await anext(journal_logs_reader(journal_logs))
     assert line == "Hello, world!"
 
 
@@ -102,7 +102,7 @@ async def test_parsing_verbose():
         b"_PID=666\n"
         b"MESSAGE=Hello, world!\n\n"
     )
-    line = await anext(
+    _, line = await anext(
         journal_logs_reader(journal_logs, log_formatter=LogFormatter.VERBOSE)
     )
     assert line == "2013-09-17 07:32:51.000 homeassistant python[666]: Hello, world!"
@@ -117,7 +117,7 @@ async def test_parsing_newlines_in_message():
         b"AFTER=after\n\n"
     )
 
-    line = await anext(journal_logs_reader(journal_logs))
+    _, line = await anext(journal_logs_reader(journal_logs))
     assert line == "Hello,\nworld!"
 
 
@@ -134,8 +134,9 @@ async def test_parsing_newlines_in_multiple_fields():
         b"AFTER=after\n\n"
     )
 
-    assert await anext(journal_logs_reader(journal_logs)) == "Hello,\nworld!\n"
-    assert await anext(journal_logs_reader(journal_logs)) == "Hello,\nworld!"
+    reader = journal_logs_reader(journal_logs)
+    assert (await anext(reader))[1] == "Hello,\nworld!\n"
+    assert (await anext(reader))[1] == "Hello,\nworld!"
 
 
 async def test_parsing_two_messages():
@@ -150,8 +151,8 @@ async def test_parsing_two_messages():
     stream.feed_eof()
 
     reader = journal_logs_reader(journal_logs)
-    assert await anext(reader) == "Hello, world!"
-    assert await anext(reader) == "Hello again, world!"
+    assert (await anext(reader))[1] == "Hello, world!"
+    assert (await anext(reader))[1] == "Hello again, world!"
     with pytest.raises(StopAsyncIteration):
         await anext(reader)
 
@@ -173,7 +174,7 @@ async def test_parsing_journal_host_logs():
     """Test parsing of real host logs."""
     journal_logs, stream = _journal_logs_mock()
     stream.feed_data(load_fixture("logs_export_host.txt").encode("utf-8"))
-    line = await anext(journal_logs_reader(journal_logs))
+    _, line = await anext(journal_logs_reader(journal_logs))
     assert line == "Started Hostname Service."
 
 
@@ -181,8 +182,57 @@ async def test_parsing_colored_supervisor_logs():
     """Test parsing of real logs with ANSI escape sequences."""
     journal_logs, stream = _journal_logs_mock()
     stream.feed_data(load_fixture("logs_export_supervisor.txt").encode("utf-8"))
-    line = await anext(journal_logs_reader(journal_logs))
+    _, line = await anext(journal_logs_reader(journal_logs))
     assert (
         line
         == "\x1b[32m24-03-04 23:56:56 INFO (MainThread) [__main__] Closing Supervisor\x1b[0m"
     )
+
+
+async def test_parsing_cursor():
+    """Test cursor of the entry is returned with the line."""
+    journal_logs, stream = _journal_logs_mock()
+    stream.feed_data(
+        b"__CURSOR=s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2ce\n"
+        b"MESSAGE=Hello, world!\n\n"
+        b"_PID=1\n\n"
+        b"__CURSOR=s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2cf\n"
+        b"MESSAGE=Hello again, world!\n\n"
+    )
+    stream.feed_eof()
+
+    reader = journal_logs_reader(journal_logs)
+    assert await anext(reader) == (
+        "s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2ce",
+        "Hello, world!",
+    )
+    # Entries without needed fields are skipped
+    assert await anext(reader) == (
+        "s=83fee99ca0c3466db5fc120d52ca7dd8;i=203f2cf",
+        "Hello again, world!",
+    )
+    with pytest.raises(StopAsyncIteration):
+        await anext(reader)
+
+
+async def test_parsing_split_blocks():
+    """Test fields split across reads of the stream are parsed."""
+    journal_logs, stream = _journal_logs_mock()
+    data = (
+        b"ID=1\n"
+        b"MESSAGE\n\x0d\x00\x00\x00\x00\x00\x00\x00Hello,\nworld!\n"
+        b"AFTER=after\n\n"
+        b"MESSAGE=Hello again, world!\n"
+    )
+
+    async def feed():
+        for pos in range(len(data)):
+            stream.feed_data(data[pos : pos + 1])
+            await asyncio.sleep(0)
+        stream.feed_eof()
+
+    feeder = asyncio.create_task(feed())
+    lines = [line async for _, line in journal_logs_reader(journal_logs)]
+    await feeder
+
+    assert lines == ["Hello,\nworld!", "Hello again, world!"]